@@ -0,0 +1,1082 @@
+"""
+Performance Benchmarks - Week 2
+CSC 242 - Advanced Class Concepts
+
+This file measures the performance-oriented variants of the week 2 classes:
+- Sharded queue scaling across producer/consumer threads
+- Slotted Vector memory and sorting throughput
+- KD-tree queries against brute-force scans
+- Fraction arithmetic against the original class and fractions.Fraction
+- Fraction.sum kernel against naive sum() on random and adversarial denominators
+- Fraction interning cache time, memory and hit rate
+- Typed (array.array) SmartList against object storage
+- Lazy SmartList queries against eager filter_type/sum chains
+- SmartList per-type index: filter_type speedup and mutation overhead
+- SmartList rope concatenation against copying concatenation
+- Bareiss ExactMatrix solves against naive Fraction elimination
+- Lazy expression graphs against eager Vector and Fraction chains
+- Type-pair dispatch tables against isinstance chains for mixed operands
+- Packed NDVector against list-of-floats vectors on 768-d embeddings
+- SparseVector against dense NDVector at low density
+- Process-pool Vector and Fraction sums scaling from 1 to N workers
+- Geometry kernels against O(n^2) and gift-wrapping Vector baselines
+- In-place MutableVector updates and object pools in a 10^6-step loop
+- Animal construction through event sinks and bulk_create against print()
+
+Each benchmark prints a small table and can be run on its own with larger
+sizes, e.g. benchmark_sharded_queue(operations=1_000_000).
+
+Author: CSC 242 Teaching Team
+"""
+
+import contextlib
+import fractions
+import math
+import operator
+import os
+import random
+import tempfile
+import threading
+import time
+import tracemalloc
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from container_classes import ShardedQueue
+from exact_matrix import ExactMatrix
+from geometry import closest_pair, convex_hull, point_in_polygon, points_in_polygon
+from inheritance_examples import (Animal, BatchedFileSink, Bird, Cat, Dog, ListSink,
+                                  NullSink)
+from lazy_expr import Var, lazy
+from nd_vector import NDVector, SparseVector, cosine_similarities
+from operator_overloading import (Fraction, FractionPool, MutableVector, SmartList, Vector,
+                                  VectorArray, VectorPool)
+from parallel_reduce import pack_vectors, parallel_fraction_sum, parallel_vector_sum
+from spatial_index import KDTree
+
+
+def _timed(function):
+    """Run function once and return the elapsed wall-clock seconds"""
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+# ============================================================================
+# CONTAINER BENCHMARKS
+# ============================================================================
+
+class _LockedQueue:
+    """Baseline: one deque behind one lock (same storage as a ShardedQueue shard)"""
+
+    def __init__(self):
+        self._queue = deque()
+        self._lock = threading.Lock()
+
+    def enqueue(self, item):
+        with self._lock:
+            self._queue.append(item)
+
+    def dequeue(self):
+        with self._lock:
+            if not self._queue:
+                raise IndexError("Cannot dequeue from empty queue")
+            return self._queue.popleft()
+
+
+def _run_queue_workers(queue, threads, operations):
+    """Each thread enqueues then dequeues its share of the operations"""
+    per_thread = operations // threads
+
+    def worker():
+        for i in range(per_thread):
+            queue.enqueue(i)
+            while True:
+                # A sharded sweep can miss an item that is still in flight
+                try:
+                    queue.dequeue()
+                    break
+                except IndexError:
+                    pass
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+
+    def run():
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+    return _timed(run)
+
+
+def benchmark_sharded_queue(operations=64_000, thread_counts=(1, 2, 4, 8, 16, 32),
+                            shards=16):
+    """Compare a single locked deque against ShardedQueue from 1 to 32 threads
+
+    With the GIL only one thread runs Python code at a time, so the extra
+    shard bookkeeping shows up as a constant overhead. The striped locks pay
+    off on free-threaded builds, where producers really run in parallel.
+    """
+    print("=== SHARDED QUEUE SCALING ===")
+    print(f"{operations} enqueue/dequeue pairs, {shards} shards")
+    print(f"{'threads':>8} {'locked ops/s':>14} {'sharded ops/s':>14} {'speedup':>8}")
+
+    for threads in thread_counts:
+        locked = _run_queue_workers(_LockedQueue(), threads, operations)
+        sharded = _run_queue_workers(ShardedQueue(shards), threads, operations)
+        print(f"{threads:>8} {operations / locked:>14,.0f} "
+              f"{operations / sharded:>14,.0f} {locked / sharded:>7.2f}x")
+
+
+# ============================================================================
+# VECTOR BENCHMARKS
+# ============================================================================
+
+class _DictVector:
+    """Baseline: the original __dict__-based Vector comparing by sqrt magnitude"""
+
+    def __init__(self, x=0, y=0):
+        self.x = float(x)
+        self.y = float(y)
+
+    def magnitude(self):
+        return math.sqrt(self.x ** 2 + self.y ** 2)
+
+    def __lt__(self, other):
+        return self.magnitude() < other.magnitude()
+
+
+def _bytes_per_instance(cls, count):
+    """Average traced allocation per instance of cls"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    instances = [cls(i, i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    list_overhead = 8 * len(instances)  # one pointer per list slot
+    return (after - before - list_overhead) / count
+
+
+def benchmark_vector_memory_and_sorting(count=200_000):
+    """Compare memory per instance and sorted() throughput with the __dict__ Vector"""
+    print("\n=== SLOTTED VECTOR MEMORY AND SORTING ===")
+    print(f"{count} vectors")
+
+    rng = random.Random(242)
+    coords = [(rng.uniform(-1e3, 1e3), rng.uniform(-1e3, 1e3)) for _ in range(count)]
+    print(f"{'class':>12} {'bytes/inst':>11} {'sort (s)':>9} {'vectors/s':>12}")
+
+    for name, cls in (("dict-based", _DictVector), ("slotted", Vector)):
+        memory = _bytes_per_instance(cls, min(count, 100_000))
+        vectors = [cls(x, y) for x, y in coords]
+        elapsed = _timed(lambda: sorted(vectors))
+        print(f"{name:>12} {memory:>11.0f} {elapsed:>9.3f} {count / elapsed:>12,.0f}")
+
+
+# ============================================================================
+# SPATIAL INDEX BENCHMARKS
+# ============================================================================
+
+def benchmark_kd_tree(count=200_000, queries=200, k=10):
+    """Compare KD-tree knn and box queries against linear scans"""
+    print("\n=== KD-TREE VS BRUTE FORCE ===")
+    rng = random.Random(242)
+    points = [Vector(rng.uniform(-1e3, 1e3), rng.uniform(-1e3, 1e3)) for _ in range(count)]
+    probes = [Vector(rng.uniform(-1e3, 1e3), rng.uniform(-1e3, 1e3)) for _ in range(queries)]
+
+    tree = None
+
+    def build():
+        nonlocal tree
+        tree = KDTree(points)
+
+    print(f"{count} points, build: {_timed(build):.2f} s")
+
+    tree_knn = _timed(lambda: [tree.knn(q, k) for q in probes])
+    brute_knn = _timed(lambda: [sorted(points, key=lambda p: (p - q).magnitude())[:k]
+                                for q in probes[:10]]) * queries / 10
+    tree_box = _timed(lambda: [tree.box(q, q + 50) for q in probes])
+    brute_box = _timed(lambda: [[p for p in points if q.x <= p.x <= q.x + 50 and q.y <= p.y <= q.y + 50]
+                                for q in probes[:10]]) * queries / 10
+
+    print(f"{'query':>8} {'tree q/s':>12} {'brute q/s':>12} {'speedup':>9}")
+    print(f"{'knn':>8} {queries / tree_knn:>12,.0f} {queries / brute_knn:>12,.1f} {brute_knn / tree_knn:>8,.0f}x")
+    print(f"{'box':>8} {queries / tree_box:>12,.0f} {queries / brute_box:>12,.1f} {brute_box / tree_box:>8,.0f}x")
+
+
+# ============================================================================
+# FRACTION BENCHMARKS
+# ============================================================================
+
+class _EuclidFraction:
+    """Baseline: the original Fraction with a pure-Python gcd in every constructor"""
+
+    def __init__(self, numerator, denominator=1):
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        a, b = abs(numerator), denominator
+        while b:
+            a, b = b, a % b
+        self.numerator = numerator // a
+        self.denominator = denominator // a
+
+    def __add__(self, other):
+        if isinstance(other, _EuclidFraction):
+            return _EuclidFraction(self.numerator * other.denominator + other.numerator * self.denominator,
+                                   self.denominator * other.denominator)
+        return self + _EuclidFraction(other)
+
+    def __mul__(self, other):
+        if isinstance(other, _EuclidFraction):
+            return _EuclidFraction(self.numerator * other.numerator,
+                                   self.denominator * other.denominator)
+        return self * _EuclidFraction(other)
+
+
+def _fraction_workload(cls, pairs, harmonic_terms):
+    """Mixed small-fraction arithmetic, int operands and a harmonic sum"""
+    values = [cls(n, d) for n, d in pairs]
+    total = cls(0)
+    for a, b in zip(values, values[1:]):
+        total = total + a * b
+        total = total + 3
+        total = total * 2
+        total = total * cls(1, 2)
+    harmonic = cls(0)
+    for k in range(1, harmonic_terms + 1):
+        harmonic = harmonic + cls(1, k)
+    return total, harmonic
+
+
+def benchmark_fraction_arithmetic(operations=50_000, harmonic_terms=1_500):
+    """Compare Fraction against the Euclid-loop original and fractions.Fraction"""
+    print("\n=== FRACTION ARITHMETIC ===")
+    rng = random.Random(242)
+    pairs = [(rng.randint(-99, 99), rng.randint(1, 99)) for _ in range(operations)]
+    print(f"{operations} mixed operations, harmonic sum of {harmonic_terms} terms")
+    print(f"{'class':>20} {'seconds':>9}")
+
+    for name, cls in (("original (Euclid)", _EuclidFraction),
+                      ("Fraction", Fraction),
+                      ("fractions.Fraction", fractions.Fraction)):
+        elapsed = _timed(lambda: _fraction_workload(cls, pairs, harmonic_terms))
+        print(f"{name:>20} {elapsed:>9.3f}")
+
+
+def _primes(count):
+    """First count primes, by trial division"""
+    primes = []
+    candidate = 2
+    while len(primes) < count:
+        if all(candidate % p for p in primes if p * p <= candidate):
+            primes.append(candidate)
+        candidate += 1
+    return primes
+
+
+def benchmark_fraction_sum(random_terms=200_000, prime_terms=3_000):
+    """Compare Fraction.sum with sum() on random and all-distinct prime denominators"""
+    print("\n=== FRACTION SUMMATION KERNEL ===")
+    rng = random.Random(242)
+    workloads = [
+        (f"random den 1..1000 (n={random_terms})",
+         [Fraction(rng.randint(-999, 999), rng.randint(1, 1000)) for _ in range(random_terms)]),
+        (f"distinct primes (n={prime_terms})",
+         [Fraction(1, p) for p in _primes(prime_terms)]),
+    ]
+    print(f"{'workload':>34} {'sum() s':>9} {'kernel s':>9} {'speedup':>8} {'equal':>6}")
+
+    for name, terms in workloads:
+        results = {}
+        naive = _timed(lambda: results.setdefault("naive", sum(terms, Fraction(0))))
+        kernel = _timed(lambda: results.setdefault("kernel", Fraction.sum(terms)))
+        same = (results["naive"].numerator == results["kernel"].numerator
+                and results["naive"].denominator == results["kernel"].denominator)
+        print(f"{name:>34} {naive:>9.3f} {kernel:>9.3f} {naive / kernel:>7.1f}x {same!s:>6}")
+
+
+def benchmark_fraction_interning(count=300_000):
+    """Build many repeated small fractions with and without the interning cache"""
+    print("\n=== FRACTION INTERNING CACHE ===")
+    rng = random.Random(242)
+    pairs = [(rng.randint(0, 12), rng.randint(1, 12)) for _ in range(count)]
+
+    def build():
+        return [Fraction(n, d) * Fraction(1, 2) for n, d in pairs]
+
+    print(f"{count} constructions + multiplications")
+    print(f"{'mode':>10} {'seconds':>9} {'retained KiB':>13} {'hit rate':>9}")
+    for mode in ("plain", "interned"):
+        if mode == "interned":
+            Fraction.enable_interning()
+        elapsed = _timed(build)
+        tracemalloc.start()
+        kept = build()
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        hit_rate = Fraction.intern_stats()["hit_rate"]
+        Fraction.disable_interning()
+        del kept
+        print(f"{mode:>10} {elapsed:>9.3f} {retained / 1024:>13,.0f} {hit_rate:>8.1%}")
+
+
+# ============================================================================
+# SMART LIST BENCHMARKS
+# ============================================================================
+
+def benchmark_typed_smart_list(count=2_000_000):
+    """Compare typed array.array SmartList storage with object storage"""
+    print("\n=== TYPED SMART LIST ===")
+    rng = random.Random(242)
+    values = [rng.random() for _ in range(count)]
+    lists = {"object": SmartList(values), "typed": SmartList(values, typed=True)}
+    print(f"{count} floats")
+    print(f"{'operation':>14} {'object s':>9} {'typed s':>9} {'speedup':>8}")
+
+    operations = (
+        ("sum", lambda sl: sl.sum()),
+        ("filter_type", lambda sl: sl.filter_type(float)),
+        ("+", lambda sl: sl + sl),
+        ("* 3", lambda sl: sl * 3),
+        ("slice", lambda sl: sl[::2]),
+    )
+    for name, operation in operations:
+        plain = _timed(lambda: operation(lists["object"]))
+        typed = _timed(lambda: operation(lists["typed"]))
+        print(f"{name:>14} {plain:>9.3f} {typed:>9.3f} {plain / typed:>7.1f}x")
+
+
+def _peak_bytes(function):
+    """Peak traced allocation while running function"""
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def benchmark_lazy_smart_list(count=1_000_000):
+    """Compare a fused lazy query with the equivalent eager SmartList chain"""
+    print("\n=== LAZY SMART LIST QUERY ===")
+    rng = random.Random(242)
+    items = SmartList(rng.choice((rng.random(), rng.randint(0, 99), "tag", None))
+                      for _ in range(count))
+
+    def eager():
+        numbers = items.filter_type((int, float))
+        positive = SmartList([n for n in numbers if n > 0.5])
+        return SmartList([n * 2 for n in positive]).sum()
+
+    def lazy():
+        return (items.lazy().filter_type((int, float)).filter(lambda n: n > 0.5)
+                .map(lambda n: n * 2).sum())
+
+    print(f"{count} mixed items: filter_type -> filter -> map -> sum")
+    print(f"{'style':>8} {'seconds':>9} {'peak KiB':>10}")
+    for name, function in (("eager", eager), ("lazy", lazy)):
+        print(f"{name:>8} {_timed(function):>9.3f} {_peak_bytes(function) / 1024:>10,.0f}")
+
+
+def benchmark_indexed_smart_list(count=500_000, queries=20, mutations=100_000):
+    """Measure filter_type speedup and mutation overhead of the per-type index"""
+    print("\n=== INDEXED SMART LIST ===")
+    rng = random.Random(242)
+    kinds = (lambda: rng.random(), lambda: rng.randint(0, 99), lambda: "tag", lambda: None,
+             lambda: b"raw", lambda: (1, 2), lambda: True, lambda: 1j)
+    items = [rng.choice(kinds)() for _ in range(count)]
+    positions = [rng.randrange(count) for _ in range(mutations)]
+    print(f"{count} items of {len(kinds)} types, {queries} filter_type queries, "
+          f"{mutations} of each mutation")
+    print(f"{'operation':>16} {'plain s':>9} {'indexed s':>10} {'ratio':>7}")
+
+    def append_all(indexed):
+        sl = SmartList(indexed=indexed)
+        for item in items:
+            sl.append(item)
+        return sl
+
+    lists = {}
+    rows = (
+        ("append", lambda indexed: lists.__setitem__(indexed, append_all(indexed))),
+        ("filter_type", lambda indexed: [lists[indexed].filter_type(str) for _ in range(queries)]),
+        ("setitem", lambda indexed: [lists[indexed].__setitem__(p, "tag") for p in positions]),
+        ("pop() end", lambda indexed: [lists[indexed].pop() for _ in range(mutations)]),
+        ("del front", lambda indexed: [lists[indexed].__delitem__(0) for _ in range(100)]),
+    )
+    for name, operation in rows:
+        plain = _timed(lambda: operation(False))
+        indexed = _timed(lambda: operation(True))
+        print(f"{name:>16} {plain:>9.3f} {indexed:>10.3f} {indexed / plain:>6.1f}x")
+
+
+def benchmark_rope_smart_list(chunks=4_000, chunk_size=50, lookups=100_000):
+    """Build a list with repeated sl = sl + chunk: copying lists against the rope"""
+    print("\n=== ROPE SMART LIST CONCATENATION ===")
+    rng = random.Random(242)
+    pieces = [list(range(i, i + chunk_size)) for i in range(chunks)]
+    total = chunks * chunk_size
+    positions = [rng.randrange(total) for _ in range(lookups)]
+    print(f"{chunks} concatenations of {chunk_size} items ({total} items), {lookups} lookups")
+
+    built = {}
+
+    def copying():
+        items = []
+        for piece in pieces:
+            items = items + piece
+        built["copying"] = items
+
+    def rope():
+        sl = SmartList()
+        for piece in pieces:
+            sl = sl + SmartList(piece)
+        built["rope"] = sl
+
+    print(f"{'storage':>8} {'build s':>9} {'lookups s':>10} {'iterate s':>10}")
+    for name, build in (("copying", copying), ("rope", rope)):
+        elapsed = _timed(build)
+        items = built[name]
+        lookup = _timed(lambda: [items[p] for p in positions])
+        iterate = _timed(lambda: sum(1 for _ in items))
+        print(f"{name:>8} {elapsed:>9.3f} {lookup:>10.3f} {iterate:>10.3f}")
+    print(f"rope equals copied list: {built['rope'] == built['copying']}, "
+          f"height {built['rope']._rope.height}, flatten: {_timed(built['rope'].flatten):.3f} s")
+
+
+# ============================================================================
+# EXACT MATRIX BENCHMARKS
+# ============================================================================
+
+def _naive_fraction_solve(rows, b):
+    """Baseline: Gauss-Jordan over Fractions, reducing every entry at every step"""
+    size = len(rows)
+    matrix = [list(row) + [value] for row, value in zip(rows, b)]
+    for k in range(size):
+        swap = next(r for r in range(k, size) if matrix[r][k] != 0)
+        matrix[k], matrix[swap] = matrix[swap], matrix[k]
+        pivot_row = [entry / matrix[k][k] for entry in matrix[k]]
+        matrix[k] = pivot_row
+        for i in range(size):
+            factor = matrix[i][k]
+            if i != k and factor != 0:
+                matrix[i] = [a - factor * p for a, p in zip(matrix[i], pivot_row)]
+    return [row[size] for row in matrix]
+
+
+def benchmark_exact_matrix(sizes=(10, 25, 50, 100, 200), naive_limit=50):
+    """Compare ExactMatrix.solve with naive Fraction elimination
+
+    The naive baseline is only run up to naive_limit; past that it takes
+    minutes, which is the problem Bareiss elimination avoids.
+    """
+    print("\n=== EXACT MATRIX SOLVE (BAREISS VS NAIVE FRACTION) ===")
+    rng = random.Random(242)
+    print(f"{'size':>6} {'naive s':>9} {'bareiss s':>10} {'speedup':>8} {'equal':>6}")
+
+    for size in sizes:
+        rows = [[Fraction(rng.randint(-9, 9), rng.randint(1, 9)) for _ in range(size)]
+                for _ in range(size)]
+        b = [Fraction(rng.randint(-9, 9), rng.randint(1, 9)) for _ in range(size)]
+        matrix = ExactMatrix(rows)
+        results = {}
+        bareiss = _timed(lambda: results.setdefault("bareiss", matrix.solve(b)))
+        if size <= naive_limit:
+            naive = _timed(lambda: results.setdefault("naive", _naive_fraction_solve(rows, b)))
+            same = results["naive"] == results["bareiss"]
+            print(f"{size:>6} {naive:>9.3f} {bareiss:>10.3f} {naive / bareiss:>7.1f}x {same!s:>6}")
+        else:
+            print(f"{size:>6} {'-':>9} {bareiss:>10.3f} {'-':>8} {'-':>6}")
+
+
+# ============================================================================
+# LAZY EXPRESSION BENCHMARKS
+# ============================================================================
+
+def benchmark_lazy_expressions(chain=5_000, steps=200, starts=200, points=50, degree=300):
+    """Compare lazy expression graphs with eager Vector and Fraction arithmetic
+
+    Building a graph costs more than one eager pass, so a one-shot chain is
+    slower; the gain comes from evaluating a compiled graph many times with
+    Var bindings, where shared and variable-free parts are computed once.
+    """
+    print("\n=== LAZY EXPRESSION GRAPHS ===")
+    rng = random.Random(242)
+    print(f"{'workload':>34} {'eager s':>9} {'lazy s':>9} {'speedup':>8} {'equal':>6}")
+
+    def report(name, eager, lazy_run):
+        results = {}
+        eager_time = _timed(lambda: results.setdefault("eager", eager()))
+        lazy_time = _timed(lambda: results.setdefault("lazy", lazy_run()))
+        same = results["eager"] == results["lazy"]
+        print(f"{name:>34} {eager_time:>9.3f} {lazy_time:>9.3f} "
+              f"{eager_time / lazy_time:>7.1f}x {same!s:>6}")
+
+    # One-shot Fraction chain f0 + a1 * b1 + a2 * b2 + ...: build and evaluate once
+    terms = [Fraction(rng.randint(-9, 9), rng.randint(1, 9)) for _ in range(2 * chain + 1)]
+
+    def eager_chain():
+        total = terms[0]
+        for a, b in zip(terms[1::2], terms[2::2]):
+            total = total + a * b
+        return total
+
+    def lazy_chain():
+        total = lazy(terms[0])
+        for a, b in zip(terms[1::2], terms[2::2]):
+            total = total + lazy(a) * b
+        return total.evaluate()
+
+    report(f"one-shot Fraction chain (n={chain})", eager_chain, lazy_chain)
+
+    # Fraction polynomial-like sum in x, evaluated at many points
+    coefficients = [Fraction(rng.randint(-9, 9), rng.randint(1, 9)) for _ in range(degree)]
+    xs = [Fraction(rng.randint(-9, 9), rng.randint(1, 9)) for _ in range(points)]
+    x = Var("x")
+    polynomial = lazy(0)
+    for c in coefficients:
+        polynomial = polynomial + c * x * x + lazy(c) / 3
+
+    def eager_polynomial():
+        values = []
+        for value in xs:
+            total = Fraction(0)
+            for c in coefficients:
+                total = total + c * value * value + c / 3
+            values.append(total)
+        return values
+
+    report(f"Fraction sum in x ({points} points)", eager_polynomial,
+           lambda: [polynomial.evaluate(x=value) for value in xs])
+
+    # Unrolled Vector integration p + v*dt + g*dt^2/2, many start states
+    dt = 0.01
+    gravity = Vector(0, -9.8)
+    states = [(Vector(rng.random(), rng.random()), Vector(rng.random(), rng.random()))
+              for _ in range(starts)]
+    position = Var("p")
+    for _ in range(steps):
+        position = position + Var("v") * dt + lazy(gravity) * (dt * dt / 2)
+
+    def eager_integration():
+        finals = []
+        for p, v in states:
+            for _ in range(steps):
+                p = p + v * dt + gravity * (dt * dt / 2)
+            finals.append(p)
+        return finals
+
+    report(f"Vector integration ({steps} steps)", eager_integration,
+           lambda: [position.evaluate(p=p, v=v) for p, v in states])
+
+
+# ============================================================================
+# OPERATOR DISPATCH BENCHMARKS
+# ============================================================================
+
+class _ChainFraction(Fraction):
+    """Baseline: the original isinstance chains, with a temporary Fraction for floats"""
+
+    __slots__ = ()
+
+    def __add__(self, other):
+        if isinstance(other, Fraction):
+            return Fraction._add_terms(self._numerator, self._denominator,
+                                       other._numerator, other._denominator)
+        elif isinstance(other, int):
+            return Fraction._from_reduced(self._numerator + other * self._denominator,
+                                          self._denominator)
+        elif isinstance(other, float):
+            return self + Fraction(other)
+        return NotImplemented
+
+    def __mul__(self, other):
+        if isinstance(other, Fraction):
+            return Fraction._multiply(self._numerator, self._denominator,
+                                      other._numerator, other._denominator)
+        elif isinstance(other, int):
+            g = math.gcd(other, self._denominator)
+            return Fraction._from_reduced(self._numerator * (other // g),
+                                          self._denominator // g)
+        elif isinstance(other, float):
+            return self * Fraction(other)
+        return NotImplemented
+
+    def __eq__(self, other):
+        if isinstance(other, Fraction):
+            return (self._numerator == other._numerator and
+                    self._denominator == other._denominator)
+        elif isinstance(other, int):
+            return self._denominator == 1 and self._numerator == other
+        elif isinstance(other, float):
+            return self == Fraction(other)
+        return False
+
+    def __lt__(self, other):
+        if isinstance(other, Fraction):
+            return self._numerator * other._denominator < other._numerator * self._denominator
+        elif isinstance(other, int):
+            return self._numerator < other * self._denominator
+        elif isinstance(other, float):
+            return self < Fraction(other)
+        return NotImplemented
+
+
+class _ChainVector(Vector):
+    """Baseline: the original isinstance chains for Vector"""
+
+    __slots__ = ()
+
+    def __add__(self, other):
+        if isinstance(other, Vector):
+            return Vector(self._x + other._x, self._y + other._y)
+        elif isinstance(other, (int, float)):
+            return Vector(self._x + other, self._y + other)
+        return NotImplemented
+
+    def __mul__(self, other):
+        if isinstance(other, (int, float)):
+            return Vector(self._x * other, self._y * other)
+        elif isinstance(other, Vector):
+            return self._x * other._x + self._y * other._y
+        return NotImplemented
+
+    def __lt__(self, other):
+        if isinstance(other, Vector):
+            return self._mag_sq < other._mag_sq
+        elif isinstance(other, (int, float)):
+            return other > 0 and self._mag_sq < other * other
+        return NotImplemented
+
+
+class _TaggedFraction(Fraction):
+    """A plain Fraction subclass, resolved once and then cached by the tables"""
+
+    __slots__ = ()
+
+
+def benchmark_dispatch(repeat=20_000, rounds=15):
+    """Mixed-type binary operators: isinstance chains against dispatch tables"""
+    print("\n=== OPERATOR DISPATCH (ns per operation) ===")
+    tagged = _TaggedFraction(2, 7)
+    cases = [
+        ("Fraction + Fraction", operator.add, Fraction(3, 4), _ChainFraction(3, 4), Fraction(5, 6)),
+        ("Fraction + int", operator.add, Fraction(3, 4), _ChainFraction(3, 4), 7),
+        ("Fraction + float", operator.add, Fraction(3, 4), _ChainFraction(3, 4), 0.625),
+        ("Fraction * float", operator.mul, Fraction(3, 4), _ChainFraction(3, 4), 2.5),
+        ("Fraction == float", operator.eq, Fraction(3, 4), _ChainFraction(3, 4), 0.75),
+        ("Fraction < float", operator.lt, Fraction(3, 4), _ChainFraction(3, 4), 0.8),
+        ("Fraction == str", operator.eq, Fraction(3, 4), _ChainFraction(3, 4), "3/4"),
+        ("Fraction + subclass", operator.add, Fraction(3, 4), _ChainFraction(3, 4), tagged),
+        ("Vector + Vector", operator.add, Vector(1.5, 2.5), _ChainVector(1.5, 2.5), Vector(3, 4)),
+        ("Vector + int", operator.add, Vector(1.5, 2.5), _ChainVector(1.5, 2.5), 3),
+        ("Vector * float", operator.mul, Vector(1.5, 2.5), _ChainVector(1.5, 2.5), 2.5),
+        ("Vector < float", operator.lt, Vector(1.5, 2.5), _ChainVector(1.5, 2.5), 4.0),
+    ]
+
+    def per_op(op, left, right):
+        lefts = [left] * repeat
+        start = time.perf_counter()
+        for value in lefts:
+            op(value, right)
+        return (time.perf_counter() - start) / repeat * 1e9
+
+    # Interleave the two variants and keep the best round of each, so that
+    # machine noise affects both columns alike
+    best = {}
+    for _ in range(rounds):
+        for name, op, table_left, chain_left, right in cases:
+            for variant, left in (("chain", chain_left), ("table", table_left)):
+                key = (name, variant)
+                best[key] = min(best.get(key, math.inf), per_op(op, left, right))
+
+    print(f"{'operation':>20} {'isinstance':>11} {'table':>8} {'speedup':>8}")
+    for name, *_ in cases:
+        chain, table = best[name, "chain"], best[name, "table"]
+        print(f"{name:>20} {chain:>11.0f} {table:>8.0f} {chain / table:>7.2f}x")
+
+
+# ============================================================================
+# N-DIMENSIONAL VECTOR BENCHMARKS
+# ============================================================================
+
+class _ListVector:
+    """Baseline: the in-class Vector(*components) storing a list of boxed floats"""
+
+    def __init__(self, *components):
+        self.components = [float(c) for c in components]
+
+    def __add__(self, other):
+        return _ListVector(*[a + b for a, b in zip(self.components, other.components)])
+
+    def __mul__(self, scalar):
+        return _ListVector(*[a * scalar for a in self.components])
+
+    def dot(self, other):
+        return sum(a * b for a, b in zip(self.components, other.components))
+
+    def __abs__(self):
+        return math.sqrt(sum(a * a for a in self.components))
+
+
+def benchmark_nd_vector(dimension=768, count=2_000):
+    """Packed NDVector against a list-of-floats vector on embedding-sized data"""
+    print(f"\n=== N-DIMENSIONAL VECTORS (dimension {dimension}, {count} vectors) ===")
+    rng = random.Random(242)
+    # Packed rows, so each list vector boxes its own float objects as loaded data would
+    rows = [array("d", [rng.gauss(0, 1) for _ in range(dimension)]) for _ in range(count)]
+
+    def build(cls):
+        return [cls(*row) for row in rows]
+
+    def cosine_list(query, vectors):
+        query_norm = abs(query)
+        return [query.dot(v) / (query_norm * abs(v)) for v in vectors]
+
+    print(f"{'operation':>22} {'list (s)':>9} {'NDVector (s)':>13} {'speedup':>8}")
+    results = {}
+    for name, cls in (("list", _ListVector), ("packed", NDVector)):
+        tracemalloc.start()
+        vectors = build(cls)
+        results[name, "bytes"] = tracemalloc.get_traced_memory()[0] / count
+        tracemalloc.stop()
+        query = vectors[0]
+        results[name, "build"] = _timed(lambda: build(cls))
+        results[name, "add + scale"] = _timed(lambda: [(v + query) * 0.5 for v in vectors])
+        results[name, "dot"] = _timed(lambda: [query.dot(v) for v in vectors])
+        results[name, "norm"] = _timed(lambda: [abs(v) for v in vectors])
+        if cls is NDVector:
+            results[name, "cosine batch"] = _timed(lambda: cosine_similarities(query, vectors))
+        else:
+            results[name, "cosine batch"] = _timed(lambda: cosine_list(query, vectors))
+    for operation in ("build", "add + scale", "dot", "norm", "cosine batch"):
+        before, after = results["list", operation], results["packed", operation]
+        print(f"{operation:>22} {before:>9.3f} {after:>13.3f} {before / after:>7.1f}x")
+    print(f"{'bytes per vector':>22} {results['list', 'bytes']:>9,.0f} "
+          f"{results['packed', 'bytes']:>13,.0f}")
+
+
+def benchmark_sparse_vector(dimensions=(768, 20_000), density=0.02, count=1_000):
+    """SparseVector against dense NDVector at low density"""
+    print(f"\n=== SPARSE VECTORS ({density:.0%} non-zero, {count} vectors) ===")
+    rng = random.Random(242)
+    print(f"{'dimension':>10} {'operation':>12} {'dense (s)':>10} {'sparse (s)':>11} {'speedup':>8}")
+    for dimension in dimensions:
+        nonzeros = max(1, int(dimension * density))
+        rows = [dict(zip(rng.sample(range(dimension), nonzeros),
+                         (rng.gauss(0, 1) for _ in range(nonzeros)))) for _ in range(count)]
+        results = {}
+        for name in ("dense", "sparse"):
+            tracemalloc.start()
+            if name == "dense":
+                vectors = [SparseVector(dimension, row).to_dense() for row in rows]
+            else:
+                vectors = [SparseVector(dimension, row) for row in rows]
+            results[name, "KiB/vector"] = tracemalloc.get_traced_memory()[0] / count / 1024
+            tracemalloc.stop()
+            query = vectors[0]
+            results[name, "dot"] = _timed(lambda: [query.dot(v) for v in vectors])
+            results[name, "add"] = _timed(lambda: [query + v for v in vectors])
+            results[name, "norm"] = _timed(lambda: [abs(v) for v in vectors])
+        for operation in ("dot", "add", "norm", "KiB/vector"):
+            before, after = results["dense", operation], results["sparse", operation]
+            print(f"{dimension:>10} {operation:>12} {before:>10.3f} {after:>11.3f} "
+                  f"{before / after:>7.1f}x")
+
+
+# ============================================================================
+# PARALLEL REDUCTION BENCHMARKS
+# ============================================================================
+
+def benchmark_parallel_reduce(count=1_000_000, worker_counts=None):
+    """Chunked process-pool sums of Vectors and Fractions from 1 to N workers"""
+    cores = os.cpu_count() or 1
+    if worker_counts is None:
+        worker_counts = sorted({1, cores} | {2 ** i for i in range(1, cores.bit_length())})
+    print(f"\n=== PARALLEL REDUCTION ({count} items, {cores} core(s) available) ===")
+    rng = random.Random(242)
+    vectors = [Vector(rng.gauss(0, 1), rng.gauss(0, 1)) for _ in range(count)]
+    fractions = [Fraction(rng.randint(-50, 50), rng.randint(1, 60)) for _ in range(count)]
+
+    serial = {
+        "Vector": [("sum()", lambda: sum(vectors, Vector(0, 0))),
+                   ("pack + fsum, 1 process", lambda: [math.fsum(c) for c in pack_vectors(vectors)])],
+        "Fraction": [("sum()", lambda: sum(fractions, Fraction(0))),
+                     ("Fraction.sum, 1 process", lambda: Fraction.sum(fractions))],
+    }
+    parallel = {"Vector": lambda pool: parallel_vector_sum(vectors, executor=pool),
+                "Fraction": lambda pool: parallel_fraction_sum(fractions, executor=pool)}
+
+    print(f"{'type':>9} {'method':>24} {'seconds':>8} {'vs sum()':>9}")
+    for kind in ("Vector", "Fraction"):
+        baseline = None
+        for method, function in serial[kind]:
+            elapsed = _timed(function)
+            baseline = baseline or elapsed
+            print(f"{kind:>9} {method:>24} {elapsed:>8.3f} {baseline / elapsed:>8.1f}x")
+        for workers in worker_counts:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                list(pool.map(abs, range(workers)))  # start the workers before timing
+                elapsed = _timed(lambda: parallel[kind](pool))
+            print(f"{kind:>9} {f'{workers} worker(s)':>24} {elapsed:>8.3f} {baseline / elapsed:>8.1f}x")
+
+
+# ============================================================================
+# GEOMETRY BENCHMARKS
+# ============================================================================
+
+def _naive_closest_pair(points):
+    """Baseline: compare every pair of Vectors, O(n^2)"""
+    return min(abs(a - b) for i, a in enumerate(points) for b in points[i + 1:])
+
+
+def _gift_wrap_hull(points):
+    """Baseline: Jarvis march with Vector.cross, O(n h)"""
+    start = min(points, key=lambda p: (p.x, p.y))
+    hull = [start]
+    while True:
+        candidate = points[0] if points[0] is not hull[-1] else points[1]
+        for p in points:
+            turn = (candidate - hull[-1]).cross(p - hull[-1])
+            if turn < 0 or (turn == 0 and abs(p - hull[-1]) > abs(candidate - hull[-1])):
+                candidate = p
+        if candidate is start:
+            return hull
+        hull.append(candidate)
+
+
+def benchmark_geometry(pair_sizes=(500, 2_000), hull_size=100_000, queries=100_000):
+    """Geometry kernels against the straightforward Vector-based algorithms"""
+    print("\n=== COMPUTATIONAL GEOMETRY ===")
+    rng = random.Random(242)
+    print(f"{'task':>32} {'naive (s)':>10} {'fast (s)':>9} {'speedup':>8}")
+
+    for size in pair_sizes:
+        points = [Vector(rng.uniform(0, 1e3), rng.uniform(0, 1e3)) for _ in range(size)]
+        naive = _timed(lambda: _naive_closest_pair(points))
+        fast = _timed(lambda: closest_pair(points))
+        print(f"{f'closest pair, {size} points':>32} {naive:>10.3f} {fast:>9.3f} {naive / fast:>7.1f}x")
+
+    points = [Vector(rng.gauss(0, 1), rng.gauss(0, 1)) for _ in range(hull_size)]
+    naive = _timed(lambda: _gift_wrap_hull(points))
+    fast = _timed(lambda: convex_hull(points))
+    print(f"{f'convex hull, {hull_size} points':>32} {naive:>10.3f} {fast:>9.3f} {naive / fast:>7.1f}x")
+
+    polygon = [Vector(math.cos(a) * r, math.sin(a) * r)
+               for a, r in sorted((rng.uniform(0, 2 * math.pi), rng.uniform(0.3, 1.0))
+                                  for _ in range(50))]
+    targets = [Vector(rng.uniform(-1, 1), rng.uniform(-1, 1)) for _ in range(queries)]
+    batch = VectorArray.from_vectors(targets)
+    naive = _timed(lambda: [point_in_polygon(t, polygon) for t in targets])
+    fast = _timed(lambda: points_in_polygon(batch, polygon))
+    print(f"{f'point in 50-gon, {queries} points':>32} {naive:>10.3f} {fast:>9.3f} {naive / fast:>7.1f}x")
+
+
+# ============================================================================
+# TEMPORARY OBJECT BENCHMARKS
+# ============================================================================
+
+def _integrate_immutable(steps, dt):
+    """pos = pos + vel * dt: two new Vectors per step"""
+    pos, vel = Vector(0, 0), Vector(1.0, 0.5)
+    for _ in range(steps):
+        pos = pos + vel * dt
+    return pos
+
+
+def _integrate_in_place(steps, dt):
+    """pos += vel * dt on a MutableVector: one temporary per step"""
+    pos, vel = MutableVector(0, 0), Vector(1.0, 0.5)
+    for _ in range(steps):
+        pos += vel * dt
+    return pos
+
+
+def _integrate_scaled(steps, dt):
+    """pos.iadd_scaled(vel, dt): no Vector allocated per step"""
+    pos, vel = MutableVector(0, 0), Vector(1.0, 0.5)
+    for _ in range(steps):
+        pos.iadd_scaled(vel, dt)
+    return pos
+
+
+def _integrate_pooled(steps, dt):
+    """pos += step with the step temporary taken from a VectorPool"""
+    pos, vel, pool = MutableVector(0, 0), Vector(1.0, 0.5), VectorPool()
+    for _ in range(steps):
+        step = pool.acquire(vel.x, vel.y)
+        step *= dt
+        pos += step
+        pool.release(step)
+    return pos
+
+
+def _accumulate_fractions(steps):
+    """total = total + Fraction(k % 8, 8): two new Fractions per step"""
+    total = Fraction(0)
+    for k in range(steps):
+        total = total + Fraction(k % 8, 8)
+    return total
+
+
+def _accumulate_pooled_fractions(steps):
+    """The same sum with the Fraction(k % 8, 8) temporary taken from a FractionPool"""
+    total, pool = Fraction(0), FractionPool()
+    for k in range(steps):
+        term = pool.acquire(k % 8, 8)
+        total = total + term
+        pool.release(term)
+    return total
+
+
+@contextlib.contextmanager
+def _counting_instances():
+    """Count the Vectors and Fractions built inside the with block
+
+    Every Vector (and MutableVector) goes through Vector.__init__ and every
+    Fraction through Fraction._from_reduced; both are wrapped with a
+    counter and restored afterwards.
+    """
+    counter = [0]
+    vector_init = Vector.__init__
+    from_reduced = Fraction.__dict__["_from_reduced"]
+
+    def counted_init(self, *args):
+        counter[0] += 1
+        vector_init(self, *args)
+
+    def counted_from_reduced(cls, numerator, denominator):
+        counter[0] += 1
+        return from_reduced.__func__(cls, numerator, denominator)
+
+    Vector.__init__ = counted_init
+    Fraction._from_reduced = classmethod(counted_from_reduced)
+    try:
+        yield counter
+    finally:
+        Vector.__init__ = vector_init
+        Fraction._from_reduced = from_reduced
+
+
+def benchmark_temporaries(steps=1_000_000, traced_steps=10_000):
+    """Integration and accumulation loops with and without per-step temporaries
+
+    objects/step is measured by counting constructor calls over
+    traced_steps steps; tracemalloc reports how many bytes of temporaries
+    are alive at the peak of a run of the same length.
+    """
+    print(f"\n=== TEMPORARY OBJECTS ({steps} steps) ===")
+    dt = 0.001
+    loops = (
+        ("pos = pos + vel * dt", lambda n: _integrate_immutable(n, dt)),
+        ("MutableVector pos += vel * dt", lambda n: _integrate_in_place(n, dt)),
+        ("pos.iadd_scaled(vel, dt)", lambda n: _integrate_scaled(n, dt)),
+        ("VectorPool step temporary", lambda n: _integrate_pooled(n, dt)),
+        ("total += Fraction(k % 8, 8)", _accumulate_fractions),
+        ("FractionPool term temporary", _accumulate_pooled_fractions),
+    )
+    print(f"{'loop':>31} {'objects/step':>12} {'seconds':>8} {'steps/s':>11} {'peak B':>7}")
+    for name, loop in loops:
+        elapsed = _timed(lambda: loop(steps))
+        with _counting_instances() as counter:
+            loop(traced_steps)
+        peak = _peak_bytes(lambda: loop(traced_steps))
+        print(f"{name:>31} {counter[0] / traced_steps:>12.2f} {elapsed:>8.3f} "
+              f"{steps / elapsed:>11,.0f} {peak:>7,}")
+
+
+# ============================================================================
+# ANIMAL CONSTRUCTION BENCHMARKS
+# ============================================================================
+
+def _build_animals(specs):
+    """Construct every (cls, args) spec one at a time"""
+    return [cls(*args) for cls, args in specs]
+
+
+def _bulk_build_animals(specs_by_class):
+    """Construct each class's specs with one bulk_create call"""
+    animals = []
+    for cls, specs in specs_by_class.items():
+        animals.extend(cls.bulk_create(specs))
+    return animals
+
+
+def benchmark_animal_construction(count=300_000):
+    """Construct Dogs, Cats and Birds through each event sink and bulk_create"""
+    print(f"\n=== ANIMAL CONSTRUCTION ({count} animals) ===")
+    third = count // 3
+    specs_by_class = {
+        Dog: [(f"Dog {i}", "Beagle", i % 15) for i in range(third)],
+        Cat: [(f"Cat {i}", "Gray", i % 20) for i in range(third)],
+        Bird: [("Robin", True, 30, i % 5) for i in range(count - 2 * third)],
+    }
+    specs = [(cls, args) for cls, group in specs_by_class.items() for args in group]
+    previous = Animal.event_sink
+
+    with tempfile.TemporaryDirectory() as directory, open(os.devnull, "w") as devnull:
+        log_path = os.path.join(directory, "animals.log")
+
+        def printed():
+            with contextlib.redirect_stdout(devnull):
+                _build_animals(specs)
+
+        def with_sink(sink, build, argument):
+            Animal.set_event_sink(sink)
+            try:
+                build(argument)
+            finally:
+                Animal.set_event_sink(previous)
+                if isinstance(sink, BatchedFileSink):
+                    sink.close()
+
+        runs = (
+            ("print() to /dev/null", printed),
+            ("NullSink", lambda: with_sink(NullSink(), _build_animals, specs)),
+            ("ListSink", lambda: with_sink(ListSink(), _build_animals, specs)),
+            ("BatchedFileSink", lambda: with_sink(BatchedFileSink(log_path), _build_animals, specs)),
+            ("bulk_create + NullSink",
+             lambda: with_sink(NullSink(), _bulk_build_animals, specs_by_class)),
+            ("bulk_create + BatchedFileSink",
+             lambda: with_sink(BatchedFileSink(log_path), _bulk_build_animals, specs_by_class)),
+        )
+        print(f"{'path':>30} {'seconds':>8} {'animals/s':>11} {'vs print':>9}")
+        baseline = None
+        for name, run in runs:
+            elapsed = _timed(run)
+            baseline = baseline or elapsed
+            print(f"{name:>30} {elapsed:>8.3f} {count / elapsed:>11,.0f} {baseline / elapsed:>8.1f}x")
+
+
+def main():
+    """Run all benchmarks with small default sizes"""
+    print("⏱️ PERFORMANCE BENCHMARKS - CSC 242 Week 2")
+    print("=" * 60)
+
+    benchmark_sharded_queue()
+    benchmark_vector_memory_and_sorting()
+    benchmark_kd_tree()
+    benchmark_fraction_arithmetic()
+    benchmark_fraction_sum()
+    benchmark_fraction_interning()
+    benchmark_typed_smart_list()
+    benchmark_lazy_smart_list()
+    benchmark_indexed_smart_list()
+    benchmark_rope_smart_list()
+    benchmark_exact_matrix()
+    benchmark_lazy_expressions()
+    benchmark_dispatch()
+    benchmark_nd_vector()
+    benchmark_sparse_vector()
+    benchmark_parallel_reduce()
+    benchmark_geometry()
+    benchmark_temporaries()
+    benchmark_animal_construction()
+
+    print(f"\n" + "=" * 60)
+    print("✅ All benchmarks complete!")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ This file demonstrates the implementation of abstract data types (ADTs):
 - Stack (LIFO - Last In, First Out)
 - Deque (Double-ended queue)
 - Priority Queue
+- Bounded Queue with overflow policies
+- Sharded Queue for many producer threads
 - Custom iterators
 
 Author: CSC 242 Teaching Team
@@ -14,6 +16,29 @@ Author: CSC 242 Teaching Team
 
 from collections import deque
 import heapq
+import itertools
+import threading
+import time
+
+
+def _fail_fast(container, items):
+    """Return a lazy iterator over items that raises RuntimeError if container is mutated
+
+    The modification count is read here, when iter() is called, not on the
+    first next(), so a mutation in between is detected too.
+    """
+    expected = container._modcount
+    items = iter(items)
+    
+    def checked():
+        for item in items:
+            if container._modcount != expected:
+                raise RuntimeError(f"{type(container).__name__} mutated during iteration")
+            yield item
+        if container._modcount != expected:
+            raise RuntimeError(f"{type(container).__name__} mutated during iteration")
+    
+    return checked()
 
 
 # ============================================================================
@@ -27,11 +52,13 @@ class Queue:
         """Initialize empty queue"""
         self._items = []
         self._size = 0
+        self._modcount = 0  # bumped on every mutation for fail-fast iterators
     
     def enqueue(self, item):
         """Add item to the rear of the queue"""
         self._items.append(item)
         self._size += 1
+        self._modcount += 1
         return f"Enqueued: {item}"
     
     def dequeue(self):
@@ -41,6 +68,7 @@ class Queue:
         
         item = self._items.pop(0)
         self._size -= 1
+        self._modcount += 1
         return item
     
     def front(self):
@@ -67,15 +95,20 @@ class Queue:
         """Remove all items from the queue"""
         self._items.clear()
         self._size = 0
+        self._modcount += 1
     
     def to_list(self):
         """Return a copy of the queue as a list"""
         return self._items.copy()
     
+    def snapshot(self):
+        """Return a stable copy of the items in iteration order (front to rear)"""
+        return list(self._items)
+    
     # Iterator support
     def __iter__(self):
-        """Make queue iterable (front to rear)"""
-        return iter(self._items)
+        """Make queue iterable (front to rear), failing fast on mutation"""
+        return _fail_fast(self, self._items)
     
     def __len__(self):
         """Support len() function"""
@@ -107,11 +140,13 @@ class Stack:
         """Initialize empty stack"""
         self._items = []
         self._size = 0
+        self._modcount = 0  # bumped on every mutation for fail-fast iterators
     
     def push(self, item):
         """Add item to the top of the stack"""
         self._items.append(item)
         self._size += 1
+        self._modcount += 1
         return f"Pushed: {item}"
     
     def pop(self):
@@ -121,6 +156,7 @@ class Stack:
         
         item = self._items.pop()
         self._size -= 1
+        self._modcount += 1
         return item
     
     def peek(self):
@@ -141,15 +177,20 @@ class Stack:
         """Remove all items from the stack"""
         self._items.clear()
         self._size = 0
+        self._modcount += 1
     
     def to_list(self):
         """Return a copy of the stack as a list (bottom to top)"""
         return self._items.copy()
     
+    def snapshot(self):
+        """Return a stable copy of the items in iteration order (top to bottom)"""
+        return self._items[::-1]
+    
     # Iterator support (top to bottom)
     def __iter__(self):
-        """Make stack iterable (top to bottom)"""
-        return reversed(self._items)
+        """Make stack iterable (top to bottom), failing fast on mutation"""
+        return _fail_fast(self, reversed(self._items))
     
     def __len__(self):
         """Support len() function"""
@@ -181,17 +222,20 @@ class Deque:
         """Initialize empty deque"""
         self._items = []
         self._size = 0
+        self._modcount = 0  # bumped on every mutation for fail-fast iterators
     
     def add_front(self, item):
         """Add item to the front of the deque"""
         self._items.insert(0, item)
         self._size += 1
+        self._modcount += 1
         return f"Added to front: {item}"
     
     def add_rear(self, item):
         """Add item to the rear of the deque"""
         self._items.append(item)
         self._size += 1
+        self._modcount += 1
         return f"Added to rear: {item}"
     
     def remove_front(self):
@@ -201,6 +245,7 @@ class Deque:
         
         item = self._items.pop(0)
         self._size -= 1
+        self._modcount += 1
         return item
     
     def remove_rear(self):
@@ -210,6 +255,7 @@ class Deque:
         
         item = self._items.pop()
         self._size -= 1
+        self._modcount += 1
         return item
     
     def front(self):
@@ -236,11 +282,16 @@ class Deque:
         """Remove all items from the deque"""
         self._items.clear()
         self._size = 0
+        self._modcount += 1
+    
+    def snapshot(self):
+        """Return a stable copy of the items in iteration order (front to rear)"""
+        return list(self._items)
     
     # Iterator support
     def __iter__(self):
-        """Make deque iterable (front to rear)"""
-        return iter(self._items)
+        """Make deque iterable (front to rear), failing fast on mutation"""
+        return _fail_fast(self, self._items)
     
     def __len__(self):
         """Support len() function"""
@@ -344,6 +395,7 @@ class CircularBuffer:
         self._buffer = [None] * capacity
         self._capacity = capacity
         self._size = 0
+        self._modcount = 0  # bumped on every mutation for fail-fast iterators
         self._front = 0
         self._rear = 0
     
@@ -357,6 +409,7 @@ class CircularBuffer:
         
         self._buffer[self._rear] = item
         self._rear = (self._rear + 1) % self._capacity
+        self._modcount += 1
         return f"Added: {item}"
     
     def dequeue(self):
@@ -368,6 +421,7 @@ class CircularBuffer:
         self._buffer[self._front] = None
         self._front = (self._front + 1) % self._capacity
         self._size -= 1
+        self._modcount += 1
         return item
     
     def front(self):
@@ -404,9 +458,16 @@ class CircularBuffer:
             index = (index + 1) % self._capacity
         return result
     
+    def snapshot(self):
+        """Return a stable copy of the items in iteration order (oldest first)"""
+        return self.to_list()
+    
     def __iter__(self):
-        """Make buffer iterable"""
-        return iter(self.to_list())
+        """Make buffer iterable (oldest first) without copying, failing fast on mutation"""
+        # Capture the layout together with the modification count
+        buffer, front, capacity, size = self._buffer, self._front, self._capacity, self._size
+        return _fail_fast(self, (buffer[(front + offset) % capacity]
+                                 for offset in range(size)))
     
     def __len__(self):
         """Support len() function"""
@@ -421,6 +482,292 @@ class CircularBuffer:
         return f"CircularBuffer(capacity={self._capacity}, items={self.to_list()})"
 
 
+# ============================================================================
+# BOUNDED QUEUE IMPLEMENTATION (Overflow Policies)
+# ============================================================================
+
+class BoundedQueue(Queue):
+    """A FIFO queue with a fixed capacity and a selectable overflow policy
+
+    Policies:
+        "reject"       - raise IndexError when the queue is full
+        "drop_newest"  - discard the item being enqueued
+        "drop_oldest"  - discard the front item to make room
+        "block"        - wait for space (requires thread_safe=True)
+
+    Producers can throttle through watermark callbacks: on_high(queue) is
+    called when the size rises to high_watermark, and on_low(queue) once it
+    has fallen back to low_watermark.
+    """
+    
+    POLICIES = ("reject", "drop_newest", "drop_oldest", "block")
+    
+    def __init__(self, capacity, policy="reject", thread_safe=False,
+                 high_watermark=None, low_watermark=None,
+                 on_high=None, on_low=None):
+        """Initialize empty bounded queue"""
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown overflow policy: {policy!r}")
+        if policy == "block" and not thread_safe:
+            raise ValueError("The 'block' policy requires thread_safe=True")
+        
+        if high_watermark is None:
+            high_watermark = capacity
+        if low_watermark is None:
+            low_watermark = high_watermark // 2
+        if not 0 <= low_watermark < high_watermark <= capacity:
+            raise ValueError("Watermarks must satisfy 0 <= low < high <= capacity")
+        
+        super().__init__()
+        self._items = deque()  # O(1) removal from the front
+        self._capacity = capacity
+        self._policy = policy
+        self._high_watermark = high_watermark
+        self._low_watermark = low_watermark
+        self._on_high = on_high
+        self._on_low = on_low
+        self._above_high = False
+        
+        # Drop counters for alerting
+        self._rejected = 0
+        self._dropped_newest = 0
+        self._dropped_oldest = 0
+        
+        # Reentrant so watermark callbacks may inspect the queue
+        self._lock = threading.Condition(threading.RLock()) if thread_safe else None
+    
+    def enqueue(self, item, timeout=None):
+        """Add item to the rear, applying the overflow policy when full"""
+        if self._lock is None:
+            return self._enqueue(item, timeout)
+        with self._lock:
+            return self._enqueue(item, timeout)
+    
+    def _enqueue(self, item, timeout):
+        """Enqueue without locking (caller holds the lock if any)"""
+        if self._size >= self._capacity:
+            if self._policy == "reject":
+                self._rejected += 1
+                raise IndexError("Cannot enqueue to full queue")
+            if self._policy == "drop_newest":
+                self._dropped_newest += 1
+                return f"Dropped: {item}"
+            if self._policy == "drop_oldest":
+                self._items.popleft()
+                self._size -= 1
+                self._modcount += 1
+                self._dropped_oldest += 1
+            else:
+                # "block": wait until a consumer makes room
+                if not self._lock.wait_for(lambda: self._size < self._capacity, timeout):
+                    raise TimeoutError("Timed out waiting for queue space")
+        
+        self._items.append(item)
+        self._size += 1
+        self._modcount += 1
+        self._check_high_watermark()
+        return f"Enqueued: {item}"
+    
+    def dequeue(self):
+        """Remove and return item from the front of the queue"""
+        if self._lock is None:
+            return self._dequeue()
+        with self._lock:
+            item = self._dequeue()
+            self._lock.notify()
+            return item
+    
+    def _dequeue(self):
+        """Dequeue without locking (caller holds the lock if any)"""
+        if self.is_empty():
+            raise IndexError("Cannot dequeue from empty queue")
+        
+        item = self._items.popleft()
+        self._size -= 1
+        self._modcount += 1
+        self._check_low_watermark()
+        return item
+    
+    def clear(self):
+        """Remove all items from the queue"""
+        if self._lock is None:
+            super().clear()
+            self._check_low_watermark()
+            return
+        with self._lock:
+            super().clear()
+            self._check_low_watermark()
+            self._lock.notify_all()
+    
+    def _check_high_watermark(self):
+        """Fire on_high when the size first reaches the high watermark"""
+        if not self._above_high and self._size >= self._high_watermark:
+            self._above_high = True
+            if self._on_high is not None:
+                self._on_high(self)
+    
+    def _check_low_watermark(self):
+        """Fire on_low when the size drains back to the low watermark"""
+        if self._above_high and self._size <= self._low_watermark:
+            self._above_high = False
+            if self._on_low is not None:
+                self._on_low(self)
+    
+    def is_full(self):
+        """Check if the queue is at capacity"""
+        return self._size >= self._capacity
+    
+    def capacity(self):
+        """Return maximum capacity"""
+        return self._capacity
+    
+    def policy(self):
+        """Return the overflow policy name"""
+        return self._policy
+    
+    def is_above_high_watermark(self):
+        """Check if producers should currently be throttled"""
+        return self._above_high
+    
+    def rejected_count(self):
+        """Return the number of enqueues refused by the 'reject' policy"""
+        return self._rejected
+    
+    def dropped_count(self):
+        """Return the total number of items dropped by either drop policy"""
+        return self._dropped_newest + self._dropped_oldest
+    
+    def drop_stats(self):
+        """Return all overflow counters as a dictionary"""
+        return {
+            "rejected": self._rejected,
+            "dropped_newest": self._dropped_newest,
+            "dropped_oldest": self._dropped_oldest,
+        }
+    
+    def to_list(self):
+        """Return a copy of the queue as a list"""
+        return list(self._items)
+    
+    def __str__(self):
+        """Human-readable string representation"""
+        if self.is_empty():
+            return f"BoundedQueue(empty, capacity={self._capacity})"
+        return (f"BoundedQueue(front={self.front()} ... rear={self.rear()}, "
+                f"size={self._size}/{self._capacity})")
+    
+    def __repr__(self):
+        """Developer-friendly representation"""
+        return (f"BoundedQueue(capacity={self._capacity}, policy={self._policy!r}, "
+                f"items={list(self._items)})")
+
+
+# ============================================================================
+# SHARDED QUEUE IMPLEMENTATION (Striped Locks)
+# ============================================================================
+
+class ShardedQueue:
+    """A thread-safe queue split into independently locked deque shards
+
+    A single lock around one queue serializes every producer. Here each
+    shard has its own lock, so producers that land on different shards
+    never contend. Producers pick a shard by hashing a key or, without a
+    key, round-robin. Consumers start at a shard and steal from the others
+    when it is empty.
+
+    Ordering is relaxed FIFO: items that share a key (and so a shard) are
+    dequeued in the order they were enqueued, but there is no global order
+    across shards.
+    """
+    
+    def __init__(self, shards=8):
+        """Initialize empty sharded queue"""
+        if shards <= 0:
+            raise ValueError("Number of shards must be positive")
+        
+        # deque shards: O(1) popleft, where Queue.dequeue is list.pop(0)
+        self._shards = [deque() for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+        # itertools.count is atomic, so the cursors need no lock
+        self._put_cursor = itertools.count()
+        self._get_cursor = itertools.count()
+    
+    def _shard_index(self, key, cursor):
+        """Pick a shard by key hash, or round-robin when key is None"""
+        if key is None:
+            return next(cursor) % len(self._shards)
+        return hash(key) % len(self._shards)
+    
+    def enqueue(self, item, key=None):
+        """Add item to the rear of one shard"""
+        index = self._shard_index(key, self._put_cursor)
+        with self._locks[index]:
+            self._shards[index].append(item)
+        return f"Enqueued: {item}"
+    
+    def dequeue(self, key=None):
+        """Remove and return an item, starting at one shard and stealing from the rest"""
+        count = len(self._shards)
+        start = self._shard_index(key, self._get_cursor)
+        for offset in range(count):
+            index = (start + offset) % count
+            shard = self._shards[index]
+            if not shard:
+                continue  # cheap unlocked check before taking the lock
+            with self._locks[index]:
+                if shard:
+                    return shard.popleft()
+        raise IndexError("Cannot dequeue from empty queue")
+    
+    def snapshot(self):
+        """Return a stable copy of all items, shard by shard"""
+        items = []
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                items.extend(shard)
+        return items
+    
+    def __iter__(self):
+        """Iterate shard by shard; each shard fails fast on mutation"""
+        return itertools.chain.from_iterable(self._shards)
+    
+    def shard_count(self):
+        """Return the number of shards"""
+        return len(self._shards)
+    
+    def shard_sizes(self):
+        """Return the size of each shard"""
+        return [len(shard) for shard in self._shards]
+    
+    def is_empty(self):
+        """Check if every shard is empty"""
+        return not any(self._shards)
+    
+    def size(self):
+        """Return the total number of items across shards"""
+        return sum(len(shard) for shard in self._shards)
+    
+    def clear(self):
+        """Remove all items from every shard"""
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                shard.clear()
+    
+    def __len__(self):
+        """Support len() function"""
+        return self.size()
+    
+    def __str__(self):
+        """Human-readable string representation"""
+        return f"ShardedQueue(shards={len(self._shards)}, size={self.size()})"
+    
+    def __repr__(self):
+        """Developer-friendly representation"""
+        return f"ShardedQueue({[list(shard) for shard in self._shards]})"
+
+
 # ============================================================================
 # DEMONSTRATION FUNCTIONS
 # ============================================================================
@@ -566,6 +913,99 @@ def demonstrate_circular_buffer():
         print(f"  Removed: {item}, Buffer: {cb}")
 
 
+def demonstrate_bounded_queue():
+    """Demonstrate bounded queue overflow policies"""
+    print("\n=== BOUNDED QUEUE DEMONSTRATION ===")
+    
+    for policy in ("reject", "drop_newest", "drop_oldest"):
+        bq = BoundedQueue(3, policy=policy)
+        print(f"Policy '{policy}':")
+        for i in range(5):
+            try:
+                print(f"  {bq.enqueue(f'job_{i}')}")
+            except IndexError as e:
+                print(f"  Rejected job_{i}: {e}")
+        print(f"  Queue: {bq.to_list()}, counters: {bq.drop_stats()}")
+    
+    # Watermarks let producers throttle before the queue fills up
+    print(f"\nWatermark signalling (high=4, low=1):")
+    bq = BoundedQueue(5, high_watermark=4, low_watermark=1,
+                      on_high=lambda q: print(f"  HIGH watermark reached at size {len(q)}"),
+                      on_low=lambda q: print(f"  LOW watermark reached at size {len(q)}"))
+    for i in range(4):
+        bq.enqueue(i)
+    while not bq.is_empty():
+        bq.dequeue()
+    
+    # Blocking policy with a producer thread and a slower consumer
+    print(f"\nBlocking policy with a producer thread:")
+    bq = BoundedQueue(2, policy="block", thread_safe=True)
+    producer = threading.Thread(target=lambda: [bq.enqueue(i) for i in range(6)])
+    producer.start()
+    consumed = []
+    while len(consumed) < 6:
+        if not bq.is_empty():
+            consumed.append(bq.dequeue())
+        else:
+            time.sleep(0.001)
+    producer.join()
+    print(f"  Consumed in order: {consumed}")
+
+
+def demonstrate_sharded_queue():
+    """Demonstrate sharded queue with several producer threads"""
+    print("\n=== SHARDED QUEUE DEMONSTRATION ===")
+    
+    sq = ShardedQueue(shards=4)
+    
+    def produce(producer_id):
+        for i in range(5):
+            sq.enqueue(f"p{producer_id}_{i}", key=producer_id)
+    
+    producers = [threading.Thread(target=produce, args=(pid,)) for pid in range(4)]
+    for thread in producers:
+        thread.start()
+    for thread in producers:
+        thread.join()
+    
+    print(f"Sharded queue after 4 producers: {sq}")
+    print(f"Shard sizes: {sq.shard_sizes()}")
+    
+    # Items sharing a key stay in order (relaxed FIFO)
+    print(f"Draining producer 0's shard: {[sq.dequeue(key=0) for _ in range(5)]}")
+    drained = []
+    while not sq.is_empty():
+        drained.append(sq.dequeue())
+    print(f"Remaining items (stolen across shards): {len(drained)}")
+
+
+def demonstrate_fail_fast_iterators():
+    """Demonstrate lazy iterators that detect mutation"""
+    print("\n=== FAIL-FAST ITERATOR DEMONSTRATION ===")
+    
+    q = Queue()
+    for i in range(4):
+        q.enqueue(i)
+    
+    print(f"Dequeuing while iterating over {q!r}:")
+    try:
+        for item in q:
+            print(f"  Visiting {item}")
+            q.dequeue()
+    except RuntimeError as e:
+        print(f"  RuntimeError: {e}")
+    
+    # snapshot() gives a stable copy that is safe to iterate while mutating
+    print(f"Draining a snapshot instead:")
+    for item in q.snapshot():
+        print(f"  Visiting {item}, dequeued {q.dequeue()}")
+    
+    cb = CircularBuffer(3)
+    for i in range(5):
+        cb.enqueue(i)
+    print(f"Lazy walk over {cb}: {[item for item in cb]}")
+
+
 def container_comparison():
     """Compare different container behaviors"""
     print("\n=== CONTAINER COMPARISON ===")
@@ -660,6 +1100,9 @@ def main():
     demonstrate_deque()
     demonstrate_priority_queue()
     demonstrate_circular_buffer()
+    demonstrate_bounded_queue()
+    demonstrate_sharded_queue()
+    demonstrate_fail_fast_iterators()
     container_comparison()
     practical_examples()
     
@@ -672,8 +1115,10 @@ def main():
     print(f"   3. Deque - Double-ended queue operations")
     print(f"   4. Priority Queue - Items processed by priority")
     print(f"   5. Circular Buffer - Fixed-size with overwriting")
-    print(f"   6. Iterator protocol implementation")
-    print(f"   7. Container protocol (__len__, __contains__)")
+    print(f"   6. Bounded Queue - Overflow policies and watermarks")
+    print(f"   7. Sharded Queue - Striped locks for many threads")
+    print(f"   8. Fail-fast iterator protocol implementation")
+    print(f"   9. Container protocol (__len__, __contains__)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,293 @@
+"""
+Exact Matrix Algebra - Week 2
+CSC 242 - Advanced Class Concepts
+
+This file builds an exact matrix class on top of operator_overloading.Fraction:
+- Determinant, solve, inverse and rank with no rounding error
+- Bareiss fraction-free elimination on integer-scaled rows
+- Operator overloading for matrix equality and products
+
+Eliminating over Fractions reduces every entry at every step. Instead,
+each row is multiplied by the LCM of its denominators to get an integer
+matrix, and Bareiss elimination keeps every intermediate an exact integer
+(a minor of the matrix). Fractions are only formed for the final answer.
+
+Author: CSC 242 Teaching Team
+"""
+
+import math
+import random
+
+from operator_overloading import Fraction
+
+
+def _to_fraction(value):
+    """Convert an int, float or Fraction entry to a Fraction"""
+    return value if isinstance(value, Fraction) else Fraction(value)
+
+
+def _integer_row(row):
+    """Scale a row of Fractions to integers; return (integers, scale)"""
+    scale = 1
+    for entry in row:
+        scale = scale // math.gcd(scale, entry.denominator) * entry.denominator
+    return [entry.numerator * (scale // entry.denominator) for entry in row], scale
+
+
+# ============================================================================
+# EXACT MATRIX CLASS
+# ============================================================================
+
+class ExactMatrix:
+    """An immutable matrix of Fractions with exact linear algebra"""
+
+    def __init__(self, rows):
+        """Initialize from a list of equal-length rows of numbers"""
+        self._rows = [[_to_fraction(entry) for entry in row] for row in rows]
+        if any(len(row) != len(self._rows[0]) for row in self._rows):
+            raise ValueError("All rows must have the same length")
+
+    @classmethod
+    def identity(cls, size):
+        """Return the size x size identity matrix"""
+        return cls([[int(i == j) for j in range(size)] for i in range(size)])
+
+    def shape(self):
+        """Return (rows, columns)"""
+        return len(self._rows), len(self._rows[0]) if self._rows else 0
+
+    def is_square(self):
+        """Check if the matrix is square"""
+        rows, columns = self.shape()
+        return rows == columns
+
+    def to_list(self):
+        """Return a copy of the entries as a list of rows"""
+        return [row.copy() for row in self._rows]
+
+    # Fraction-free elimination kernels
+    def _solve_columns(self, right):
+        """Solve A X = right fraction-free; return (det, integer columns of det * X)
+
+        Each augmented row [A_i | right_i] is scaled to integers on its own,
+        which does not change the solution. Bareiss forward elimination
+        leaves an upper-triangular U whose last pivot is det, and det * X
+        is an integer matrix (Cramer's rule), so back substitution with
+        exact integer division finishes without any Fractions.
+        """
+        if not self.is_square():
+            raise ValueError("Matrix must be square")
+        size = len(self._rows)
+        matrix = [_integer_row(row + [_to_fraction(value) for value in extra])[0]
+                  for row, extra in zip(self._rows, right)]
+        width = len(matrix[0]) if matrix else 0
+
+        previous = 1
+        for k in range(size):
+            if matrix[k][k] == 0:
+                swap = next((r for r in range(k + 1, size) if matrix[r][k] != 0), None)
+                if swap is None:
+                    raise ValueError("Matrix is singular")
+                matrix[k], matrix[swap] = matrix[swap], matrix[k]
+            pivot_row = matrix[k]
+            pivot = pivot_row[k]
+            tail = pivot_row[k + 1:]
+            for i in range(k + 1, size):
+                row = matrix[i]
+                factor = row[k]
+                row[k + 1:] = [(pivot * a - factor * p) // previous
+                               for a, p in zip(row[k + 1:], tail)]
+                row[k] = 0
+            previous = pivot
+
+        columns = []
+        for c in range(size, width):
+            scaled = [0] * size
+            for i in range(size - 1, -1, -1):
+                row = matrix[i]
+                total = previous * row[c]
+                for j in range(i + 1, size):
+                    total -= row[j] * scaled[j]
+                scaled[i] = total // row[i]
+            columns.append(scaled)
+        return previous, columns
+
+    def determinant(self):
+        """Return the exact determinant as a Fraction (Bareiss elimination)"""
+        if not self.is_square():
+            raise ValueError("Determinant requires a square matrix")
+        matrix = []
+        total_scale = 1
+        for row in self._rows:
+            integers, scale = _integer_row(row)
+            matrix.append(integers)
+            total_scale *= scale
+        size = len(matrix)
+
+        previous = 1
+        sign = 1
+        for k in range(size - 1):
+            if matrix[k][k] == 0:
+                swap = next((r for r in range(k + 1, size) if matrix[r][k] != 0), None)
+                if swap is None:
+                    return Fraction(0)
+                matrix[k], matrix[swap] = matrix[swap], matrix[k]
+                sign = -sign
+            pivot_row = matrix[k]
+            pivot = pivot_row[k]
+            tail = pivot_row[k + 1:]
+            for i in range(k + 1, size):
+                row = matrix[i]
+                factor = row[k]
+                row[k + 1:] = [(pivot * a - factor * p) // previous
+                               for a, p in zip(row[k + 1:], tail)]
+            previous = pivot
+        last = matrix[size - 1][size - 1] if size else 1
+        return Fraction(sign * last, total_scale)
+
+    def rank(self):
+        """Return the rank (fraction-free row echelon form)"""
+        matrix = [_integer_row(row)[0] for row in self._rows]
+        rows, columns = self.shape()
+        rank = 0
+        previous = 1
+        for c in range(columns):
+            pivot_index = next((r for r in range(rank, rows) if matrix[r][c] != 0), None)
+            if pivot_index is None:
+                continue
+            matrix[rank], matrix[pivot_index] = matrix[pivot_index], matrix[rank]
+            pivot_row = matrix[rank]
+            pivot = pivot_row[c]
+            tail = pivot_row[c + 1:]
+            for i in range(rank + 1, rows):
+                row = matrix[i]
+                factor = row[c]
+                row[c + 1:] = [(pivot * a - factor * p) // previous
+                               for a, p in zip(row[c + 1:], tail)]
+                row[c] = 0
+            previous = pivot
+            rank += 1
+        return rank
+
+    def solve(self, b):
+        """Solve A x = b exactly; b is a sequence of numbers, returns a list of Fractions"""
+        b = [_to_fraction(value) for value in b]
+        if len(b) != len(self._rows):
+            raise ValueError("Right-hand side length must match the number of rows")
+        det, (column,) = self._solve_columns([[value] for value in b])
+        return [Fraction(entry, det) for entry in column]
+
+    def inverse(self):
+        """Return the exact inverse as a new ExactMatrix"""
+        size = len(self._rows)
+        identity = [[int(i == j) for j in range(size)] for i in range(size)]
+        det, columns = self._solve_columns(identity)
+        return ExactMatrix([[Fraction(column[i], det) for column in columns]
+                            for i in range(size)])
+
+    # Operator Overloading
+    def __eq__(self, other):
+        """Equality comparison"""
+        if isinstance(other, ExactMatrix):
+            return self._rows == other._rows
+        return NotImplemented
+
+    def __mul__(self, other):
+        """Matrix product or scalar multiplication"""
+        if isinstance(other, ExactMatrix):
+            rows, inner = self.shape()
+            if inner != other.shape()[0]:
+                raise ValueError("Matrix shapes do not align")
+            columns = list(zip(*other._rows))
+            return ExactMatrix([[Fraction.dot(row, column) for column in columns]
+                                for row in self._rows])
+        elif isinstance(other, (int, float, Fraction)):
+            return ExactMatrix([[entry * other for entry in row] for row in self._rows])
+        return NotImplemented
+
+    def __rmul__(self, other):
+        """Right scalar multiplication"""
+        if isinstance(other, (int, float, Fraction)):
+            return self.__mul__(other)
+        return NotImplemented
+
+    def __getitem__(self, index):
+        """matrix[i, j] returns an entry; matrix[i] returns a copy of a row"""
+        if isinstance(index, tuple):
+            i, j = index
+            return self._rows[i][j]
+        return self._rows[index].copy()
+
+    def __len__(self):
+        """Number of rows"""
+        return len(self._rows)
+
+    def __str__(self):
+        """Human-readable representation"""
+        return "\n".join("[" + ", ".join(str(entry) for entry in row) + "]" for row in self._rows)
+
+    def __repr__(self):
+        """Developer representation"""
+        return f"ExactMatrix({[[str(entry) for entry in row] for row in self._rows]})"
+
+
+# ============================================================================
+# DEMONSTRATION FUNCTIONS
+# ============================================================================
+
+def demonstrate_exact_matrix():
+    """Show exact determinant, solve, inverse and rank"""
+    print("=== EXACT MATRIX DEMONSTRATION ===")
+
+    a = ExactMatrix([[Fraction(1, 2), 2, 0],
+                     [3, Fraction(-1, 3), 1],
+                     [0, 4, Fraction(5, 7)]])
+    print(f"A =\n{a}")
+    print(f"det(A) = {a.determinant()}")
+
+    b = [1, Fraction(2, 3), -1]
+    x = a.solve(b)
+    print(f"solve(A, {[str(v) for v in b]}) = {[str(v) for v in x]}")
+    check = [Fraction.dot(row, x) for row in a.to_list()]
+    assert check == b, "solve() must satisfy A x == b exactly"
+    print("A x == b: True")
+
+    inverse = a.inverse()
+    assert a * inverse == ExactMatrix.identity(3), "A * inverse(A) must be the identity"
+    print("A * inverse(A) == I: True")
+
+    singular = ExactMatrix([[1, 2, 3], [2, 4, 6], [1, 0, 1]])
+    assert singular.rank() == 2 and singular.determinant() == 0, "singular matrix misjudged"
+    print(f"rank of a singular 3x3 matrix: {singular.rank()}")
+    print(f"det of the singular matrix: {singular.determinant()}")
+
+    # Larger random system: exact round trip
+    rng = random.Random(242)
+    size = 12
+    m = ExactMatrix([[Fraction(rng.randint(-9, 9), rng.randint(1, 9)) for _ in range(size)]
+                     for _ in range(size)])
+    rhs = [rng.randint(-9, 9) for _ in range(size)]
+    solution = m.solve(rhs)
+    assert [Fraction.dot(row, solution) for row in m.to_list()] == rhs, \
+        "random system must round-trip exactly"
+    print(f"{size}x{size} random system solved exactly: True")
+
+
+def main():
+    """Run all exact matrix demonstrations"""
+    print("🧮 EXACT MATRIX ALGEBRA - CSC 242 Week 2")
+    print("=" * 60)
+
+    demonstrate_exact_matrix()
+
+    print(f"\n" + "=" * 60)
+    print("✅ All exact matrix demonstrations complete!")
+
+    print(f"\n💡 Key Concepts Demonstrated:")
+    print(f"   1. Composition: a matrix class built on Fraction")
+    print(f"   2. Fraction-free (Bareiss) elimination")
+    print(f"   3. Operator overloading for matrices (*, ==, [])")
+
+
+if __name__ == "__main__":
+    main()
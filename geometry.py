@@ -0,0 +1,337 @@
+"""
+Computational Geometry - Week 2
+CSC 242 - Advanced Class Concepts
+
+This file builds O(n log n) geometry routines over sets of 2D points:
+- Convex hull (Andrew's monotone chain)
+- Closest pair of points (divide and conquer)
+- Polygon area (shoelace formula) and perimeter
+- Point-in-polygon tests, one at a time or batched
+
+Points may be a list of operator_overloading.Vector objects, week2.Point
+objects or (x, y) tuples, or a VectorArray. The routines use the same
+cross product as Vector.cross, but work on plain (x, y) tuples so the inner
+loops do not create a Vector per step. Batch queries on a VectorArray run
+as NumPy calls.
+
+Author: CSC 242 Teaching Team
+"""
+
+import itertools
+import math
+import random
+from operator import itemgetter
+
+from operator_overloading import Vector, VectorArray, np
+
+
+def _as_tuples(points):
+    """Adapter: return a list of (x, y) floats for Vectors, Points, tuples or a VectorArray"""
+    if isinstance(points, VectorArray):
+        return list(zip(points.x.tolist(), points.y.tolist()))
+    return [(float(p[0]), float(p[1])) if isinstance(p, tuple) else (p.x, p.y)
+            for p in points]
+
+
+def _edges(vertices):
+    """Consecutive vertex pairs of a closed polygon"""
+    return zip(vertices, vertices[1:] + vertices[:1])
+
+
+# ============================================================================
+# CONVEX HULL
+# ============================================================================
+
+def convex_hull(points):
+    """Return the convex hull as a list of Vectors in counterclockwise order
+
+    Andrew's monotone chain: sort once (O(n log n)), then build the lower
+    and upper chains in one pass each, popping every point that does not
+    make a left turn. Collinear boundary points are left out.
+    """
+    ordered = sorted(set(_as_tuples(points)))
+    if len(ordered) <= 2:
+        return [Vector(x, y) for x, y in ordered]
+
+    def chain(sequence):
+        hull = []
+        for px, py in sequence:
+            while len(hull) >= 2:
+                (ox, oy), (ax, ay) = hull[-2], hull[-1]
+                if (ax - ox) * (py - oy) - (ay - oy) * (px - ox) > 0:
+                    break
+                hull.pop()
+            hull.append((px, py))
+        return hull
+
+    lower = chain(ordered)
+    upper = chain(reversed(ordered))
+    return [Vector(x, y) for x, y in lower[:-1] + upper[:-1]]
+
+
+# ============================================================================
+# CLOSEST PAIR
+# ============================================================================
+
+def _closest(by_x):
+    """Closest pair of a list sorted by x: return (squared distance, a, b, list sorted by y)"""
+    n = len(by_x)
+    if n <= 3:
+        best = (math.inf, None, None)
+        for a, b in itertools.combinations(by_x, 2):
+            d2 = (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2
+            if d2 < best[0]:
+                best = (d2, a, b)
+        return best + (sorted(by_x, key=itemgetter(1)),)
+
+    middle = n // 2
+    middle_x = by_x[middle][0]
+    left = _closest(by_x[:middle])
+    right = _closest(by_x[middle:])
+    best = min(left[:3], right[:3], key=itemgetter(0))
+    # Sorting two sorted runs is a linear merge for Timsort
+    by_y = sorted(left[3] + right[3], key=itemgetter(1))
+
+    # Only points within sqrt(best) of the dividing line can do better,
+    # and each needs comparing with at most the next 7 by y
+    strip = [p for p in by_y if (p[0] - middle_x) ** 2 < best[0]]
+    for i, a in enumerate(strip):
+        for b in strip[i + 1:i + 8]:
+            dy2 = (b[1] - a[1]) ** 2
+            if dy2 >= best[0]:
+                break
+            d2 = (a[0] - b[0]) ** 2 + dy2
+            if d2 < best[0]:
+                best = (d2, a, b)
+    return best + (by_y,)
+
+
+def closest_pair(points):
+    """Return (distance, a, b) for the two closest points, a and b as Vectors (O(n log n))"""
+    coordinates = _as_tuples(points)
+    if len(coordinates) < 2:
+        raise ValueError("Closest pair requires at least two points")
+    d2, a, b, _ = _closest(sorted(coordinates))
+    return math.sqrt(d2), Vector(*a), Vector(*b)
+
+
+# ============================================================================
+# POLYGONS
+# ============================================================================
+
+def signed_area(polygon):
+    """Shoelace formula: positive for counterclockwise vertex order"""
+    if isinstance(polygon, VectorArray):
+        x, y = polygon.x, polygon.y
+        return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))
+    vertices = _as_tuples(polygon)
+    return 0.5 * math.fsum(x1 * y2 - x2 * y1 for (x1, y1), (x2, y2) in _edges(vertices))
+
+
+def polygon_area(polygon):
+    """Area enclosed by a simple polygon given by its vertices in order"""
+    return abs(signed_area(polygon))
+
+
+def polygon_perimeter(polygon):
+    """Total length of the closed polygon's edges"""
+    if isinstance(polygon, VectorArray):
+        x, y = polygon.x, polygon.y
+        return float(np.hypot(np.roll(x, -1) - x, np.roll(y, -1) - y).sum())
+    vertices = _as_tuples(polygon)
+    return math.fsum(math.hypot(x2 - x1, y2 - y1) for (x1, y1), (x2, y2) in _edges(vertices))
+
+
+def _inside(x, y, edges):
+    """Crossing-number test against precomputed edges; points on an edge are inside"""
+    inside = False
+    for (x1, y1), (x2, y2) in edges:
+        if ((x2 - x1) * (y - y1) == (y2 - y1) * (x - x1)
+                and min(x1, x2) <= x <= max(x1, x2) and min(y1, y2) <= y <= max(y1, y2)):
+            return True
+        if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+            inside = not inside
+    return inside
+
+
+def point_in_polygon(point, polygon):
+    """Check if a point lies inside (or on the boundary of) a simple polygon"""
+    (x, y), = _as_tuples([point])
+    return _inside(x, y, list(_edges(_as_tuples(polygon))))
+
+
+def points_in_polygon(points, polygon):
+    """Batch point-in-polygon test
+
+    For a VectorArray of query points this runs one vectorized NumPy
+    pass per polygon edge and returns a boolean mask; for a list it
+    returns a list of bools.
+    """
+    edges = list(_edges(_as_tuples(polygon)))
+    if not isinstance(points, VectorArray):
+        return [_inside(x, y, edges) for x, y in _as_tuples(points)]
+
+    x, y = points.x, points.y
+    inside = np.zeros(len(points), dtype=bool)
+    boundary = np.zeros(len(points), dtype=bool)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for (x1, y1), (x2, y2) in edges:
+            boundary |= (((x2 - x1) * (y - y1) == (y2 - y1) * (x - x1))
+                         & (x >= min(x1, x2)) & (x <= max(x1, x2))
+                         & (y >= min(y1, y2)) & (y <= max(y1, y2)))
+            if y1 != y2:
+                crosses = ((y1 > y) != (y2 > y)) & (x < x1 + (y - y1) * (x2 - x1) / (y2 - y1))
+                inside ^= crosses
+    return inside | boundary
+
+
+# ============================================================================
+# BRUTE-FORCE REFERENCES (for validation)
+# ============================================================================
+
+def _brute_hull_vertices(points):
+    """O(n^3): endpoints of every segment with all other points left of it or on it
+
+    A collinear point beyond either end disqualifies a segment, so only
+    maximal hull edges pass and their endpoints are exactly the corners.
+    """
+    unique = sorted(set(_as_tuples(points)))
+    vertices = set()
+    for (ax, ay), (bx, by) in itertools.permutations(unique, 2):
+        hull_edge = True
+        for px, py in unique:
+            cross = (bx - ax) * (py - ay) - (by - ay) * (px - ax)
+            between = min(ax, bx) <= px <= max(ax, bx) and min(ay, by) <= py <= max(ay, by)
+            if cross < 0 or (cross == 0 and not between):
+                hull_edge = False
+                break
+        if hull_edge:
+            vertices.update([(ax, ay), (bx, by)])
+    return vertices
+
+
+def _brute_closest(points):
+    """O(n^2) closest pair distance (same squared-distance arithmetic as closest_pair)"""
+    coordinates = _as_tuples(points)
+    return math.sqrt(min((a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2
+                         for a, b in itertools.combinations(coordinates, 2)))
+
+
+def _winding_inside(point, polygon):
+    """Inside test by summing the angles subtended by each edge (winding number)"""
+    px, py = _as_tuples([point])[0]
+    total = 0.0
+    for (x1, y1), (x2, y2) in _edges(_as_tuples(polygon)):
+        a1 = math.atan2(y1 - py, x1 - px)
+        a2 = math.atan2(y2 - py, x2 - px)
+        delta = a2 - a1
+        if delta > math.pi:
+            delta -= 2 * math.pi
+        elif delta < -math.pi:
+            delta += 2 * math.pi
+        total += delta
+    return abs(total) > math.pi
+
+
+# ============================================================================
+# DEMONSTRATION FUNCTIONS
+# ============================================================================
+
+def _random_star_polygon(rng, vertices, center=(0.0, 0.0)):
+    """A random simple (star-shaped, usually non-convex) polygon"""
+    angles = sorted(rng.uniform(0, 2 * math.pi) for _ in range(vertices))
+    return [Vector(center[0] + r * math.cos(a), center[1] + r * math.sin(a))
+            for a, r in ((a, rng.uniform(0.3, 1.0)) for a in angles)]
+
+
+def demonstrate_convex_hull():
+    """Hull of random points, checked against an O(n^3) brute force"""
+    print("=== CONVEX HULL ===")
+    square = [Vector(0, 0), Vector(2, 0), Vector(2, 2), Vector(0, 2), Vector(1, 1), Vector(1, 0)]
+    print(f"Hull of a square with interior and edge points: {[str(v) for v in convex_hull(square)]}")
+
+    rng = random.Random(242)
+    matches = 0
+    trials = 20
+    for _ in range(trials):
+        points = [(rng.randint(-20, 20), rng.randint(-20, 20)) for _ in range(40)]
+        hull = convex_hull(points)
+        matches += {(v.x, v.y) for v in hull} == _brute_hull_vertices(points)
+    assert matches == trials, f"hull disagrees with brute force on {trials - matches} sets"
+    print(f"Monotone chain matches brute force on {matches}/{trials} random integer point sets")
+
+
+def demonstrate_closest_pair():
+    """Closest pair checked against an O(n^2) scan"""
+    print("\n=== CLOSEST PAIR ===")
+    rng = random.Random(242)
+    matches = 0
+    trials = 20
+    for trial in range(trials):
+        points = [Vector(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(300)]
+        if trial % 2:
+            points.append(points[rng.randrange(len(points))])  # exact duplicate
+        distance, a, b = closest_pair(points)
+        matches += distance == _brute_closest(points) and math.isclose(distance, abs(a - b))
+    assert matches == trials, f"closest pair disagrees with brute force on {trials - matches} sets"
+    print(f"Divide and conquer matches brute force on {matches}/{trials} random sets")
+    if np is not None:
+        columns = VectorArray.from_vectors(points)
+        assert closest_pair(columns)[0] == closest_pair(points)[0], "VectorArray input disagrees"
+        print("Same answer from a VectorArray")
+
+
+def demonstrate_polygons():
+    """Area, perimeter and point-in-polygon checks"""
+    print("\n=== POLYGONS ===")
+    rectangle = [Vector(0, 0), Vector(4, 0), Vector(4, 3), Vector(0, 3)]
+    print(f"4x3 rectangle: area = {polygon_area(rectangle)}, perimeter = {polygon_perimeter(rectangle)}")
+    print(f"Clockwise order gives signed area {signed_area(rectangle[::-1])}")
+
+    rng = random.Random(242)
+    polygon = _random_star_polygon(rng, 30)
+    # Fan triangulation from the star centre, built from Vector.cross
+    fan = 0.5 * sum(a.cross(b) for a, b in _edges(polygon))
+    print(f"Star polygon shoelace area {polygon_area(polygon):.6f}, "
+          f"fan of Vector.cross {abs(fan):.6f}")
+
+    queries = [Vector(rng.uniform(-1, 1), rng.uniform(-1, 1)) for _ in range(2_000)]
+    single = [point_in_polygon(q, polygon) for q in queries]
+    reference = [_winding_inside(q, polygon) for q in queries]
+    batch = points_in_polygon(queries, polygon)
+    agreeing = sum(s == r for s, r in zip(single, reference))
+    assert agreeing == len(queries), \
+        f"crossing and winding numbers disagree on {len(queries) - agreeing} points"
+    assert batch == single, "batch list query disagrees with point_in_polygon"
+    print(f"Crossing number agrees with winding number on "
+          f"{agreeing}/{len(queries)} points ({sum(single)} inside)")
+    print("Batch list query agrees")
+    if np is not None:
+        mask = points_in_polygon(VectorArray.from_vectors(queries), polygon)
+        assert mask.tolist() == single, "VectorArray mask disagrees with point_in_polygon"
+        print("Batch VectorArray mask agrees")
+    print(f"Vertex and edge midpoint count as inside: "
+          f"{point_in_polygon(rectangle[2], rectangle)}, {point_in_polygon((2, 0), rectangle)}")
+
+
+def main():
+    """Run all computational geometry demonstrations"""
+    print("📐 COMPUTATIONAL GEOMETRY - CSC 242 Week 2")
+    print("=" * 60)
+
+    demonstrate_convex_hull()
+    demonstrate_closest_pair()
+    demonstrate_polygons()
+
+    print(f"\n" + "=" * 60)
+    print("✅ All computational geometry demonstrations complete!")
+
+    print(f"\n💡 Key Concepts Demonstrated:")
+    print(f"   1. Cross products for orientation tests")
+    print(f"   2. Sorting plus a linear pass (monotone chain)")
+    print(f"   3. Divide and conquer (closest pair)")
+    print(f"   4. Validating fast algorithms against brute force")
+
+
+if __name__ == "__main__":
+    main()
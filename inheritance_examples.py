@@ -7,10 +7,222 @@ This file demonstrates various inheritance patterns and concepts including:
 - Method overriding
 - Constructor chaining with super()
 - Multiple inheritance scenarios
+- Pluggable construction event sinks and silent bulk creation
+- A thread-safe species registry of created and live instances
 
 Author: CSC 242 Teaching Team
 """
 
+import itertools
+import random
+import sys
+import threading
+import weakref
+from collections import Counter, namedtuple
+
+
+# ============================================================================
+# CONSTRUCTION EVENT SINKS
+# ============================================================================
+
+class CreationEvent(namedtuple("CreationEvent", "species count total")):
+    """count animals of one species were created, bringing the total to total"""
+    
+    __slots__ = ()
+    
+    def __str__(self):
+        """The log line printed for this event"""
+        if self.count == 1:
+            return f"🐾 Created {self.species} (Total animals: {self.total})"
+        return f"🐾 Created {self.count} {self.species} (Total animals: {self.total})"
+
+
+class PrintSink:
+    """Print every event to the terminal (the default sink)"""
+    
+    def emit(self, event):
+        """Print one event"""
+        print(event)
+
+
+class NullSink:
+    """Discard every event"""
+    
+    def emit(self, event):
+        """Ignore one event"""
+
+
+class ListSink:
+    """Keep events in memory for later inspection"""
+    
+    def __init__(self):
+        """Initialize an empty event buffer"""
+        self.events = []
+    
+    def emit(self, event):
+        """Append one event to the buffer"""
+        self.events.append(event)
+    
+    def clear(self):
+        """Drop all buffered events"""
+        self.events.clear()
+
+
+class BatchedFileSink:
+    """Append events to a log file, writing batch_size lines at a time
+
+    Events are buffered in memory and written in one call per batch;
+    call flush() or close() (or use the sink as a context manager) to
+    write the final partial batch. Safe to share between threads.
+    """
+    
+    def __init__(self, path, batch_size=10_000):
+        """Open path for appending and start an empty batch"""
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        self.path = path
+        self.batch_size = batch_size
+        self._buffer = []
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8")
+    
+    def emit(self, event):
+        """Buffer one event, writing the batch once it is full"""
+        with self._lock:
+            self._buffer.append(event)
+            if len(self._buffer) >= self.batch_size:
+                self._write()
+    
+    def _write(self):
+        """Write and clear the buffer (caller holds the lock)"""
+        if self._buffer:
+            self._file.write("".join(f"{event}\n" for event in self._buffer))
+            self._buffer.clear()
+    
+    def flush(self):
+        """Write any buffered events and flush the file"""
+        with self._lock:
+            self._write()
+            self._file.flush()
+    
+    def close(self):
+        """Flush and close the log file"""
+        self.flush()
+        self._file.close()
+    
+    def __enter__(self):
+        """Context manager entry: the sink itself"""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Context manager exit: flush and close the file"""
+        self.close()
+
+
+# ============================================================================
+# THREAD-SAFE SPECIES REGISTRY
+# ============================================================================
+
+class SpeciesRegistry:
+    """Thread-safe created and live instance counts per class
+
+    Every class gets a [created, live] counter cell guarded by one of
+    several shard locks (picked by hashing the class), so threads building
+    different species rarely share a lock. live_count(cls) and
+    created_count(cls) are single dictionary lookups.
+
+    Live counts drop when an instance is garbage collected. Like
+    weakref.finalize, the registry keeps a weak reference with a callback
+    for every instance (so callbacks fire even for instances collected in
+    reference cycles), but without finalize's per-object bookkeeping,
+    which costs about three times as much. A callback runs in whichever
+    thread triggers the collection, possibly one that already holds a
+    shard lock, so the locks are reentrant; the locked sections only do
+    integer arithmetic, so a collection cannot start mid-update.
+    """
+    
+    def __init__(self, shards=8):
+        if shards <= 0:
+            raise ValueError("Number of shards must be positive")
+        self._locks = [threading.RLock() for _ in range(shards)]
+        self._counts = {}  # class -> [created, live, shard lock]
+        self._refs = {}  # id(weakref) -> (weakref, counter cell)
+        self._on_collect = self._collected  # one bound method for every weakref
+        # itertools.count is atomic, so numbering registrations needs no lock
+        self._serial = itertools.count(1)
+    
+    def _cell(self, cls):
+        """Return the [created, live, lock] cell for cls, creating it on first use"""
+        cell = self._counts.get(cls)
+        if cell is None:
+            lock = self._locks[hash(cls) % len(self._locks)]
+            cell = self._counts.setdefault(cls, [0, 0, lock])  # atomic if two threads race
+        return cell
+    
+    def register(self, instance):
+        """Count a new instance, track it until it is collected and return its serial number
+
+        Serial numbers count registrations across all classes from 1.
+        """
+        cell = self._cell(type(instance))
+        with cell[2]:
+            cell[0] += 1
+            cell[1] += 1
+        ref = weakref.ref(instance, self._on_collect)
+        self._refs[id(ref)] = (ref, cell)
+        return next(self._serial)
+    
+    def register_many(self, instances):
+        """Register a batch, taking each shard lock once per class; return the last serial"""
+        by_class = {}
+        for instance in instances:
+            by_class.setdefault(type(instance), []).append(instance)
+        refs, on_collect, serial = self._refs, self._on_collect, self._serial
+        last = None
+        for cls, group in by_class.items():
+            cell = self._cell(cls)
+            with cell[2]:
+                cell[0] += len(group)
+                cell[1] += len(group)
+            for instance in group:
+                ref = weakref.ref(instance, on_collect)
+                refs[id(ref)] = (ref, cell)
+                last = next(serial)
+        return last
+    
+    def _collected(self, ref):
+        """Weakref callback: the instance behind ref was garbage collected"""
+        _, cell = self._refs.pop(id(ref))
+        with cell[2]:
+            cell[1] -= 1
+    
+    def created_count(self, cls):
+        """Number of cls instances ever registered (subclasses not included)"""
+        cell = self._counts.get(cls)
+        return cell[0] if cell is not None else 0
+    
+    def live_count(self, cls):
+        """Number of cls instances still alive (subclasses not included)"""
+        cell = self._counts.get(cls)
+        return cell[1] if cell is not None else 0
+    
+    def total_created(self):
+        """Instances ever registered across all classes"""
+        return sum(cell[0] for cell in list(self._counts.values()))
+    
+    def total_live(self):
+        """Instances still alive across all classes"""
+        return sum(cell[1] for cell in list(self._counts.values()))
+    
+    def snapshot(self):
+        """Return {class name: (created, live)} for every registered class"""
+        return {cls.__name__: (cell[0], cell[1]) for cls, cell in list(self._counts.items())}
+
+
+# Per-thread flag set while Animal.bulk_create builds a batch, so the
+# individual constructors neither register nor emit events
+_construction = threading.local()
+
 
 # ============================================================================
 # BASIC INHERITANCE EXAMPLES
@@ -19,9 +231,12 @@ Author: CSC 242 Teaching Team
 class Animal:
     """Base animal class demonstrating inheritance fundamentals"""
     
-    # Class variable shared by all animals
+    # Class variables shared by all animals
     kingdom = "Animalia"
-    total_animals = 0
+    registry = SpeciesRegistry()
+    
+    # Where construction events go (see CONSTRUCTION EVENT SINKS above)
+    event_sink = PrintSink()
     
     def __init__(self, species="Unknown", language="Silent", age=0):
         """Constructor with default parameters"""
@@ -31,10 +246,40 @@ class Animal:
         self.energy = 100
         self.is_sleeping = False
         
-        # Update class variable
-        Animal.total_animals += 1
-        
-        print(f"🐾 Created {self.species} (Total animals: {Animal.total_animals})")
+        # Count the new animal and report the construction
+        if not getattr(_construction, "quiet", False):
+            total = Animal.registry.register(self)
+            Animal.event_sink.emit(CreationEvent(self.species, 1, total))
+    
+    @staticmethod
+    def set_event_sink(sink):
+        """Route every Animal's construction events to sink; return the previous sink"""
+        previous = Animal.event_sink
+        Animal.event_sink = sink
+        return previous
+    
+    @classmethod
+    def bulk_create(cls, specs):
+        """Build one cls instance per spec, emitting one batched event per species
+
+        Each spec is a tuple of positional arguments or a dict of keyword
+        arguments for cls, e.g. Dog.bulk_create([("Rex", "Lab"), {"name": "Fido"}]).
+        The batch is added to Animal.registry with register_many. Events name
+        animal.species, as single construction does, in first-seen order.
+        """
+        previous = getattr(_construction, "quiet", False)
+        _construction.quiet = True
+        try:
+            animals = [cls(**spec) if isinstance(spec, dict) else cls(*spec) for spec in specs]
+        finally:
+            _construction.quiet = previous
+        if animals:
+            total = Animal.registry.register_many(animals) - len(animals)
+            counts = Counter(animal.species for animal in animals)
+            for species, count in counts.items():
+                total += count
+                Animal.event_sink.emit(CreationEvent(species, count, total))
+        return animals
     
     def speak(self):
         """Basic speaking behavior"""
@@ -142,7 +387,6 @@ class Cat(Animal):
             return f"{self.name} purrs softly while sleeping"
         
         moods = ["Meow!", "Purr...", "Hiss!", "Mrow?"]
-        import random
         mood = random.choice(moods)
         return f"{self.name} says: {mood}"
     
@@ -425,6 +669,78 @@ def demonstrate_multiple_inheritance():
     print(f"\nFinal duck info: {duck.get_info()}")
 
 
+def demonstrate_event_sinks():
+    """Route construction events away from the terminal and build in bulk"""
+    print("\n=== CONSTRUCTION EVENT SINKS ===")
+    
+    sink = ListSink()
+    previous = Animal.set_event_sink(sink)
+    try:
+        Dog("Rex", "Labrador")
+        Cat("Tom", "Gray")
+        dogs = Dog.bulk_create([(f"Dog {i}", "Beagle") for i in range(1_000)])
+        birds = Bird.bulk_create([{"species": "Robin", "wingspan": 30}] * 500)
+    finally:
+        Animal.set_event_sink(previous)
+    
+    assert [event.species for event in sink.events] == ["Dog", "Cat", "Dog", "Robin"], \
+        "bulk events must name animal.species like single construction"
+    print(f"Built {2 + len(dogs) + len(birds)} animals with {len(sink.events)} events:")
+    for event in sink.events:
+        print(f"  {event}")
+    print(f"First bulk dog: {dogs[0]}, last bird: {birds[-1].get_info()}")
+    
+    Animal.set_event_sink(NullSink())
+    Cat("Silent", "Black")
+    Animal.set_event_sink(previous)
+    print(f"NullSink: constructed quietly, total is still counted ({Animal.registry.total_created()})")
+
+
+def demonstrate_species_registry():
+    """Create animals from many threads and check the registry lost nothing"""
+    print("\n=== THREAD-SAFE SPECIES REGISTRY ===")
+    
+    registry = Animal.registry
+    threads, per_thread = 8, 2_000
+    species = (Dog, Cat)
+    created_before = {cls: registry.created_count(cls) for cls in species}
+    live_before = {cls: registry.live_count(cls) for cls in species}
+    survivors = [[] for _ in range(threads)]
+    
+    def worker(kept):
+        for i in range(per_thread):
+            animal = Dog(f"Dog {i}") if i % 2 == 0 else Cat(f"Cat {i}")
+            if i % 4 == 0:
+                kept.append(animal)  # keep every other Dog alive
+    
+    previous = Animal.set_event_sink(NullSink())
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads as often as possible
+    try:
+        workers = [threading.Thread(target=worker, args=(kept,)) for kept in survivors]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+        Animal.set_event_sink(previous)
+    
+    created = sum(registry.created_count(cls) - created_before[cls] for cls in species)
+    live_dogs = registry.live_count(Dog) - live_before[Dog]
+    kept_dogs = sum(len(kept) for kept in survivors)
+    assert created == threads * per_thread, f"lost updates: {created} != {threads * per_thread}"
+    assert live_dogs == kept_dogs, f"live Dogs {live_dogs} != kept {kept_dogs}"
+    assert registry.live_count(Cat) == live_before[Cat], "dropped Cats are still counted live"
+    print(f"{threads} threads x {per_thread} animals: {created} registered, no lost updates")
+    print(f"live_count(Dog) rose by {live_dogs}: exactly the {kept_dogs} Dogs kept alive")
+    
+    del survivors
+    assert registry.live_count(Dog) == live_before[Dog], "dropped Dogs are still counted live"
+    print(f"After dropping them: live_count(Dog) = {registry.live_count(Dog)}")
+    print(f"Snapshot {{species: (created, live)}}: {registry.snapshot()}")
+
+
 def inheritance_quiz():
     """Interactive quiz about inheritance"""
     print("\n=== INHERITANCE QUIZ ===")
@@ -455,10 +771,12 @@ def main():
     demonstrate_method_overriding()
     demonstrate_special_behaviors()
     demonstrate_multiple_inheritance()
+    demonstrate_event_sinks()
+    demonstrate_species_registry()
     inheritance_quiz()
     
     print(f"\n" + "=" * 60)
-    print(f"Total animals created: {Animal.total_animals}")
+    print(f"Total animals created: {Animal.registry.total_created()}")
     print("✅ All inheritance demonstrations complete!")
     
     print(f"\n💡 Key Concepts Demonstrated:")
@@ -467,6 +785,8 @@ def main():
     print(f"   3. Class-specific behaviors")
     print(f"   4. Multiple inheritance")
     print(f"   5. Method Resolution Order (MRO)")
+    print(f"   6. Pluggable event sinks and classmethod factories")
+    print(f"   7. Thread-safe class-level registries with weak references")
 
 
 if __name__ == "__main__":
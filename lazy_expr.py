@@ -0,0 +1,525 @@
+"""
+Lazy Expression Graphs - Week 2
+CSC 242 - Advanced Class Concepts
+
+This file adds an opt-in lazy mode for Vector and Fraction arithmetic:
+- Operators on lazy() values build an expression DAG instead of computing
+- Common subexpressions are shared and identities (x + 0, x * 1) removed
+- Variable-free parts are folded once and reused across evaluations
+- evaluate() runs the graph in one pass without temporary objects
+
+For Fractions the pass works on raw (numerator, denominator) integer pairs
+and reduces once, when the final Fraction is built. For Vectors it works
+on (x, y) tuples and builds a single Vector at the end.
+
+Author: CSC 242 Teaching Team
+"""
+
+import operator
+import random
+
+from operator_overloading import Fraction, Vector
+
+
+# ============================================================================
+# EXPRESSION NODES
+# ============================================================================
+
+class Expr:
+    """Base class for lazy expression nodes; operators build new nodes"""
+
+    __slots__ = ("_program",)
+
+    def __init__(self):
+        self._program = None
+
+    # Arithmetic Operators (build nodes, compute nothing)
+    def __add__(self, other):
+        """Lazy addition: e + other"""
+        return _Op("+", self, _wrap(other))
+
+    def __radd__(self, other):
+        """Lazy right addition: other + e"""
+        return _Op("+", _wrap(other), self)
+
+    def __sub__(self, other):
+        """Lazy subtraction: e - other"""
+        return _Op("-", self, _wrap(other))
+
+    def __rsub__(self, other):
+        """Lazy right subtraction: other - e"""
+        return _Op("-", _wrap(other), self)
+
+    def __mul__(self, other):
+        """Lazy multiplication: e * other"""
+        return _Op("*", self, _wrap(other))
+
+    def __rmul__(self, other):
+        """Lazy right multiplication: other * e"""
+        return _Op("*", _wrap(other), self)
+
+    def __truediv__(self, other):
+        """Lazy division: e / other"""
+        return _Op("/", self, _wrap(other))
+
+    def __rtruediv__(self, other):
+        """Lazy right division: other / e"""
+        return _Op("/", _wrap(other), self)
+
+    def __neg__(self):
+        """Lazy negation: -e"""
+        return _Op("neg", self, None)
+
+    def __pos__(self):
+        """Positive: +e is e itself"""
+        return self
+
+    # Evaluation
+    def _compiled(self):
+        """The simplified program for this expression (built once)"""
+        if self._program is None:
+            self._program = _Program(self)
+        return self._program
+
+    def evaluate(self, **bindings):
+        """Evaluate the graph in one pass, with values for any Var nodes"""
+        return self._compiled().run(bindings)
+
+    def simplified_size(self):
+        """Number of distinct nodes left after sharing and simplification"""
+        return len(self._compiled().nodes)
+
+
+class Const(Expr):
+    """A leaf holding a Vector, Fraction, int or float"""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        super().__init__()
+        self.value = value
+
+    def __repr__(self):
+        """Developer representation"""
+        return f"Const({self.value!r})"
+
+
+class Var(Expr):
+    """A named leaf whose value is supplied to evaluate()"""
+
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        super().__init__()
+        self.name = name
+
+    def __repr__(self):
+        """Developer representation"""
+        return f"Var({self.name!r})"
+
+
+class _Op(Expr):
+    """An operator node: op is '+', '-', '*', '/' or 'neg'"""
+
+    __slots__ = ("op", "left", "right")
+
+    def __init__(self, op, left, right):
+        super().__init__()
+        self.op = op
+        self.left = left
+        self.right = right
+
+    def __repr__(self):
+        """Developer representation as a parenthesized expression"""
+        if self.right is None:
+            return f"(-{self.left!r})"
+        return f"({self.left!r} {self.op} {self.right!r})"
+
+
+def _wrap(value):
+    """Expr values pass through; anything else becomes a Const leaf"""
+    return value if isinstance(value, Expr) else Const(value)
+
+
+def lazy(value):
+    """Start a lazy expression: lazy(v1) + v2 + v3 builds a graph"""
+    return _wrap(value)
+
+
+# ============================================================================
+# SIMPLIFICATION
+# ============================================================================
+
+def _value_key(value):
+    """Structural key for a constant, so equal constants are shared"""
+    if isinstance(value, Fraction):
+        return (Fraction, value.numerator, value.denominator)
+    if isinstance(value, Vector):
+        return (Vector, value.x, value.y)
+    if type(value) in (int, float):
+        return (type(value), value)
+    return (object, id(value))
+
+
+class _Program:
+    """A topologically ordered, hash-consed copy of an expression DAG
+
+    nodes[i] is (op, a, b, payload) with a and b indices of earlier nodes.
+    Commutative operands are put in a fixed order so a + b and b + a share
+    one node, and x + 0, x - 0, x * 1 and -(-x) are removed. (x / 1 stays:
+    for two ints it turns the result into a float.)
+    """
+
+    _COMMUTATIVE = ("+", "*")
+
+    def __init__(self, root):
+        self.nodes = []
+        self.uses_vars = []
+        self._table = {}
+        self.root = self._build(root)
+        self.variables = {payload for op, _, _, payload in self.nodes if op == "var"}
+        self._constants = [payload for op, _, _, payload in self.nodes if op == "const"]
+        self._live = [(index, op, a, b, payload)
+                      for index, (op, a, b, payload) in enumerate(self.nodes)
+                      if self.uses_vars[index]]
+        self._folded = {}
+
+    def _intern(self, key, entry, uses_vars):
+        """Index of the node for key, adding it if it is new"""
+        index = self._table.get(key)
+        if index is None:
+            index = self._table[key] = len(self.nodes)
+            self.nodes.append(entry)
+            self.uses_vars.append(uses_vars)
+        return index
+
+    def _is_const(self, index, number):
+        """True if node index is the int constant number (an int keeps x's type)"""
+        op, _, _, value = self.nodes[index]
+        return op == "const" and type(value) is int and value == number
+
+    def _build(self, root):
+        """Iterative post-order walk; shared Python nodes are visited once"""
+        done = {}
+        stack = [root]
+        while stack:
+            node = stack[-1]
+            if id(node) in done:
+                stack.pop()
+                continue
+            if isinstance(node, Const):
+                done[id(node)] = self._intern(("const", _value_key(node.value)),
+                                              ("const", None, None, node.value), False)
+            elif isinstance(node, Var):
+                done[id(node)] = self._intern(("var", node.name), ("var", None, None, node.name), True)
+            else:
+                pending = [child for child in (node.left, node.right)
+                           if child is not None and id(child) not in done]
+                if pending:
+                    stack.extend(pending)
+                    continue
+                right = done[id(node.right)] if node.right is not None else None
+                done[id(node)] = self._simplify(node.op, done[id(node.left)], right)
+            stack.pop()
+        return done[id(root)]
+
+    def _simplify(self, op, a, b):
+        """Apply identities, canonical operand order and sharing to one operator"""
+        if op == "neg":
+            if self.nodes[a][0] == "neg":
+                return self.nodes[a][1]
+        elif op in ("+", "-") and self._is_const(b, 0):
+            return a
+        elif op == "+" and self._is_const(a, 0):
+            return b
+        elif op == "*" and self._is_const(b, 1):
+            return a
+        elif op == "*" and self._is_const(a, 1):
+            return b
+        if op in self._COMMUTATIVE and a > b:
+            a, b = b, a
+        uses_vars = self.uses_vars[a] or (b is not None and self.uses_vars[b])
+        return self._intern((op, a, b), (op, a, b, None), uses_vars)
+
+    def run(self, bindings):
+        """One evaluation pass; variable-free nodes are folded on first use"""
+        missing = self.variables - bindings.keys()
+        if missing:
+            raise ValueError(f"No value bound for variable(s): {', '.join(sorted(missing))}")
+        kernel = _choose_kernel(self._constants + [bindings[name] for name in self.variables])
+        operations = kernel.operations
+        convert = kernel.convert
+
+        values = self._folded.get(kernel)
+        if values is None:
+            values = self._fold(kernel)
+        values = values.copy()
+        for index, op, a, b, payload in self._live:
+            if op == "var":
+                values[index] = convert(bindings[payload])
+            elif b is None:
+                values[index] = operations[op](values[a])
+            else:
+                values[index] = operations[op](values[a], values[b])
+        return kernel.finish(values[self.root])
+
+    def _fold(self, kernel):
+        """Evaluate every variable-free node once and keep the values"""
+        operations = kernel.operations
+        values = [None] * len(self.nodes)
+        for index, (op, a, b, payload) in enumerate(self.nodes):
+            if not self.uses_vars[index]:
+                if op == "const":
+                    values[index] = kernel.convert(payload)
+                elif b is None:
+                    values[index] = operations[op](values[a])
+                else:
+                    values[index] = operations[op](values[a], values[b])
+        self._folded[kernel] = values
+        return values
+
+
+# ============================================================================
+# EVALUATION KERNELS
+# ============================================================================
+
+class _Kernel:
+    """How one value domain is converted, combined and turned back into objects"""
+
+    def __init__(self, name, convert, operations, finish):
+        self.name = name
+        self.convert = convert
+        self.operations = operations
+        self.finish = finish
+
+    def __repr__(self):
+        """Developer representation"""
+        return f"_Kernel({self.name!r})"
+
+
+# Fraction domain: unreduced (numerator, denominator) pairs with denominator > 0.
+# Plain ints and floats stay as they are until they meet a pair, so 1 / 3
+# between two ints is still the float that eager Python would produce.
+def _to_pair_domain(value):
+    """Convert a leaf to a (numerator, denominator) pair; ints and floats stay plain"""
+    if isinstance(value, Fraction):
+        return value.numerator, value.denominator
+    if isinstance(value, (int, float)):
+        return value
+    raise TypeError(f"Cannot use {type(value).__name__} in a Fraction expression")
+
+
+def _as_pair(value):
+    """Promote an int or float operand to an exact pair"""
+    if type(value) is tuple:
+        return value
+    if isinstance(value, float):
+        value = Fraction(value)  # exact, as in Fraction + float
+        return value.numerator, value.denominator
+    return value, 1
+
+
+def _pair_add(a, b):
+    """Unreduced pair addition (plain numbers add normally)"""
+    if type(a) is not tuple and type(b) is not tuple:
+        return a + b
+    a, b = _as_pair(a), _as_pair(b)
+    if a[1] == b[1]:
+        return a[0] + b[0], a[1]
+    return a[0] * b[1] + b[0] * a[1], a[1] * b[1]
+
+
+def _pair_sub(a, b):
+    """Unreduced pair subtraction (plain numbers subtract normally)"""
+    if type(a) is not tuple and type(b) is not tuple:
+        return a - b
+    a, b = _as_pair(a), _as_pair(b)
+    if a[1] == b[1]:
+        return a[0] - b[0], a[1]
+    return a[0] * b[1] - b[0] * a[1], a[1] * b[1]
+
+
+def _pair_mul(a, b):
+    """Unreduced pair multiplication (plain numbers multiply normally)"""
+    if type(a) is not tuple and type(b) is not tuple:
+        return a * b
+    a, b = _as_pair(a), _as_pair(b)
+    return a[0] * b[0], a[1] * b[1]
+
+
+def _pair_div(a, b):
+    """Unreduced pair division, keeping the denominator positive"""
+    if type(a) is not tuple and type(b) is not tuple:
+        return a / b
+    a, b = _as_pair(a), _as_pair(b)
+    if b[0] == 0:
+        raise ZeroDivisionError("Cannot divide by zero")
+    if b[0] < 0:
+        return -a[0] * b[1], a[1] * -b[0]
+    return a[0] * b[1], a[1] * b[0]
+
+
+def _pair_neg(a):
+    """Negate a pair or a plain number"""
+    return (-a[0], a[1]) if type(a) is tuple else -a
+
+
+def _pair_finish(value):
+    """The only gcd of the whole evaluation"""
+    return Fraction(value[0], value[1]) if type(value) is tuple else value
+
+
+# Vector domain: (x, y) tuples for vectors, plain numbers for scalars
+def _to_components(value):
+    """Convert a leaf to an (x, y) tuple; scalars stay plain"""
+    if isinstance(value, Vector):
+        return value.x, value.y
+    if isinstance(value, (int, float)):
+        return value
+    raise TypeError(f"Cannot use {type(value).__name__} in a Vector expression")
+
+
+def _vec_add(a, b):
+    """Component addition with scalar broadcast"""
+    if type(a) is tuple:
+        if type(b) is tuple:
+            return a[0] + b[0], a[1] + b[1]
+        return a[0] + b, a[1] + b
+    if type(b) is tuple:
+        return b[0] + a, b[1] + a
+    return a + b
+
+
+def _vec_sub(a, b):
+    """Component subtraction with scalar broadcast"""
+    if type(a) is tuple:
+        if type(b) is tuple:
+            return a[0] - b[0], a[1] - b[1]
+        return a[0] - b, a[1] - b
+    if type(b) is tuple:
+        return a - b[0], a - b[1]
+    return a - b
+
+
+def _vec_mul(a, b):
+    """Scalar scaling, or the dot product of two vectors"""
+    if type(a) is tuple:
+        if type(b) is tuple:
+            return a[0] * b[0] + a[1] * b[1]  # dot product
+        return a[0] * b, a[1] * b
+    if type(b) is tuple:
+        return b[0] * a, b[1] * a
+    return a * b
+
+
+def _vec_div(a, b):
+    """Division of a vector or scalar by a non-zero scalar"""
+    if type(a) is tuple:
+        if type(b) is tuple or b == 0:
+            raise ValueError("Cannot divide vector by zero or non-scalar")
+        return a[0] / b, a[1] / b
+    if type(b) is tuple:
+        raise TypeError("Cannot divide a scalar by a Vector")
+    return a / b
+
+
+def _vec_neg(a):
+    """Negate a vector tuple or a scalar"""
+    return (-a[0], -a[1]) if type(a) is tuple else -a
+
+
+def _vec_finish(value):
+    """Turn the final (x, y) tuple back into a Vector"""
+    return Vector(*value) if type(value) is tuple else value
+
+
+_FRACTION_KERNEL = _Kernel("fraction", _to_pair_domain,
+                           {"+": _pair_add, "-": _pair_sub, "*": _pair_mul,
+                            "/": _pair_div, "neg": _pair_neg}, _pair_finish)
+_VECTOR_KERNEL = _Kernel("vector", _to_components,
+                         {"+": _vec_add, "-": _vec_sub, "*": _vec_mul,
+                          "/": _vec_div, "neg": _vec_neg}, _vec_finish)
+_NUMBER_KERNEL = _Kernel("number", lambda value: value,
+                         {"+": operator.add, "-": operator.sub, "*": operator.mul,
+                          "/": operator.truediv, "neg": operator.neg}, lambda value: value)
+
+
+def _choose_kernel(values):
+    """Vector if any leaf is a Vector, else Fraction if any is, else plain numbers"""
+    if any(isinstance(value, Vector) for value in values):
+        return _VECTOR_KERNEL
+    if any(isinstance(value, Fraction) for value in values):
+        return _FRACTION_KERNEL
+    return _NUMBER_KERNEL
+
+
+# ============================================================================
+# DEMONSTRATION FUNCTIONS
+# ============================================================================
+
+def demonstrate_lazy_vectors():
+    """Show lazy Vector expressions"""
+    print("=== LAZY VECTOR EXPRESSIONS ===")
+
+    v1, v2, v3 = Vector(1, 2), Vector(3, 4), Vector(5, 6)
+    expr = lazy(v1) + v2 + v3
+    assert expr.evaluate() == v1 + v2 + v3, "lazy Vector sum must match eager evaluation"
+    print(f"lazy(v1) + v2 + v3 = {expr.evaluate()} (eager: {v1 + v2 + v3})")
+
+    # (v1 + v2) appears twice but is computed once
+    shared = lazy(v1) + v2
+    dot = shared * (v2 + lazy(v1)) * 1
+    print(f"(v1 + v2) • (v2 + v1) * 1 = {dot.evaluate()}, "
+          f"nodes after sharing: {dot.simplified_size()}")
+
+    position, velocity = Var("position"), Var("velocity")
+    step = position + velocity * lazy(0.5)
+    print(f"position + velocity * 0.5 with bindings: "
+          f"{step.evaluate(position=Vector(0, 0), velocity=Vector(2, 4))}")
+
+
+def demonstrate_lazy_fractions():
+    """Show lazy Fraction expressions with a single final reduction"""
+    print("\n=== LAZY FRACTION EXPRESSIONS ===")
+
+    f1, f2, f3 = Fraction(1, 2), Fraction(3, 4), Fraction(2, 3)
+    expr = lazy(f1) + f2 * f3
+    assert expr.evaluate() == f1 + f2 * f3, "lazy Fraction expression must match eager evaluation"
+    print(f"lazy(f1) + f2 * f3 = {expr.evaluate()} (eager: {f1 + f2 * f3})")
+
+    x = Var("x")
+    polynomial = (x + f1) * (x + f1) - f3 / f2   # f3 / f2 is folded once
+    for value in (Fraction(0), Fraction(1, 3), 2):
+        print(f"(x + 1/2)^2 - (2/3)/(3/4) at x = {value}: {polynomial.evaluate(x=value)}")
+
+    rng = random.Random(242)
+    terms = [Fraction(rng.randint(-9, 9), rng.randint(1, 9)) for _ in range(200)]
+    chain = lazy(terms[0])
+    eager = terms[0]
+    for a, b in zip(terms[1::2], terms[2::2]):
+        chain = chain + a * b
+        eager = eager + a * b
+    assert chain.evaluate() == eager, "200-term chain must match eager evaluation"
+    print("200-term chain matches eager evaluation: True")
+
+
+def main():
+    """Run all lazy expression demonstrations"""
+    print("🕸️ LAZY EXPRESSION GRAPHS - CSC 242 Week 2")
+    print("=" * 60)
+
+    demonstrate_lazy_vectors()
+    demonstrate_lazy_fractions()
+
+    print(f"\n" + "=" * 60)
+    print("✅ All lazy expression demonstrations complete!")
+
+    print(f"\n💡 Key Concepts Demonstrated:")
+    print(f"   1. Operator overloading that builds objects instead of computing")
+    print(f"   2. Common-subexpression sharing (hash-consing)")
+    print(f"   3. Constant folding and algebraic identities")
+    print(f"   4. One-pass evaluation with a single final normalization")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,735 @@
+"""
+N-Dimensional Vectors - Week 2
+CSC 242 - Advanced Class Concepts
+
+This file builds the N-dimensional Vector(*components) from the in-class
+exercises for large data such as 768-dimensional embeddings:
+- Inheriting from a built-in type (array.array with typecode 'd')
+- Overriding inherited operators (+ and * mean concatenate/repeat on array)
+- The buffer protocol: np.asarray(vector) is a zero-copy view
+- Batch cosine similarity across many vectors
+- A sparse variant (sorted index/value arrays) chosen automatically by density
+
+Components are stored as packed C doubles (8 bytes each) instead of a list
+of boxed float objects (about 32 bytes each). Arithmetic runs as NumPy
+calls on zero-copy views when NumPy is installed and the vector is long
+enough to amortize the call overhead, and as tight C-level loops
+(map, sum, math.hypot) otherwise.
+
+Author: CSC 242 Teaching Team
+"""
+
+import bisect
+import itertools
+import math
+import operator
+import random
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; the pure-Python loops are used instead
+    np = None
+
+# Below this dimension a NumPy call costs more than the Python loop it replaces
+_NUMPY_MIN_DIMENSION = 32
+
+# auto_vector stores a vector sparsely when at most this fraction is non-zero.
+# Sparse storage is smaller up to 50% density, but at 768 dimensions a NumPy
+# dense dot product only loses to the O(nnz) sparse one below a few percent.
+_SPARSE_MAX_DENSITY = 0.05
+
+
+def _view(values):
+    """Zero-copy float64 NumPy view of an array('d'); other sequences are converted"""
+    if isinstance(values, array) and values.typecode == "d":
+        return np.frombuffer(values)
+    if isinstance(values, SparseVector):
+        return values.to_numpy()
+    return np.asarray(values, dtype=np.float64)
+
+
+def _packed(typecode, values):
+    """Copy a NumPy array into a new array.array of typecode with one memcpy"""
+    result = array(typecode)
+    result.frombytes(memoryview(np.ascontiguousarray(values)).cast("B"))
+    return result
+
+
+def _rebuild(cls, data):
+    """Unpickle helper: rebuild a vector from its packed bytes"""
+    vector = array.__new__(cls, "d")
+    vector.frombytes(data)
+    return vector
+
+
+# ============================================================================
+# N-DIMENSIONAL VECTOR CLASS
+# ============================================================================
+
+class NDVector(array):
+    """An N-dimensional vector stored as a packed array of doubles"""
+
+    __slots__ = ()
+
+    def __new__(cls, *components):
+        """Create a vector from its components: NDVector(1, 2, 3)"""
+        return array.__new__(cls, "d", components)
+
+    @classmethod
+    def from_iterable(cls, values):
+        """Create a vector from any iterable of numbers (or an array('d'))"""
+        return array.__new__(cls, "d", values)
+
+    @classmethod
+    def zeros(cls, dimension):
+        """Create the zero vector of the given dimension"""
+        return array.__new__(cls, "d", bytes(8 * dimension))
+
+    @classmethod
+    def _from_numpy(cls, values):
+        """Copy a float64 NumPy result into a new vector with one memcpy"""
+        vector = array.__new__(cls, "d")
+        vector.frombytes(memoryview(np.ascontiguousarray(values, dtype=np.float64)).cast("B"))
+        return vector
+
+    def _use_numpy(self):
+        """Check if NumPy is available and worth calling for this dimension"""
+        return np is not None and len(self) >= _NUMPY_MIN_DIMENSION
+
+    def _check_dimension(self, other):
+        """Raise ValueError unless other has the same dimension"""
+        if len(self) != len(other):
+            raise ValueError("Vectors must have the same dimension")
+
+    # Vector Operations
+    def dot(self, other):
+        """Dot product with another vector of the same dimension"""
+        if isinstance(other, SparseVector):
+            return other.dot(self)
+        self._check_dimension(other)
+        if self._use_numpy():
+            return float(np.dot(_view(self), _view(other)))
+        return sum(map(operator.mul, self, other), 0.0)
+
+    def __abs__(self):
+        """Magnitude: abs(v)"""
+        if self._use_numpy():
+            return float(np.linalg.norm(_view(self)))
+        return math.hypot(*self)
+
+    def normalize(self):
+        """Return a unit vector in the same direction (the zero vector stays zero)"""
+        magnitude = abs(self)
+        if magnitude == 0:
+            return type(self).from_iterable(self)
+        return self / magnitude
+
+    def to_numpy(self):
+        """Zero-copy NumPy view; writes through to the vector"""
+        if np is None:
+            raise ImportError("to_numpy requires NumPy")
+        return _view(self)
+
+    # Arithmetic Operators (array's own + and * concatenate and repeat, so
+    # every numeric operator is overridden)
+    def _elementwise(self, other, function, reflected=False):
+        """Apply function to (self, other) component-wise; other is a vector or scalar"""
+        cls = type(self)
+        if isinstance(other, NDVector):
+            self._check_dimension(other)
+        elif not isinstance(other, (int, float)):
+            return NotImplemented
+        left, right = (other, self) if reflected else (self, other)
+        if self._use_numpy():
+            if isinstance(left, NDVector):
+                left = _view(left)
+            if isinstance(right, NDVector):
+                right = _view(right)
+            return cls._from_numpy(function(left, right))
+        if not isinstance(other, NDVector):
+            if reflected:
+                return cls.from_iterable([function(other, x) for x in self])
+            return cls.from_iterable([function(x, other) for x in self])
+        return cls.from_iterable(map(function, left, right))
+
+    def __add__(self, other):
+        """Vector addition (or scalar broadcast): v1 + v2"""
+        return self._elementwise(other, operator.add)
+
+    def __radd__(self, other):
+        """Right addition: scalar + v (so sum(vectors) works)"""
+        return self._elementwise(other, operator.add, reflected=True)
+
+    def __sub__(self, other):
+        """Vector subtraction (or scalar broadcast): v1 - v2"""
+        return self._elementwise(other, operator.sub)
+
+    def __rsub__(self, other):
+        """Right subtraction: scalar - v"""
+        return self._elementwise(other, operator.sub, reflected=True)
+
+    def __mul__(self, other):
+        """Scalar multiplication, or dot product with another vector"""
+        if isinstance(other, (NDVector, SparseVector)):
+            return self.dot(other)
+        if isinstance(other, (int, float)):
+            return self._elementwise(other, operator.mul)
+        return NotImplemented
+
+    def __rmul__(self, other):
+        """Right multiplication: scalar * v"""
+        if isinstance(other, (int, float)):
+            return self._elementwise(other, operator.mul)
+        return NotImplemented
+
+    def __truediv__(self, other):
+        """Division by a scalar"""
+        if isinstance(other, (int, float)) and other != 0:
+            return self._elementwise(other, operator.truediv)
+        raise ValueError("Cannot divide vector by zero or non-scalar")
+
+    def __neg__(self):
+        """Negation: -v"""
+        return self._elementwise(-1, operator.mul)
+
+    # In-place operators write into the existing buffer
+    def _inplace(self, other, function):
+        """Apply function component-wise into self; other is a vector or scalar"""
+        if isinstance(other, NDVector):
+            self._check_dimension(other)
+        elif not isinstance(other, (int, float)):
+            return NotImplemented
+        if self._use_numpy():
+            target = _view(self)
+            function(target, _view(other) if isinstance(other, NDVector) else other, out=target)
+        elif isinstance(other, NDVector):
+            self[:] = array("d", map(function, self, other))
+        else:
+            self[:] = array("d", [function(x, other) for x in self])
+        return self
+
+    def __iadd__(self, other):
+        """In-place addition: v += w"""
+        return self._inplace(other, np.add if self._use_numpy() else operator.add)
+
+    def __isub__(self, other):
+        """In-place subtraction: v -= w"""
+        return self._inplace(other, np.subtract if self._use_numpy() else operator.sub)
+
+    def __imul__(self, other):
+        """In-place scalar multiplication: v *= k"""
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        return self._inplace(other, np.multiply if self._use_numpy() else operator.mul)
+
+    def __itruediv__(self, other):
+        """In-place scalar division: v /= k"""
+        if not isinstance(other, (int, float)) or other == 0:
+            raise ValueError("Cannot divide vector by zero or non-scalar")
+        return self._inplace(other, np.divide if self._use_numpy() else operator.truediv)
+
+    # Pickling (array pickles subclasses as array(typecode, items))
+    def __reduce_ex__(self, protocol):
+        """Pickle as packed bytes"""
+        return _rebuild, (type(self), self.tobytes())
+
+    # String Representations
+    def __str__(self):
+        """Human-readable representation (long vectors are abbreviated)"""
+        if len(self) <= 6:
+            return "(" + ", ".join(f"{x:g}" for x in self) + ")"
+        head = ", ".join(f"{x:g}" for x in self[:3])
+        return f"({head}, ..., {self[-1]:g}) [dim {len(self)}]"
+
+    def __repr__(self):
+        """Developer representation"""
+        return f"NDVector({', '.join(repr(x) for x in self)})"
+
+
+# ============================================================================
+# SPARSE VECTOR CLASS
+# ============================================================================
+
+class SparseVector:
+    """An N-dimensional vector storing only its non-zero components
+
+    Indices live in a sorted array('q') and values in a parallel array('d'),
+    16 bytes per non-zero instead of 8 bytes per component. Arithmetic
+    between sparse vectors merges the two index arrays in O(nnz); indexing
+    is a binary search.
+    """
+
+    __slots__ = ("_dimension", "_indices", "_values")
+
+    def __init__(self, dimension, components=None):
+        """Create from a {index: value} mapping or (index, value) pairs"""
+        if dimension < 0:
+            raise ValueError("Dimension must be non-negative")
+        self._dimension = dimension
+        pairs = sorted((i, v) for i, v in dict(components or {}).items() if v != 0)
+        if pairs and (pairs[0][0] < 0 or pairs[-1][0] >= dimension):
+            raise IndexError("Sparse vector index out of range")
+        self._indices = array("q", [i for i, _ in pairs])
+        self._values = array("d", [v for _, v in pairs])
+
+    @classmethod
+    def _from_arrays(cls, dimension, indices, values):
+        """Build from sorted indices and non-zero values without checks"""
+        vector = object.__new__(cls)
+        vector._dimension = dimension
+        vector._indices = indices
+        vector._values = values
+        return vector
+
+    @classmethod
+    def from_dense(cls, values):
+        """Create from a dense sequence of numbers (or an NDVector)"""
+        if np is not None and isinstance(values, array) and values.typecode == "d":
+            view = np.frombuffer(values)
+            nonzero = np.flatnonzero(view)
+            return cls._from_arrays(len(values), _packed("q", nonzero.astype(np.int64)),
+                                    _packed("d", view[nonzero]))
+        indices = array("q")
+        components = array("d")
+        count = 0
+        for index, value in enumerate(values):
+            count += 1
+            if value != 0:
+                indices.append(index)
+                components.append(value)
+        return cls._from_arrays(count, indices, components)
+
+    @property
+    def nnz(self):
+        """Number of stored (non-zero) components"""
+        return len(self._values)
+
+    @property
+    def density(self):
+        """Fraction of components that are non-zero"""
+        return len(self._values) / self._dimension if self._dimension else 0.0
+
+    def items(self):
+        """Iterate (index, value) pairs of the non-zero components in index order"""
+        return zip(self._indices, self._values)
+
+    def to_dense(self):
+        """Return the equivalent dense NDVector"""
+        dense = NDVector.zeros(self._dimension)
+        for index, value in zip(self._indices, self._values):
+            dense[index] = value
+        return dense
+
+    def to_numpy(self):
+        """Return a dense float64 NumPy array (a copy)"""
+        if np is None:
+            raise ImportError("to_numpy requires NumPy")
+        dense = np.zeros(self._dimension)
+        if self._values:
+            dense[np.frombuffer(self._indices, dtype=np.int64)] = np.frombuffer(self._values)
+        return dense
+
+    # Container Protocol
+    def __len__(self):
+        """Vector dimension (not the number of non-zeros)"""
+        return self._dimension
+
+    def _locate(self, index):
+        """Normalize a possibly negative index; return (index, position in _indices)"""
+        if index < 0:
+            index += self._dimension
+        if not 0 <= index < self._dimension:
+            raise IndexError("Sparse vector index out of range")
+        return index, bisect.bisect_left(self._indices, index)
+
+    def __getitem__(self, index):
+        """Component lookup by binary search: v[i]"""
+        index, position = self._locate(index)
+        if position < len(self._indices) and self._indices[position] == index:
+            return self._values[position]
+        return 0.0
+
+    def __setitem__(self, index, value):
+        """Component assignment; storing 0 removes the entry: v[i] = x"""
+        index, position = self._locate(index)
+        present = position < len(self._indices) and self._indices[position] == index
+        if value == 0:
+            if present:
+                del self._indices[position]
+                del self._values[position]
+        elif present:
+            self._values[position] = value
+        else:
+            self._indices.insert(position, index)
+            self._values.insert(position, value)
+
+    def __iter__(self):
+        """Iterate all components densely, zeros included"""
+        previous = 0
+        for index, value in zip(self._indices, self._values):
+            for _ in range(index - previous):
+                yield 0.0
+            yield value
+            previous = index + 1
+        for _ in range(self._dimension - previous):
+            yield 0.0
+
+    # Vector Operations
+    def _use_numpy(self, other=None):
+        """Check if NumPy is available and worth calling for these non-zeros"""
+        nnz = len(self._values) + (len(other._values) if other is not None else 0)
+        return np is not None and nnz >= _NUMPY_MIN_DIMENSION
+
+    def _numpy_arrays(self):
+        """Zero-copy NumPy views of (indices, values)"""
+        return np.frombuffer(self._indices, dtype=np.int64), np.frombuffer(self._values)
+
+    def _check_dimension(self, other):
+        """Raise ValueError unless other has the same dimension"""
+        if self._dimension != len(other):
+            raise ValueError("Vectors must have the same dimension")
+
+    def dot(self, other):
+        """Dot product with a sparse or dense vector in O(nnz)"""
+        self._check_dimension(other)
+        if not isinstance(other, SparseVector):
+            if self._use_numpy() and isinstance(other, NDVector):
+                indices, values = self._numpy_arrays()
+                return float(np.dot(values, _view(other)[indices]))
+            return sum(map(operator.mul, self._values, map(other.__getitem__, self._indices)), 0.0)
+        if not self._values or not other._values:
+            return 0.0
+        if self._use_numpy(other):
+            # Binary-search each of our indices in the other index array
+            ia, va = self._numpy_arrays()
+            ib, vb = other._numpy_arrays()
+            positions = np.minimum(np.searchsorted(ib, ia), len(ib) - 1)
+            match = ib[positions] == ia
+            return float(np.dot(va[match], vb[positions[match]]))
+        # Two-pointer intersection of the sorted index arrays
+        ia, va, ib, vb = self._indices, self._values, other._indices, other._values
+        i = j = 0
+        total = 0.0
+        while i < len(ia) and j < len(ib):
+            a, b = ia[i], ib[j]
+            if a == b:
+                total += va[i] * vb[j]
+                i += 1
+                j += 1
+            elif a < b:
+                i += 1
+            else:
+                j += 1
+        return total
+
+    def __abs__(self):
+        """Magnitude: abs(v), O(nnz)"""
+        return math.hypot(*self._values)
+
+    def normalize(self):
+        """Return a unit vector in the same direction (the zero vector stays zero)"""
+        magnitude = abs(self)
+        if magnitude == 0:
+            return self._scaled(1)
+        return self._scaled(1 / magnitude)
+
+    def _scaled(self, factor):
+        """Return a copy with every value multiplied by factor"""
+        values = array("d", [value * factor for value in self._values])
+        if 0 in values:  # underflow or a zero factor
+            return SparseVector(self._dimension, zip(self._indices, values))
+        return SparseVector._from_arrays(self._dimension, array("q", self._indices), values)
+
+    def _merge(self, other, sign):
+        """Return self + sign * other for two sparse vectors in O(nnz)"""
+        if self._use_numpy(other):
+            # A stable sort of two concatenated sorted runs is a linear merge
+            ia, va = self._numpy_arrays()
+            ib, vb = other._numpy_arrays()
+            indices = np.concatenate((ia, ib))
+            order = np.argsort(indices, kind="stable")
+            indices = indices[order]
+            values = np.concatenate((va, vb * sign))[order]
+            starts = np.flatnonzero(np.concatenate(([True], indices[1:] != indices[:-1])))
+            sums = np.add.reduceat(values, starts)
+            keep = sums != 0
+            return SparseVector._from_arrays(self._dimension, _packed("q", indices[starts][keep]),
+                                             _packed("d", sums[keep]))
+        ia, va, ib, vb = self._indices, self._values, other._indices, other._values
+        indices = array("q")
+        values = array("d")
+        i = j = 0
+        while i < len(ia) and j < len(ib):
+            a, b = ia[i], ib[j]
+            if a == b:
+                value = va[i] + sign * vb[j]
+                if value != 0:
+                    indices.append(a)
+                    values.append(value)
+                i += 1
+                j += 1
+            elif a < b:
+                indices.append(a)
+                values.append(va[i])
+                i += 1
+            else:
+                indices.append(b)
+                values.append(sign * vb[j])
+                j += 1
+        indices.extend(ia[i:])
+        values.extend(va[i:])
+        indices.extend(ib[j:])
+        values.extend(array("d", [sign * value for value in vb[j:]]))
+        return SparseVector._from_arrays(self._dimension, indices, values)
+
+    def _dense_combine(self, dense, self_sign, dense_sign):
+        """Return self_sign * self + dense_sign * dense as an NDVector"""
+        result = NDVector.from_iterable(dense)
+        if dense_sign < 0:
+            result *= -1
+        for index, value in zip(self._indices, self._values):
+            result[index] += self_sign * value
+        return result
+
+    # Arithmetic Operators (sparse with sparse stays sparse; mixing with a
+    # dense vector gives a dense NDVector)
+    def __add__(self, other):
+        """Vector addition: v1 + v2"""
+        if isinstance(other, SparseVector):
+            self._check_dimension(other)
+            return self._merge(other, 1)
+        if isinstance(other, NDVector):
+            self._check_dimension(other)
+            return self._dense_combine(other, 1, 1)
+        return NotImplemented
+
+    def __radd__(self, other):
+        """Right addition: dense + sparse, or 0 + sparse (so sum(vectors) works)"""
+        if isinstance(other, (int, float)) and other == 0:
+            return SparseVector._from_arrays(self._dimension, array("q", self._indices),
+                                             array("d", self._values))
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        """Vector subtraction: v1 - v2"""
+        if isinstance(other, SparseVector):
+            self._check_dimension(other)
+            return self._merge(other, -1)
+        if isinstance(other, NDVector):
+            self._check_dimension(other)
+            return self._dense_combine(other, 1, -1)
+        return NotImplemented
+
+    def __rsub__(self, other):
+        """Right subtraction: dense - sparse"""
+        if isinstance(other, NDVector):
+            self._check_dimension(other)
+            return self._dense_combine(other, -1, 1)
+        return NotImplemented
+
+    def __mul__(self, other):
+        """Scalar multiplication, or dot product with another vector"""
+        if isinstance(other, (int, float)):
+            return self._scaled(other)
+        if isinstance(other, (SparseVector, NDVector)):
+            return self.dot(other)
+        return NotImplemented
+
+    def __rmul__(self, other):
+        """Right multiplication: scalar * v (or dense * sparse dot product)"""
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        """Division by a scalar"""
+        if isinstance(other, (int, float)) and other != 0:
+            return self._scaled(1 / other)
+        raise ValueError("Cannot divide vector by zero or non-scalar")
+
+    def __neg__(self):
+        """Negation: -v"""
+        return self._scaled(-1)
+
+    def __eq__(self, other):
+        """Equality with a sparse or dense vector of the same components"""
+        if isinstance(other, SparseVector):
+            return (self._dimension == other._dimension and self._indices == other._indices
+                    and self._values == other._values)
+        if isinstance(other, NDVector):
+            return len(other) == self._dimension and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    # String Representations
+    def __str__(self):
+        """Human-readable representation"""
+        shown = ", ".join(f"{i}: {v:g}" for i, v in itertools.islice(self.items(), 6))
+        more = ", ..." if self.nnz > 6 else ""
+        return f"{{{shown}{more}}} [dim {self._dimension}, nnz {self.nnz}]"
+
+    def __repr__(self):
+        """Developer representation"""
+        return f"SparseVector({self._dimension}, {dict(self.items())!r})"
+
+
+def auto_vector(values, max_density=_SPARSE_MAX_DENSITY):
+    """Return a SparseVector if at most max_density of values is non-zero, else an NDVector
+
+    values may be a dense sequence, an NDVector or a SparseVector; an
+    existing vector is converted only if it is in the wrong representation.
+    """
+    if isinstance(values, SparseVector):
+        return values if values.density <= max_density else values.to_dense()
+    sparse = SparseVector.from_dense(values)
+    if sparse.density <= max_density:
+        return sparse
+    return values if isinstance(values, NDVector) else sparse.to_dense()
+
+
+# ============================================================================
+# BATCH OPERATIONS
+# ============================================================================
+
+def cosine_similarities(query, vectors):
+    """Cosine similarity of query with each vector; returns an array('d')
+
+    vectors may be any sequence of NDVectors or, with NumPy, a 2-D float
+    array with one vector per row (so a stored embedding matrix is not
+    re-stacked on every query). Zero vectors have similarity 0.0.
+    """
+    if np is not None:
+        if isinstance(vectors, np.ndarray):
+            matrix = vectors
+        elif len(vectors):
+            matrix = np.vstack([_view(vector) for vector in vectors])
+        else:
+            return array("d")
+        if matrix.shape[1] != len(query):
+            raise ValueError("Vectors must have the same dimension")
+        q = _view(query)
+        norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(q)
+        scores = matrix @ q
+        np.divide(scores, norms, out=scores, where=norms != 0)
+        scores[norms == 0] = 0.0
+        result = array("d")
+        result.frombytes(memoryview(scores).cast("B"))
+        return result
+
+    query_norm = abs(query)
+    result = array("d")
+    for vector in vectors:
+        norm = query_norm * abs(vector)
+        result.append(query.dot(vector) / norm if norm else 0.0)
+    return result
+
+
+def most_similar(query, vectors, k=5):
+    """Return (index, similarity) pairs for the k vectors most similar to query"""
+    scores = cosine_similarities(query, vectors)
+    if np is not None and len(scores) > k:
+        view = np.frombuffer(scores)
+        top = np.argpartition(-view, k)[:k]
+        order = top[np.argsort(-view[top], kind="stable")]
+        return [(int(i), scores[i]) for i in order]
+    ranked = sorted(range(len(scores)), key=lambda i: -scores[i])
+    return [(i, scores[i]) for i in ranked[:k]]
+
+
+# ============================================================================
+# DEMONSTRATION FUNCTIONS
+# ============================================================================
+
+def demonstrate_nd_vector():
+    """Show arithmetic on small N-dimensional vectors"""
+    print("=== N-DIMENSIONAL VECTOR DEMONSTRATION ===")
+
+    v1 = NDVector(1, 2, 3)
+    v2 = NDVector(4, 5, 6)
+    print(f"v1 = {v1}, v2 = {v2}")
+    print(f"v1 + v2 = {v1 + v2}")
+    print(f"v2 - v1 = {v2 - v1}")
+    print(f"v1 * 2 = {v1 * 2}, 2 * v1 = {2 * v1}")
+    print(f"v1 / 2 = {v1 / 2}")
+    print(f"-v1 = {-v1}")
+    print(f"v1 . v2 = {v1.dot(v2)} (also v1 * v2 = {v1 * v2})")
+    print(f"|v1| = {abs(v1):.4f}, normalized = {v1.normalize()}")
+    print(f"sum([v1, v2]) = {sum([v1, v2])}")
+
+    total = NDVector.zeros(3)
+    total += v1
+    total += v2
+    print(f"zeros(3) += v1; += v2 -> {total}")
+
+    try:
+        v1 + NDVector(1, 2)
+    except ValueError as e:
+        print(f"Dimension check: {e}")
+
+
+def demonstrate_embeddings():
+    """Show zero-copy NumPy interop and batch cosine similarity"""
+    print("\n=== EMBEDDING DEMONSTRATION ===")
+    rng = random.Random(242)
+    dimension = 768
+    vectors = [NDVector.from_iterable(rng.gauss(0, 1) for _ in range(dimension))
+               for _ in range(1_000)]
+    query = vectors[17] + NDVector.from_iterable(rng.gauss(0, 0.1) for _ in range(dimension))
+    print(f"1000 embeddings of dimension {dimension}, "
+          f"{vectors[0].itemsize * dimension} bytes of components each")
+    print(f"query = {query}")
+
+    if np is not None:
+        view = np.asarray(query)
+        print(f"np.asarray(query) shares memory: {np.shares_memory(view, query.to_numpy())}")
+    print(f"Top 3 by cosine similarity: "
+          f"{[(i, round(s, 3)) for i, s in most_similar(query, vectors, k=3)]}")
+
+
+def demonstrate_sparse_vector():
+    """Show sparse storage, O(nnz) arithmetic and automatic representation"""
+    print("\n=== SPARSE VECTOR DEMONSTRATION ===")
+    s1 = SparseVector(10_000, {3: 1.5, 512: -2.0, 9_999: 4.0})
+    s2 = SparseVector(10_000, {512: 2.0, 700: 1.0})
+    print(f"s1 = {s1}")
+    print(f"s2 = {s2}")
+    print(f"s1 + s2 = {s1 + s2}  (512 cancelled)")
+    print(f"s1 . s2 = {s1.dot(s2)}, |s1| = {abs(s1):.4f}")
+    print(f"s1[512] = {s1[512]}, s1[4] = {s1[4]}, s1[-1] = {s1[-1]}")
+    s1[4] = 7.0
+    s1[3] = 0
+    print(f"after s1[4] = 7 and s1[3] = 0: {s1}")
+
+    dense = NDVector.from_iterable(range(10_000))
+    print(f"dense . s1 = {dense.dot(s1)} (O(nnz) lookups into the dense vector)")
+    print(f"type(dense + s1) = {type(dense + s1).__name__}")
+
+    rng = random.Random(242)
+    mostly_zero = [rng.random() if rng.random() < 0.02 else 0.0 for _ in range(768)]
+    mostly_full = [rng.random() for _ in range(768)]
+    print(f"auto_vector at 2% density -> {type(auto_vector(mostly_zero)).__name__}, "
+          f"at 100% -> {type(auto_vector(mostly_full)).__name__}")
+
+
+def main():
+    """Run all N-dimensional vector demonstrations"""
+    print("📐 N-DIMENSIONAL VECTORS - CSC 242 Week 2")
+    print("=" * 60)
+
+    demonstrate_nd_vector()
+    demonstrate_embeddings()
+    demonstrate_sparse_vector()
+
+    print(f"\n" + "=" * 60)
+    print("✅ All N-dimensional vector demonstrations complete!")
+
+    print(f"\n💡 Key Concepts Demonstrated:")
+    print(f"   1. Inheriting from a built-in type (array.array)")
+    print(f"   2. Overriding inherited operators (+, *, +=)")
+    print(f"   3. The buffer protocol and zero-copy NumPy views")
+    print(f"   4. Batch cosine similarity")
+    print(f"   5. Interchangeable sparse and dense representations")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,76 +7,170 @@ This file demonstrates comprehensive operator overloading in Python:
 - Comparison operators (<, <=, >, >=, ==, !=)
 - Container operators (len, [], in, iter)
 - String representation (str, repr)
+- Type-dispatch tables that pick a handler per operand type
+- In-place operators (+=, -=, *=, /=) and pools of reusable temporaries
+- Vectorized batch operators (VectorArray, FractionArray, require NumPy)
 
 Author: CSC 242 Teaching Team
 """
 
+import heapq
+import itertools
 import math
+from array import array
+from collections import OrderedDict
 from functools import total_ordering
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only the *Array classes need it
+    np = None
+
+
+# ============================================================================
+# OPERAND DISPATCH TABLES
+# ============================================================================
+
+def _not_implemented(self, other):
+    """Dispatch handler for unsupported operand types"""
+    return NotImplemented
+
+
+def _unequal(self, other):
+    """Dispatch handler for == against unrelated types"""
+    return False
+
+
+class _DispatchTable(dict):
+    """Handler cache for one operator of one class, keyed by type(other)
+
+    Each table belongs to a single (class, operator) pair, so the left type
+    is implied and only the right operand's type is looked up. rules is a
+    sequence of (operand type or tuple of types, handler) pairs. The first
+    time an operand type is seen the rules are tried in order with
+    issubclass and the winner is stored, so subclasses are registered on
+    first sight and every later call is one dict lookup instead of an
+    isinstance chain.
+    """
+    
+    __slots__ = ("_rules", "_default")
+    
+    def __init__(self, *rules, default=_not_implemented):
+        super().__init__()
+        self._rules = rules
+        self._default = default
+    
+    def __missing__(self, other_type):
+        for types, handler in self._rules:
+            if issubclass(other_type, types):
+                break
+        else:
+            handler = self._default
+        self[other_type] = handler
+        return handler
+
 
 # ============================================================================
 # MATHEMATICAL VECTOR CLASS
 # ============================================================================
 
 class Vector:
-    """A 2D vector class with comprehensive operator overloading"""
+    """An immutable 2D vector class with comprehensive operator overloading
+
+    Uses __slots__ instead of a per-instance __dict__. The squared magnitude
+    is computed once at construction so comparisons never call sqrt, and
+    magnitude() and angle() are cached on first use.
+    """
+    
+    __slots__ = ("_x", "_y", "_mag_sq", "_magnitude", "_angle")
     
     def __init__(self, x=0, y=0):
         """Initialize vector with x and y components"""
-        self.x = float(x)
-        self.y = float(y)
+        self._x = x = float(x)
+        self._y = y = float(y)
+        self._mag_sq = x * x + y * y
+    
+    @property
+    def x(self):
+        """The x component (read-only)"""
+        return self._x
+    
+    @property
+    def y(self):
+        """The y component (read-only)"""
+        return self._y
     
     # Arithmetic Operators
+    # (operand types are resolved by the _VECTOR_* dispatch tables below)
     def __add__(self, other):
         """Vector addition: v1 + v2"""
-        if isinstance(other, Vector):
-            return Vector(self.x + other.x, self.y + other.y)
-        elif isinstance(other, (int, float)):
-            return Vector(self.x + other, self.y + other)
-        else:
-            return NotImplemented
+        if type(other) is Vector:
+            return Vector(self._x + other._x, self._y + other._y)
+        return _VECTOR_ADD[type(other)](self, other)
+    
+    def _add_vector(self, other):
+        """Vector + Vector"""
+        return Vector(self._x + other._x, self._y + other._y)
+    
+    def _add_scalar(self, other):
+        """Vector + scalar (broadcast)"""
+        return Vector(self._x + other, self._y + other)
     
     def __radd__(self, other):
         """Right addition: scalar + vector"""
-        return self.__add__(other)
+        return _VECTOR_ADD[type(other)](self, other)
     
     def __sub__(self, other):
         """Vector subtraction: v1 - v2"""
-        if isinstance(other, Vector):
-            return Vector(self.x - other.x, self.y - other.y)
-        elif isinstance(other, (int, float)):
-            return Vector(self.x - other, self.y - other)
-        else:
-            return NotImplemented
+        if type(other) is Vector:
+            return Vector(self._x - other._x, self._y - other._y)
+        return _VECTOR_SUB[type(other)](self, other)
+    
+    def _sub_vector(self, other):
+        """Vector - Vector"""
+        return Vector(self._x - other._x, self._y - other._y)
+    
+    def _sub_scalar(self, other):
+        """Vector - scalar (broadcast)"""
+        return Vector(self._x - other, self._y - other)
     
     def __rsub__(self, other):
         """Right subtraction: scalar - vector"""
-        if isinstance(other, (int, float)):
-            return Vector(other - self.x, other - self.y)
-        else:
-            return NotImplemented
+        return _VECTOR_RSUB[type(other)](self, other)
+    
+    def _rsub_scalar(self, other):
+        """scalar - Vector"""
+        return Vector(other - self._x, other - self._y)
     
     def __mul__(self, other):
         """Scalar multiplication or dot product"""
-        if isinstance(other, (int, float)):
-            return Vector(self.x * other, self.y * other)
-        elif isinstance(other, Vector):
-            # Dot product
-            return self.x * other.x + self.y * other.y
-        else:
-            return NotImplemented
+        return _VECTOR_MUL[type(other)](self, other)
+    
+    def _scale(self, other):
+        """Vector * scalar"""
+        return Vector(self._x * other, self._y * other)
+    
+    def _dot(self, other):
+        """Vector * Vector (dot product)"""
+        return self._x * other._x + self._y * other._y
     
     def __rmul__(self, other):
         """Right multiplication: scalar * vector"""
-        return self.__mul__(other)
+        return _VECTOR_MUL[type(other)](self, other)
     
     def __truediv__(self, other):
         """Vector division by scalar"""
-        if isinstance(other, (int, float)) and other != 0:
-            return Vector(self.x / other, self.y / other)
-        else:
-            raise ValueError("Cannot divide vector by zero or non-scalar")
+        return _VECTOR_DIV[type(other)](self, other)
+    
+    def _divide_scalar(self, other):
+        """Vector / scalar"""
+        if other == 0:
+            self._divide_error(other)
+        return Vector(self._x / other, self._y / other)
+    
+    def _divide_error(self, other):
+        """Vector / zero or a non-scalar"""
+        raise ValueError("Cannot divide vector by zero or non-scalar")
     
     def __pow__(self, other):
         """Vector raised to power (magnitude to power)"""
@@ -89,42 +183,58 @@ class Vector:
     # Comparison Operators
     def __eq__(self, other):
         """Equality comparison: v1 == v2"""
-        if isinstance(other, Vector):
-            return abs(self.x - other.x) < 1e-10 and abs(self.y - other.y) < 1e-10
-        return False
+        return _VECTOR_EQ[type(other)](self, other)
+    
+    def _eq_vector(self, other):
+        """Vector == Vector (within 1e-10)"""
+        return abs(self._x - other._x) < 1e-10 and abs(self._y - other._y) < 1e-10
     
     def __lt__(self, other):
-        """Less than comparison (by magnitude)"""
-        if isinstance(other, Vector):
-            return self.magnitude() < other.magnitude()
-        elif isinstance(other, (int, float)):
-            return self.magnitude() < other
-        return NotImplemented
+        """Less than comparison (by magnitude, compared squared)"""
+        return _VECTOR_LT[type(other)](self, other)
+    
+    def _lt_vector(self, other):
+        """Vector < Vector"""
+        return self._mag_sq < other._mag_sq
+    
+    def _lt_scalar(self, other):
+        """Vector < scalar"""
+        return other > 0 and self._mag_sq < other * other
     
     def __le__(self, other):
         """Less than or equal comparison"""
-        return self.__lt__(other) or self.__eq__(other)
+        result = self.__lt__(other)
+        if result is NotImplemented:
+            return result
+        return result or self == other
     
     def __gt__(self, other):
-        """Greater than comparison"""
-        if isinstance(other, Vector):
-            return self.magnitude() > other.magnitude()
-        elif isinstance(other, (int, float)):
-            return self.magnitude() > other
-        return NotImplemented
+        """Greater than comparison (by magnitude, compared squared)"""
+        return _VECTOR_GT[type(other)](self, other)
+    
+    def _gt_vector(self, other):
+        """Vector > Vector"""
+        return self._mag_sq > other._mag_sq
+    
+    def _gt_scalar(self, other):
+        """Vector > scalar"""
+        return other < 0 or self._mag_sq > other * other
     
     def __ge__(self, other):
         """Greater than or equal comparison"""
-        return self.__gt__(other) or self.__eq__(other)
+        result = self.__gt__(other)
+        if result is NotImplemented:
+            return result
+        return result or self == other
     
     # Unary Operators
     def __neg__(self):
         """Negation: -vector"""
-        return Vector(-self.x, -self.y)
+        return Vector(-self._x, -self._y)
     
     def __pos__(self):
         """Positive: +vector"""
-        return Vector(self.x, self.y)
+        return Vector(self._x, self._y)
     
     def __abs__(self):
         """Absolute value: abs(vector) = magnitude"""
@@ -132,317 +242,1987 @@ class Vector:
     
     # Utility Methods
     def magnitude(self):
-        """Calculate vector magnitude"""
-        return math.sqrt(self.x ** 2 + self.y ** 2)
+        """Calculate vector magnitude (cached after the first call)"""
+        try:
+            return self._magnitude
+        except AttributeError:
+            self._magnitude = math.sqrt(self._mag_sq)
+            return self._magnitude
     
     def normalize(self):
         """Return normalized vector"""
         mag = self.magnitude()
         if mag == 0:
             return Vector(0, 0)
-        return Vector(self.x / mag, self.y / mag)
+        return Vector(self._x / mag, self._y / mag)
     
     def angle(self):
-        """Return angle in radians"""
-        return math.atan2(self.y, self.x)
+        """Return angle in radians (cached after the first call)"""
+        try:
+            return self._angle
+        except AttributeError:
+            self._angle = math.atan2(self._y, self._x)
+            return self._angle
     
     def cross(self, other):
         """2D cross product (returns scalar)"""
         if isinstance(other, Vector):
-            return self.x * other.y - self.y * other.x
+            return self._x * other._y - self._y * other._x
         raise TypeError("Cross product requires another Vector")
     
     # String Representations
     def __str__(self):
         """Human-readable string representation"""
-        return f"({self.x:.2f}, {self.y:.2f})"
+        return f"({self._x:.2f}, {self._y:.2f})"
     
     def __repr__(self):
         """Developer string representation"""
-        return f"Vector({self.x}, {self.y})"
+        return f"Vector({self._x}, {self._y})"
     
     # Hash support for use in sets/dicts
     def __hash__(self):
         """Make vector hashable"""
-        return hash((round(self.x, 10), round(self.y, 10)))
+        return hash((round(self._x, 10), round(self._y, 10)))
+
+
+# Operand dispatch for Vector binary operators (Vector +/- Vector is checked
+# inline first; the tables cover scalars and subclasses)
+_SCALARS = (int, float)
+_VECTOR_ADD = _DispatchTable((Vector, Vector._add_vector), (_SCALARS, Vector._add_scalar))
+_VECTOR_SUB = _DispatchTable((Vector, Vector._sub_vector), (_SCALARS, Vector._sub_scalar))
+_VECTOR_RSUB = _DispatchTable((_SCALARS, Vector._rsub_scalar))
+_VECTOR_MUL = _DispatchTable((_SCALARS, Vector._scale), (Vector, Vector._dot))
+_VECTOR_DIV = _DispatchTable((_SCALARS, Vector._divide_scalar), default=Vector._divide_error)
+_VECTOR_EQ = _DispatchTable((Vector, Vector._eq_vector))
+_VECTOR_LT = _DispatchTable((Vector, Vector._lt_vector), (_SCALARS, Vector._lt_scalar))
+_VECTOR_GT = _DispatchTable((Vector, Vector._gt_vector), (_SCALARS, Vector._gt_scalar))
+
+
+# ============================================================================
+# MUTABLE VECTOR (IN-PLACE UPDATES)
+# ============================================================================
+
+class MutableVector(Vector):
+    """A Vector whose components are updated in place
+
+    iadd, isub, imul, itruediv and iadd_scaled (and the matching +=, -=,
+    *=, /= operators) rewrite this object instead of building a new one,
+    so pos.iadd_scaled(vel, dt) advances a position with no temporaries.
+    The plain binary operators still return new immutable Vectors.
+
+    magnitude() and angle() are recomputed on every call rather than
+    cached, and mutable vectors are unhashable.
+    """
+    
+    __slots__ = ()
+    
+    __hash__ = None
+    
+    @property
+    def x(self):
+        """The x component"""
+        return self._x
+    
+    @x.setter
+    def x(self, value):
+        self._update(float(value), self._y)
+    
+    @property
+    def y(self):
+        """The y component"""
+        return self._y
+    
+    @y.setter
+    def y(self, value):
+        self._update(self._x, float(value))
+    
+    def _update(self, x, y):
+        """Store new float components and refresh the squared magnitude"""
+        self._x = x
+        self._y = y
+        self._mag_sq = x * x + y * y
+        return self
+    
+    def set(self, x, y):
+        """Overwrite both components and return self"""
+        return self._update(float(x), float(y))
+    
+    # Augmented Assignment Operators (each returns self)
+    def __iadd__(self, other):
+        """In-place addition: v += Vector or scalar"""
+        if isinstance(other, Vector):
+            return self._update(self._x + other._x, self._y + other._y)
+        if isinstance(other, _SCALARS):
+            return self._update(self._x + other, self._y + other)
+        return NotImplemented
+    
+    def __isub__(self, other):
+        """In-place subtraction: v -= Vector or scalar"""
+        if isinstance(other, Vector):
+            return self._update(self._x - other._x, self._y - other._y)
+        if isinstance(other, _SCALARS):
+            return self._update(self._x - other, self._y - other)
+        return NotImplemented
+    
+    def __imul__(self, other):
+        """In-place scaling: v *= scalar (v *= Vector falls back to the dot product)"""
+        if isinstance(other, _SCALARS):
+            return self._update(self._x * other, self._y * other)
+        return NotImplemented
+    
+    def __itruediv__(self, other):
+        """In-place division: v /= non-zero scalar"""
+        if not isinstance(other, _SCALARS) or other == 0:
+            raise ValueError("Cannot divide vector by zero or non-scalar")
+        return self._update(self._x / other, self._y / other)
+    
+    # Named In-place Methods (raise TypeError instead of returning NotImplemented)
+    def iadd(self, other):
+        """In-place addition of a Vector or scalar"""
+        return self._checked(self.__iadd__(other), "iadd requires a Vector or a scalar")
+    
+    def isub(self, other):
+        """In-place subtraction of a Vector or scalar"""
+        return self._checked(self.__isub__(other), "isub requires a Vector or a scalar")
+    
+    def imul(self, scalar):
+        """In-place scaling by a scalar"""
+        return self._checked(self.__imul__(scalar), "imul requires a scalar")
+    
+    def itruediv(self, scalar):
+        """In-place division by a non-zero scalar"""
+        return self.__itruediv__(scalar)
+    
+    def iadd_scaled(self, other, scalar):
+        """In-place self += other * scalar without a temporary Vector"""
+        return self._update(self._x + other._x * scalar, self._y + other._y * scalar)
+    
+    @staticmethod
+    def _checked(result, message):
+        """Raise TypeError for an unsupported operand, else pass the result through"""
+        if result is NotImplemented:
+            raise TypeError(message)
+        return result
+    
+    # Utility Methods
+    def magnitude(self):
+        """Calculate vector magnitude"""
+        return math.sqrt(self._mag_sq)
+    
+    def angle(self):
+        """Return angle in radians"""
+        return math.atan2(self._y, self._x)
+    
+    def copy(self):
+        """Return an independent MutableVector with the same components"""
+        return MutableVector(self._x, self._y)
+    
+    def freeze(self):
+        """Return an immutable Vector with the same components"""
+        return Vector(self._x, self._y)
+    
+    def __repr__(self):
+        """Developer string representation"""
+        return f"MutableVector({self._x}, {self._y})"
+
+
+# ============================================================================
+# VECTORIZED VECTOR ARRAY (STRUCTURE OF ARRAYS)
+# ============================================================================
+
+class VectorArray:
+    """A batch of 2D vectors stored as two float64 NumPy columns
+
+    Supports the same operators as Vector, but each one runs as a single
+    vectorized NumPy call over the whole batch instead of creating one
+    Python object per element. Comparisons return boolean masks.
+    """
+    
+    __hash__ = None  # __eq__ returns a mask, so arrays are unhashable
+    
+    def __init__(self, x=(), y=()):
+        """Initialize from x and y columns of equal length"""
+        if np is None:
+            raise ImportError("VectorArray requires NumPy")
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        if self.x.ndim != 1 or self.x.shape != self.y.shape:
+            raise ValueError("x and y must be 1-D columns of equal length")
+    
+    @classmethod
+    def from_vectors(cls, vectors):
+        """Build a VectorArray from a list of Vector objects"""
+        vectors = list(vectors)
+        x = np.fromiter((v.x for v in vectors), dtype=np.float64, count=len(vectors))
+        y = np.fromiter((v.y for v in vectors), dtype=np.float64, count=len(vectors))
+        return cls(x, y)
+    
+    def to_vectors(self):
+        """Convert back to a list of Vector objects (lossless)"""
+        return [Vector(x, y) for x, y in zip(self.x.tolist(), self.y.tolist())]
+    
+    def _components(self, other):
+        """Return other's (x, y) as arrays or scalars, or None if unsupported"""
+        if isinstance(other, VectorArray):
+            if len(other) != len(self):
+                raise ValueError("VectorArray lengths do not match")
+            return other.x, other.y
+        elif isinstance(other, Vector):
+            return other.x, other.y
+        elif isinstance(other, (int, float)):
+            return other, other
+        return None
+    
+    # Arithmetic Operators
+    def __add__(self, other):
+        """Element-wise addition with a VectorArray, Vector or scalar"""
+        components = self._components(other)
+        if components is None:
+            return NotImplemented
+        return VectorArray(self.x + components[0], self.y + components[1])
+    
+    def __radd__(self, other):
+        """Right addition: vector + array or scalar + array"""
+        return self.__add__(other)
+    
+    def __sub__(self, other):
+        """Element-wise subtraction"""
+        components = self._components(other)
+        if components is None:
+            return NotImplemented
+        return VectorArray(self.x - components[0], self.y - components[1])
+    
+    def __rsub__(self, other):
+        """Right subtraction: vector - array or scalar - array"""
+        components = self._components(other)
+        if components is None:
+            return NotImplemented
+        return VectorArray(components[0] - self.x, components[1] - self.y)
+    
+    def __mul__(self, other):
+        """Scalar multiplication, or element-wise dot product with vectors"""
+        if isinstance(other, (int, float)):
+            return VectorArray(self.x * other, self.y * other)
+        components = self._components(other)
+        if components is None:
+            return NotImplemented
+        return self.x * components[0] + self.y * components[1]
+    
+    def __rmul__(self, other):
+        """Right multiplication: scalar * array or vector * array"""
+        return self.__mul__(other)
+    
+    def __truediv__(self, other):
+        """Division by scalar"""
+        if isinstance(other, (int, float)) and other != 0:
+            return VectorArray(self.x / other, self.y / other)
+        else:
+            raise ValueError("Cannot divide vector array by zero or non-scalar")
+    
+    # Comparison Operators (by magnitude, returning boolean masks)
+    def __eq__(self, other):
+        """Element-wise equality within the same tolerance as Vector"""
+        components = self._components(other)
+        if components is None or isinstance(other, (int, float)):
+            return NotImplemented
+        return (np.abs(self.x - components[0]) < 1e-10) & (np.abs(self.y - components[1]) < 1e-10)
+    
+    def __ne__(self, other):
+        """Element-wise inequality"""
+        result = self.__eq__(other)
+        return result if result is NotImplemented else ~result
+    
+    def _other_magnitude(self, other):
+        """Magnitudes to compare against, or None if unsupported"""
+        if isinstance(other, (int, float)):
+            return other
+        elif isinstance(other, (Vector, VectorArray)):
+            return other.magnitude()
+        return None
+    
+    def __lt__(self, other):
+        """Less than comparison (by magnitude)"""
+        other_magnitude = self._other_magnitude(other)
+        if other_magnitude is None:
+            return NotImplemented
+        return self.magnitude() < other_magnitude
+    
+    def __le__(self, other):
+        """Less than or equal comparison"""
+        mask = self.__lt__(other)
+        if mask is NotImplemented or isinstance(other, (int, float)):
+            return mask
+        return mask | self.__eq__(other)
+    
+    def __gt__(self, other):
+        """Greater than comparison (by magnitude)"""
+        other_magnitude = self._other_magnitude(other)
+        if other_magnitude is None:
+            return NotImplemented
+        return self.magnitude() > other_magnitude
+    
+    def __ge__(self, other):
+        """Greater than or equal comparison"""
+        mask = self.__gt__(other)
+        if mask is NotImplemented or isinstance(other, (int, float)):
+            return mask
+        return mask | self.__eq__(other)
+    
+    # Unary Operators
+    def __neg__(self):
+        """Negation: -array"""
+        return VectorArray(-self.x, -self.y)
+    
+    def __pos__(self):
+        """Positive: +array (a copy)"""
+        return VectorArray(self.x.copy(), self.y.copy())
+    
+    def __abs__(self):
+        """Absolute value: magnitudes of every vector"""
+        return self.magnitude()
+    
+    # Utility Methods
+    def magnitude(self):
+        """Calculate the magnitude of every vector"""
+        return np.sqrt(self.x * self.x + self.y * self.y)
+    
+    def normalize(self):
+        """Return normalized vectors (zero vectors stay zero)"""
+        mag = self.magnitude()
+        safe = np.where(mag == 0, 1.0, mag)
+        return VectorArray(np.where(mag == 0, 0.0, self.x / safe),
+                           np.where(mag == 0, 0.0, self.y / safe))
+    
+    def angle(self):
+        """Return every angle in radians"""
+        return np.arctan2(self.y, self.x)
+    
+    def cross(self, other):
+        """2D cross products with a VectorArray or Vector"""
+        if isinstance(other, (Vector, VectorArray)):
+            components = self._components(other)
+            return self.x * components[1] - self.y * components[0]
+        raise TypeError("Cross product requires a Vector or VectorArray")
+    
+    # Container Protocol
+    def __len__(self):
+        """Number of vectors"""
+        return len(self.x)
+    
+    def __getitem__(self, index):
+        """Integer index returns a Vector; slices and masks return a VectorArray"""
+        if isinstance(index, (int, np.integer)):
+            return Vector(float(self.x[index]), float(self.y[index]))
+        return VectorArray(self.x[index], self.y[index])
+    
+    def __iter__(self):
+        """Iterate as Vector objects"""
+        return iter(self.to_vectors())
+    
+    # String Representations
+    def __str__(self):
+        """Human-readable string representation"""
+        return f"VectorArray[{len(self)}]"
+    
+    def __repr__(self):
+        """Developer string representation"""
+        return f"VectorArray({self.x.tolist()!r}, {self.y.tolist()!r})"
 
 
 # ============================================================================
 # FRACTION CLASS WITH FULL OPERATOR SUPPORT
 # ============================================================================
 
+class _InternCache:
+    """LRU table of shared Fraction instances and its hit statistics"""
+    
+    __slots__ = ("entries", "max_size", "limit", "hits", "misses")
+    
+    def __init__(self, max_size, limit):
+        if max_size <= 0 or limit <= 0:
+            raise ValueError("max_size and limit must be positive")
+        self.entries = OrderedDict()  # (numerator, denominator) -> Fraction
+        self.max_size = max_size
+        self.limit = limit
+        self.hits = 0
+        self.misses = 0
+
+
 @total_ordering  # Automatically generates comparison operators
 class Fraction:
-    """A fraction class with comprehensive operator overloading"""
-    
-    def __init__(self, numerator, denominator=1):
-        """Initialize fraction and reduce to lowest terms"""
+    """An immutable fraction class with comprehensive operator overloading
+
+    Reduction uses math.gcd. Arithmetic between two Fractions uses the
+    Henrici cross-gcd formulas, which keep intermediate products small and
+    yield results that are already in lowest terms, so no second reduction
+    is needed. Integer operands take fast paths that skip building a
+    temporary Fraction.
+
+    An optional interning cache (see enable_interning) makes constructors
+    and arithmetic return one shared instance per small reduced value.
+    """
+    
+    __slots__ = ("_numerator", "_denominator")
+    
+    # Interning cache: None while disabled, else an _InternCache
+    _interning = None
+    
+    def __new__(cls, numerator, denominator=1):
+        """Create a fraction reduced to lowest terms"""
+        cache = Fraction._interning
+        if cache is not None and type(numerator) is int and type(denominator) is int:
+            # Cached keys are reduced, so a hit needs no gcd at all
+            fraction = cache.entries.get((numerator, denominator))
+            if fraction is not None and cls is Fraction:
+                try:
+                    cache.entries.move_to_end((numerator, denominator))
+                except KeyError:
+                    pass  # evicted by another thread since the get; still a valid value
+                cache.hits += 1
+                return fraction
+        
         if denominator == 0:
             raise ValueError("Denominator cannot be zero")
         
+        # Floats and Fractions convert exactly through their integer ratio
+        if type(numerator) is not int or type(denominator) is not int:
+            top, top_scale = cls._integer_ratio(numerator)
+            bottom, bottom_scale = cls._integer_ratio(denominator)
+            numerator = top * bottom_scale
+            denominator = top_scale * bottom
+        
         # Handle negative fractions
         if denominator < 0:
             numerator = -numerator
             denominator = -denominator
         
         # Reduce to lowest terms
-        gcd_val = self._gcd(abs(numerator), abs(denominator))
-        self.numerator = numerator // gcd_val
-        self.denominator = denominator // gcd_val
+        gcd_val = math.gcd(numerator, denominator)
+        if gcd_val != 1:
+            numerator //= gcd_val
+            denominator //= gcd_val
+        return cls._from_reduced(numerator, denominator)
     
     @staticmethod
-    def _gcd(a, b):
-        """Calculate greatest common divisor"""
-        while b:
-            a, b = b, a % b
-        return a
+    def _integer_ratio(value):
+        """Return (numerator, denominator) integers equal to an int, float or Fraction"""
+        if isinstance(value, int):
+            return int(value), 1
+        elif isinstance(value, Fraction):
+            return value._numerator, value._denominator
+        return value.as_integer_ratio()
+    
+    @classmethod
+    def _from_reduced(cls, numerator, denominator):
+        """Build a fraction from integers already in lowest terms (no gcd)"""
+        cache = Fraction._interning
+        if (cache is not None and cls is Fraction and denominator <= cache.limit
+                and -cache.limit <= numerator <= cache.limit):
+            key = (numerator, denominator)
+            entries = cache.entries
+            fraction = entries.get(key)
+            if fraction is not None:
+                try:
+                    entries.move_to_end(key)
+                except KeyError:
+                    pass  # evicted by another thread since the get; still a valid value
+                cache.hits += 1
+                return fraction
+            cache.misses += 1
+            fraction = object.__new__(cls)
+            fraction._numerator = numerator
+            fraction._denominator = denominator
+            entries[key] = fraction
+            if len(entries) > cache.max_size:
+                try:
+                    entries.popitem(last=False)  # evict the least recently used
+                except KeyError:
+                    pass  # another thread emptied the cache first
+            return fraction
+        
+        fraction = object.__new__(cls)
+        fraction._numerator = numerator
+        fraction._denominator = denominator
+        return fraction
+    
+    # Interning Cache
+    @classmethod
+    def enable_interning(cls, max_size=1024, limit=1000):
+        """Share one instance per reduced value with |numerator|, denominator <= limit
+
+        At most max_size values are kept; the least recently used is evicted.
+        Enabling resets the cache and its statistics. Lookups are safe from
+        several threads without a lock: a key evicted by another thread
+        between the lookup and the LRU update is simply left evicted. Under
+        contention the hit/miss counters are approximate.
+        """
+        Fraction._interning = _InternCache(max_size, limit)
+    
+    @classmethod
+    def disable_interning(cls):
+        """Turn interning off and drop the cache"""
+        Fraction._interning = None
+    
+    @classmethod
+    def intern_stats(cls):
+        """Return cache hits, misses, hit rate and size as a dictionary"""
+        cache = Fraction._interning
+        if cache is None:
+            return {"enabled": False, "hits": 0, "misses": 0, "hit_rate": 0.0,
+                    "size": 0, "max_size": 0}
+        lookups = cache.hits + cache.misses
+        return {
+            "enabled": True,
+            "hits": cache.hits,
+            "misses": cache.misses,
+            "hit_rate": cache.hits / lookups if lookups else 0.0,
+            "size": len(cache.entries),
+            "max_size": cache.max_size,
+        }
+    
+    def __reduce__(self):
+        """Pickle support: rebuild through the constructor"""
+        return (type(self), (self._numerator, self._denominator))
+    
+    # Summation Kernels
+    @staticmethod
+    def _term(value):
+        """Return (numerator, denominator) integers for a summation term"""
+        if isinstance(value, Fraction):
+            return value._numerator, value._denominator
+        elif isinstance(value, int):
+            return value, 1
+        elif isinstance(value, float):
+            return value.as_integer_ratio()
+        raise TypeError(f"Cannot sum {type(value).__name__} as a Fraction")
+    
+    @classmethod
+    def _sum_groups(cls, groups):
+        """Add {denominator: numerator} groups by pairwise tree reduction"""
+        terms = sorted((d, n) for d, n in groups.items() if n)
+        while len(terms) > 1:
+            merged = []
+            for i in range(0, len(terms) - 1, 2):
+                d1, n1 = terms[i]
+                d2, n2 = terms[i + 1]
+                lcm = d1 // math.gcd(d1, d2) * d2
+                merged.append((lcm, n1 * (lcm // d1) + n2 * (lcm // d2)))
+            if len(terms) % 2:
+                merged.append(terms[-1])
+            terms = merged
+        if not terms:
+            return cls(0)
+        denominator, numerator = terms[0]
+        return cls(numerator, denominator)  # the only gcd reduction
+    
+    @classmethod
+    def sum(cls, iterable):
+        """Exact sum of Fractions, ints and floats, reduced once at the end
+
+        Terms are bucketed by denominator, so each bucket is plain integer
+        addition. The buckets are then combined pairwise over their LCMs,
+        which keeps the operands balanced in size. The result equals the
+        naive sum() exactly.
+        """
+        groups = {}
+        for value in iterable:
+            numerator, denominator = cls._term(value)
+            groups[denominator] = groups.get(denominator, 0) + numerator
+        return cls._sum_groups(groups)
+    
+    @classmethod
+    def sum_ratios(cls, numerators, denominators):
+        """Exact sum of numerators[i] / denominators[i] for positive integer denominators
+
+        The same kernel as sum() for data already split into integer
+        columns (e.g. packed arrays), without building Fraction objects.
+        """
+        groups = {}
+        get = groups.get
+        for numerator, denominator in zip(numerators, denominators):
+            groups[denominator] = get(denominator, 0) + numerator
+        return cls._sum_groups(groups)
+    
+    @classmethod
+    def dot(cls, a, b):
+        """Exact dot product sum(x * y for x, y in zip(a, b)), reduced once"""
+        a = list(a)
+        b = list(b)
+        if len(a) != len(b):
+            raise ValueError("Dot product requires sequences of equal length")
+        groups = {}
+        for x, y in zip(a, b):
+            na, da = cls._term(x)
+            nb, db = cls._term(y)
+            denominator = da * db
+            groups[denominator] = groups.get(denominator, 0) + na * nb
+        return cls._sum_groups(groups)
+    
+    @property
+    def numerator(self):
+        """The numerator in lowest terms (read-only)"""
+        return self._numerator
+    
+    @property
+    def denominator(self):
+        """The positive denominator in lowest terms (read-only)"""
+        return self._denominator
+    
+    # Arithmetic Operators (operand types are resolved by the _FRACTION_*
+    # dispatch tables below; floats are used through as_integer_ratio()
+    # directly instead of building a temporary Fraction)
+    @staticmethod
+    def _add_terms(na, da, nb, db):
+        """Add two reduced fractions (Henrici: gcd of the denominators only)"""
+        g = math.gcd(da, db)
+        if g == 1:
+            return Fraction._from_reduced(na * db + nb * da, da * db)
+        s = da // g
+        t = na * (db // g) + nb * s
+        g2 = math.gcd(t, g)
+        if g2 == 1:
+            return Fraction._from_reduced(t, s * db)
+        return Fraction._from_reduced(t // g2, s * (db // g2))
     
-    # Arithmetic Operators
     def __add__(self, other):
         """Addition: f1 + f2 or f + number"""
-        if isinstance(other, Fraction):
-            num = self.numerator * other.denominator + other.numerator * self.denominator
-            den = self.denominator * other.denominator
-            return Fraction(num, den)
-        elif isinstance(other, (int, float)):
-            return self + Fraction(other)
-        else:
-            return NotImplemented
+        if type(other) is Fraction:
+            return Fraction._add_terms(self._numerator, self._denominator,
+                                       other._numerator, other._denominator)
+        return _FRACTION_ADD[type(other)](self, other)
+    
+    def _add_fraction(self, other):
+        """Fraction + Fraction subclass"""
+        return Fraction._add_terms(self._numerator, self._denominator,
+                                   other._numerator, other._denominator)
+    
+    def _add_int(self, other):
+        """Fraction + int"""
+        return Fraction._from_reduced(self._numerator + other * self._denominator,
+                                      self._denominator)
+    
+    def _add_float(self, other):
+        """Fraction + float (exact)"""
+        return Fraction._add_terms(self._numerator, self._denominator,
+                                   *other.as_integer_ratio())
     
     def __radd__(self, other):
         """Right addition: number + fraction"""
-        return self.__add__(other)
+        return _FRACTION_ADD[type(other)](self, other)
     
     def __sub__(self, other):
         """Subtraction: f1 - f2 or f - number"""
-        if isinstance(other, Fraction):
-            num = self.numerator * other.denominator - other.numerator * self.denominator
-            den = self.denominator * other.denominator
-            return Fraction(num, den)
-        elif isinstance(other, (int, float)):
-            return self - Fraction(other)
-        else:
-            return NotImplemented
+        if type(other) is Fraction:
+            return Fraction._add_terms(self._numerator, self._denominator,
+                                       -other._numerator, other._denominator)
+        return _FRACTION_SUB[type(other)](self, other)
+    
+    def _sub_fraction(self, other):
+        """Fraction - Fraction subclass"""
+        return Fraction._add_terms(self._numerator, self._denominator,
+                                   -other._numerator, other._denominator)
+    
+    def _sub_int(self, other):
+        """Fraction - int"""
+        return Fraction._from_reduced(self._numerator - other * self._denominator,
+                                      self._denominator)
+    
+    def _sub_float(self, other):
+        """Fraction - float (exact)"""
+        nb, db = other.as_integer_ratio()
+        return Fraction._add_terms(self._numerator, self._denominator, -nb, db)
     
     def __rsub__(self, other):
         """Right subtraction: number - fraction"""
-        if isinstance(other, (int, float)):
-            return Fraction(other) - self
-        else:
-            return NotImplemented
+        return _FRACTION_RSUB[type(other)](self, other)
+    
+    def _rsub_int(self, other):
+        """int - Fraction"""
+        return Fraction._from_reduced(other * self._denominator - self._numerator,
+                                      self._denominator)
+    
+    def _rsub_float(self, other):
+        """float - Fraction (exact)"""
+        na, da = other.as_integer_ratio()
+        return Fraction._add_terms(na, da, -self._numerator, self._denominator)
+    
+    @staticmethod
+    def _multiply(na, da, nb, db):
+        """Multiply two reduced fractions, cancelling across before multiplying"""
+        g1 = math.gcd(na, db)
+        if g1 != 1:
+            na //= g1
+            db //= g1
+        g2 = math.gcd(nb, da)
+        if g2 != 1:
+            nb //= g2
+            da //= g2
+        return Fraction._from_reduced(na * nb, da * db)
     
     def __mul__(self, other):
         """Multiplication: f1 * f2 or f * number"""
-        if isinstance(other, Fraction):
-            return Fraction(self.numerator * other.numerator, 
-                          self.denominator * other.denominator)
-        elif isinstance(other, (int, float)):
-            return self * Fraction(other)
-        else:
-            return NotImplemented
+        if type(other) is Fraction:
+            return Fraction._multiply(self._numerator, self._denominator,
+                                      other._numerator, other._denominator)
+        return _FRACTION_MUL[type(other)](self, other)
+    
+    def _mul_fraction(self, other):
+        """Fraction * Fraction subclass"""
+        return Fraction._multiply(self._numerator, self._denominator,
+                                  other._numerator, other._denominator)
+    
+    def _mul_int(self, other):
+        """Fraction * int"""
+        g = math.gcd(other, self._denominator)
+        return Fraction._from_reduced(self._numerator * (other // g),
+                                      self._denominator // g)
+    
+    def _mul_float(self, other):
+        """Fraction * float (exact)"""
+        return Fraction._multiply(self._numerator, self._denominator,
+                                  *other.as_integer_ratio())
     
     def __rmul__(self, other):
         """Right multiplication: number * fraction"""
-        return self.__mul__(other)
+        return _FRACTION_MUL[type(other)](self, other)
+    
+    @staticmethod
+    def _divide(na, da, nb, db):
+        """Divide two reduced fractions (nb/db must be non-zero)"""
+        if nb == 0:
+            raise ZeroDivisionError("Cannot divide by zero")
+        if nb < 0:
+            nb, db = -nb, -db
+        return Fraction._multiply(na, da, db, nb)
     
     def __truediv__(self, other):
         """Division: f1 / f2 or f / number"""
-        if isinstance(other, Fraction):
-            if other.numerator == 0:
-                raise ZeroDivisionError("Cannot divide by zero")
-            return Fraction(self.numerator * other.denominator,
-                          self.denominator * other.numerator)
-        elif isinstance(other, (int, float)):
-            if other == 0:
-                raise ZeroDivisionError("Cannot divide by zero")
-            return self / Fraction(other)
-        else:
-            return NotImplemented
+        if type(other) is Fraction:
+            return Fraction._divide(self._numerator, self._denominator,
+                                    other._numerator, other._denominator)
+        return _FRACTION_DIV[type(other)](self, other)
+    
+    def _div_fraction(self, other):
+        """Fraction / Fraction subclass"""
+        return Fraction._divide(self._numerator, self._denominator,
+                                other._numerator, other._denominator)
+    
+    def _div_int(self, other):
+        """Fraction / int"""
+        if other == 0:
+            raise ZeroDivisionError("Cannot divide by zero")
+        g = math.gcd(self._numerator, other)
+        numerator = self._numerator // g
+        denominator = self._denominator * (other // g)
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        return Fraction._from_reduced(numerator, denominator)
+    
+    def _div_float(self, other):
+        """Fraction / float (exact)"""
+        if other == 0:
+            raise ZeroDivisionError("Cannot divide by zero")
+        return Fraction._divide(self._numerator, self._denominator,
+                                *other.as_integer_ratio())
     
     def __rtruediv__(self, other):
         """Right division: number / fraction"""
-        if isinstance(other, (int, float)):
-            return Fraction(other) / self
-        else:
-            return NotImplemented
+        return _FRACTION_RDIV[type(other)](self, other)
+    
+    def _rdiv_number(self, other):
+        """int or float / Fraction"""
+        na, da = Fraction._integer_ratio(other)
+        return Fraction._divide(na, da, self._numerator, self._denominator)
     
     def __pow__(self, other):
         """Exponentiation: fraction ** power"""
         if isinstance(other, int):
             if other >= 0:
-                return Fraction(self.numerator ** other, self.denominator ** other)
+                # Powers of coprime integers stay coprime
+                return Fraction._from_reduced(self._numerator ** other,
+                                              self._denominator ** other)
             else:
-                return Fraction(self.denominator ** abs(other), self.numerator ** abs(other))
+                return Fraction(self._denominator ** abs(other), self._numerator ** abs(other))
         else:
             return NotImplemented
     
     # Comparison Operators (only need __eq__ and __lt__ with @total_ordering)
     def __eq__(self, other):
         """Equality comparison"""
-        if isinstance(other, Fraction):
-            return (self.numerator == other.numerator and 
-                   self.denominator == other.denominator)
-        elif isinstance(other, (int, float)):
-            return self == Fraction(other)
-        return False
+        if type(other) is Fraction:
+            return (self._numerator == other._numerator and 
+                   self._denominator == other._denominator)
+        return _FRACTION_EQ[type(other)](self, other)
+    
+    def _eq_fraction(self, other):
+        """Fraction == Fraction subclass"""
+        return (self._numerator == other._numerator and 
+               self._denominator == other._denominator)
+    
+    def _eq_int(self, other):
+        """Fraction == int"""
+        return self._denominator == 1 and self._numerator == other
+    
+    def _eq_float(self, other):
+        """Fraction == float (exact)"""
+        return (self._numerator, self._denominator) == other.as_integer_ratio()
     
     def __lt__(self, other):
         """Less than comparison"""
-        if isinstance(other, Fraction):
-            return (self.numerator * other.denominator < 
-                   other.numerator * self.denominator)
-        elif isinstance(other, (int, float)):
-            return self < Fraction(other)
-        return NotImplemented
+        if type(other) is Fraction:
+            return (self._numerator * other._denominator < 
+                   other._numerator * self._denominator)
+        return _FRACTION_LT[type(other)](self, other)
+    
+    def _lt_fraction(self, other):
+        """Fraction < Fraction subclass"""
+        return (self._numerator * other._denominator < 
+               other._numerator * self._denominator)
+    
+    def _lt_int(self, other):
+        """Fraction < int"""
+        return self._numerator < other * self._denominator
+    
+    def _lt_float(self, other):
+        """Fraction < float (exact)"""
+        nb, db = other.as_integer_ratio()
+        return self._numerator * db < nb * self._denominator
     
     # Unary Operators
     def __neg__(self):
         """Negation: -fraction"""
-        return Fraction(-self.numerator, self.denominator)
+        return Fraction._from_reduced(-self._numerator, self._denominator)
     
     def __pos__(self):
         """Positive: +fraction"""
-        return Fraction(self.numerator, self.denominator)
+        return Fraction._from_reduced(self._numerator, self._denominator)
     
     def __abs__(self):
         """Absolute value: abs(fraction)"""
-        return Fraction(abs(self.numerator), self.denominator)
+        return Fraction._from_reduced(abs(self._numerator), self._denominator)
     
     # Type Conversion
     def __int__(self):
         """Convert to integer"""
-        return self.numerator // self.denominator
+        return self._numerator // self._denominator
     
     def __float__(self):
         """Convert to float"""
-        return self.numerator / self.denominator
+        return self._numerator / self._denominator
     
     # String Representations
     def __str__(self):
         """Human-readable representation"""
-        if self.denominator == 1:
-            return str(self.numerator)
-        return f"{self.numerator}/{self.denominator}"
+        if self._denominator == 1:
+            return str(self._numerator)
+        return f"{self._numerator}/{self._denominator}"
     
     def __repr__(self):
         """Developer representation"""
-        return f"Fraction({self.numerator}, {self.denominator})"
+        return f"Fraction({self._numerator}, {self._denominator})"
     
     # Hash support
     def __hash__(self):
         """Make fraction hashable"""
-        return hash((self.numerator, self.denominator))
+        return hash((self._numerator, self._denominator))
+
+
+# Operand dispatch for Fraction binary operators (the exact Fraction type is
+# checked inline first; the tables cover subclasses, ints and floats)
+_FRACTION_ADD = _DispatchTable((Fraction, Fraction._add_fraction), (int, Fraction._add_int),
+                               (float, Fraction._add_float))
+_FRACTION_SUB = _DispatchTable((Fraction, Fraction._sub_fraction), (int, Fraction._sub_int),
+                               (float, Fraction._sub_float))
+_FRACTION_RSUB = _DispatchTable((int, Fraction._rsub_int), (float, Fraction._rsub_float))
+_FRACTION_MUL = _DispatchTable((Fraction, Fraction._mul_fraction), (int, Fraction._mul_int),
+                               (float, Fraction._mul_float))
+_FRACTION_DIV = _DispatchTable((Fraction, Fraction._div_fraction), (int, Fraction._div_int),
+                               (float, Fraction._div_float))
+_FRACTION_RDIV = _DispatchTable((_SCALARS, Fraction._rdiv_number))
+_FRACTION_EQ = _DispatchTable((Fraction, Fraction._eq_fraction), (int, Fraction._eq_int),
+                              (float, Fraction._eq_float), default=_unequal)
+_FRACTION_LT = _DispatchTable((Fraction, Fraction._lt_fraction), (int, Fraction._lt_int),
+                              (float, Fraction._lt_float))
+
+
+# ============================================================================
+# OBJECT POOLS FOR TEMPORARIES
+# ============================================================================
+
+class _ObjectPool:
+    """Bounded free list of released temporaries, reinitialized on acquire
+
+    The caller owns the release contract: release an object only when no
+    other variable, container or dict key can still reach it. The pool
+    cannot check this, and the next acquire() rewrites whatever was
+    released, so releasing a stored value silently changes it.
+    At most max_size objects are kept; extra releases go to the garbage
+    collector as usual.
+    """
+    
+    __slots__ = ("_free", "max_size", "created", "reused")
+    
+    # The only type a pool accepts back (set by each subclass)
+    _type = None
+    
+    def __init__(self, max_size=1024):
+        if max_size <= 0:
+            raise ValueError("max_size must be positive")
+        self._free = []
+        self.max_size = max_size
+        self.created = 0
+        self.reused = 0
+    
+    def release(self, obj):
+        """Hand a temporary that nothing else references back to the pool"""
+        if (type(obj) is self._type and len(self._free) < self.max_size
+                and not self._pinned(obj)):
+            self._free.append(obj)
+    
+    def _pinned(self, obj):
+        """True if obj must never be recycled (checked on every release)"""
+        return False
+    
+    def clear(self):
+        """Drop every pooled object and reset the statistics"""
+        self._free.clear()
+        self.created = 0
+        self.reused = 0
+    
+    def __len__(self):
+        """Number of objects waiting in the pool"""
+        return len(self._free)
+    
+    def __repr__(self):
+        """Developer representation with pool statistics"""
+        return (f"{type(self).__name__}(size={len(self._free)}, max_size={self.max_size}, "
+                f"created={self.created}, reused={self.reused})")
+
+
+class VectorPool(_ObjectPool):
+    """Pool of MutableVector temporaries"""
+    
+    __slots__ = ()
+    
+    _type = MutableVector
+    
+    def acquire(self, x=0, y=0):
+        """Return a MutableVector set to (x, y), reusing a released one if possible"""
+        free = self._free
+        if free:
+            self.reused += 1
+            return free.pop()._update(float(x), float(y))
+        self.created += 1
+        return MutableVector(x, y)
+
+
+class FractionPool(_ObjectPool):
+    """Pool of Fraction temporaries (use with great care)
+
+    WARNING: acquire() rewrites a released Fraction in place, which breaks
+    the immutability every other Fraction guarantees. If a released value
+    is still held anywhere (a list, a dict key, a set, another variable),
+    that holder silently sees a different number and a hashed container
+    is corrupted. Limit it to short, local temporaries that are created,
+    consumed and released within the same few lines, as in
+    benchmark_temporaries. Interned instances are never pooled.
+    """
+    
+    __slots__ = ()
+    
+    _type = Fraction
+    
+    def acquire(self, numerator, denominator=1):
+        """Return Fraction(numerator, denominator), reusing a released one for int arguments"""
+        free = self._free
+        if not free or type(numerator) is not int or type(denominator) is not int:
+            self.created += 1
+            return Fraction(numerator, denominator)
+        if denominator == 0:
+            raise ValueError("Denominator cannot be zero")
+        if denominator < 0:
+            numerator = -numerator
+            denominator = -denominator
+        gcd_val = math.gcd(numerator, denominator)
+        if gcd_val != 1:
+            numerator //= gcd_val
+            denominator //= gcd_val
+        fraction = free.pop()
+        fraction._numerator = numerator
+        fraction._denominator = denominator
+        self.reused += 1
+        return fraction
+    
+    def _pinned(self, fraction):
+        """True for an instance held by the interning cache"""
+        cache = Fraction._interning
+        return (cache is not None
+                and cache.entries.get((fraction._numerator, fraction._denominator)) is fraction)
+
+
+# ============================================================================
+# VECTORIZED FRACTION ARRAY (INT64 COLUMNS WITH BIG-INT FALLBACK)
+# ============================================================================
+
+# int64 columns only hold values below this bound, so one multiply-add of
+# two such values can be checked against it in float64 without overflowing
+_INT64_LIMIT = 2 ** 62
+
+
+def _fits_int64(column):
+    """Check if an object column of Python ints can be demoted to int64"""
+    return all(-_INT64_LIMIT < value < _INT64_LIMIT for value in column.tolist())
+
+
+class FractionArray:
+    """A batch of fractions stored as numerator and denominator columns
+
+    Columns are NumPy int64 while every value is small. Each operation first
+    bounds its intermediate products in float64. If any element could
+    overflow int64, that operation runs on object columns of Python ints
+    instead. Results are demoted back to int64 once they fit again, so they
+    always match scalar Fraction arithmetic exactly.
+    """
+    
+    __hash__ = None  # comparisons return masks, so arrays are unhashable
+    
+    def __init__(self, numerators, denominators=None):
+        """Initialize from numerator and denominator columns and reduce"""
+        if np is None:
+            raise ImportError("FractionArray requires NumPy")
+        numerators = self._column(numerators)
+        if denominators is None:
+            denominators = np.ones(numerators.shape, dtype=numerators.dtype)
+        else:
+            denominators = self._column(denominators)
+        if numerators.ndim != 1 or numerators.shape != denominators.shape:
+            raise ValueError("Numerators and denominators must be 1-D columns of equal length")
+        if np.any(denominators == 0):
+            raise ValueError("Denominator cannot be zero")
+        
+        negative = denominators < 0
+        numerators = np.where(negative, -numerators, numerators)
+        denominators = np.where(negative, -denominators, denominators)
+        self._set(*self._reduce(numerators, denominators))
+    
+    @staticmethod
+    def _column(values):
+        """Convert integers to an int64 column, or an object column if any are too big"""
+        column = np.asarray(values, dtype=object) if not isinstance(values, np.ndarray) else values
+        if column.dtype == object:
+            if not all(isinstance(value, (int, np.integer)) for value in column.tolist()):
+                raise TypeError("FractionArray columns must hold integers")
+            if _fits_int64(column):
+                return column.astype(np.int64)
+            return column
+        if column.dtype.kind not in "iu":
+            raise TypeError("FractionArray columns must hold integers")
+        # Range-check before casting: uint64 values >= 2**63 would wrap in int64
+        if column.size and (int(column.max()) >= _INT64_LIMIT or int(column.min()) <= -_INT64_LIMIT):
+            return column.astype(object)
+        return column.astype(np.int64)
+    
+    @staticmethod
+    def _reduce(numerators, denominators):
+        """Divide both columns by their element-wise gcd"""
+        g = np.gcd(numerators, denominators)
+        return numerators // g, denominators // g
+    
+    def _set(self, numerators, denominators):
+        """Store reduced columns, demoting object columns that fit in int64"""
+        if numerators.dtype == object or denominators.dtype == object:
+            if _fits_int64(numerators) and _fits_int64(denominators):
+                numerators = numerators.astype(np.int64)
+                denominators = denominators.astype(np.int64)
+            else:
+                numerators = numerators.astype(object)
+                denominators = denominators.astype(object)
+        self.numerators = numerators
+        self.denominators = denominators
+    
+    @classmethod
+    def _from_reduced(cls, numerators, denominators):
+        """Build from columns already in lowest terms (no gcd)"""
+        result = object.__new__(cls)
+        result._set(numerators, denominators)
+        return result
+    
+    @classmethod
+    def from_fractions(cls, fractions):
+        """Build a FractionArray from Fractions or ints"""
+        pairs = [Fraction._term(f) for f in fractions]
+        return cls([n for n, _ in pairs], [d for _, d in pairs])
+    
+    def to_fractions(self):
+        """Convert back to a list of Fraction objects"""
+        return [Fraction._from_reduced(int(n), int(d))
+                for n, d in zip(self.numerators.tolist(), self.denominators.tolist())]
+    
+    def is_promoted(self):
+        """Check if the columns currently use the big-int object fallback"""
+        return self.numerators.dtype == object
+    
+    def _operand(self, other):
+        """Return other's (numerators, denominators) columns, or None if unsupported"""
+        if isinstance(other, FractionArray):
+            if len(other) != len(self):
+                raise ValueError("FractionArray lengths do not match")
+            return other.numerators, other.denominators
+        elif isinstance(other, (Fraction, int)):
+            numerator, denominator = Fraction._term(other)
+            return self._column([numerator]), self._column([denominator])
+        return None
+    
+    @staticmethod
+    def _safe(*products):
+        """Check if every sum of products fits in int64, judged in float64
+
+        Each argument is a list of (left, right) column pairs whose products
+        are added together.
+        """
+        for pairs in products:
+            if any(left.dtype == object or right.dtype == object for left, right in pairs):
+                return False
+            bound = sum(np.abs(left.astype(np.float64)) * np.abs(right.astype(np.float64))
+                        for left, right in pairs)
+            if np.any(bound >= _INT64_LIMIT):
+                return False
+        return True
+    
+    @staticmethod
+    def _big(*columns):
+        """Promote columns to object dtype so arithmetic uses Python ints"""
+        return [column.astype(object) for column in columns]
+    
+    # Arithmetic Operators
+    def _add(self, nb, db):
+        """Element-wise addition with gcd-scaled cross terms"""
+        na, da = self.numerators, self.denominators
+        if not self._safe([(da, db)]):
+            na, da, nb, db = self._big(na, da, nb, db)
+        g = np.gcd(da, db)
+        sa = da // g
+        sb = db // g
+        if not self._safe([(na, sb), (nb, sa)], [(sa, db)]):
+            na, nb, sa, sb, db = self._big(na, nb, sa, sb, db)
+        numerators = na * sb + nb * sa
+        denominators = sa * db
+        return FractionArray._from_reduced(*self._reduce(numerators, denominators))
+    
+    def __add__(self, other):
+        """Addition: array + array, Fraction or int"""
+        columns = self._operand(other)
+        if columns is None:
+            return NotImplemented
+        return self._add(*columns)
+    
+    def __radd__(self, other):
+        """Right addition: number + array"""
+        return self.__add__(other)
+    
+    def __sub__(self, other):
+        """Subtraction: array - array, Fraction or int"""
+        columns = self._operand(other)
+        if columns is None:
+            return NotImplemented
+        return self._add(-columns[0], columns[1])
+    
+    def __rsub__(self, other):
+        """Right subtraction: number - array"""
+        columns = self._operand(other)
+        if columns is None:
+            return NotImplemented
+        return (-self)._add(*columns)
+    
+    def _multiply(self, nb, db):
+        """Element-wise multiplication, cancelling across before multiplying"""
+        na, da = self.numerators, self.denominators
+        g1 = np.gcd(na, db)
+        g2 = np.gcd(nb, da)
+        na, db = na // g1, db // g1
+        nb, da = nb // g2, da // g2
+        if not self._safe([(na, nb)], [(da, db)]):
+            na, nb, da, db = self._big(na, nb, da, db)
+        return FractionArray._from_reduced(na * nb, da * db)
+    
+    def __mul__(self, other):
+        """Multiplication: array * array, Fraction or int"""
+        columns = self._operand(other)
+        if columns is None:
+            return NotImplemented
+        return self._multiply(*columns)
+    
+    def __rmul__(self, other):
+        """Right multiplication: number * array"""
+        return self.__mul__(other)
+    
+    def __truediv__(self, other):
+        """Division: array / array, Fraction or int"""
+        columns = self._operand(other)
+        if columns is None:
+            return NotImplemented
+        return self._multiply(*self._reciprocal(*columns))
+    
+    def __rtruediv__(self, other):
+        """Right division: number / array"""
+        columns = self._operand(other)
+        if columns is None:
+            return NotImplemented
+        reciprocal = FractionArray._from_reduced(*self._reciprocal(self.numerators, self.denominators))
+        return reciprocal._multiply(*columns)
+    
+    @staticmethod
+    def _reciprocal(numerators, denominators):
+        """Swap columns, keeping denominators positive"""
+        if np.any(numerators == 0):
+            raise ZeroDivisionError("Cannot divide by zero")
+        negative = numerators < 0
+        return (np.where(negative, -denominators, denominators),
+                np.where(negative, -numerators, numerators))
+    
+    # Comparison Operators (boolean masks)
+    def _cross(self, other):
+        """Return cross products (a * d, c * b) for comparing with other"""
+        columns = self._operand(other)
+        if columns is None:
+            return None
+        na, da = self.numerators, self.denominators
+        nb, db = columns
+        if not self._safe([(na, db)], [(nb, da)]):
+            na, da, nb, db = self._big(na, da, nb, db)
+        return na * db, nb * da
+    
+    def __eq__(self, other):
+        """Element-wise equality"""
+        cross = self._cross(other)
+        return NotImplemented if cross is None else np.asarray(cross[0] == cross[1], dtype=bool)
+    
+    def __ne__(self, other):
+        """Element-wise inequality"""
+        cross = self._cross(other)
+        return NotImplemented if cross is None else np.asarray(cross[0] != cross[1], dtype=bool)
+    
+    def __lt__(self, other):
+        """Element-wise less than"""
+        cross = self._cross(other)
+        return NotImplemented if cross is None else np.asarray(cross[0] < cross[1], dtype=bool)
+    
+    def __le__(self, other):
+        """Element-wise less than or equal"""
+        cross = self._cross(other)
+        return NotImplemented if cross is None else np.asarray(cross[0] <= cross[1], dtype=bool)
+    
+    def __gt__(self, other):
+        """Element-wise greater than"""
+        cross = self._cross(other)
+        return NotImplemented if cross is None else np.asarray(cross[0] > cross[1], dtype=bool)
+    
+    def __ge__(self, other):
+        """Element-wise greater than or equal"""
+        cross = self._cross(other)
+        return NotImplemented if cross is None else np.asarray(cross[0] >= cross[1], dtype=bool)
+    
+    # Unary Operators
+    def __neg__(self):
+        """Negation: -array"""
+        return FractionArray._from_reduced(-self.numerators, self.denominators)
+    
+    def __abs__(self):
+        """Absolute value of every element"""
+        return FractionArray._from_reduced(abs(self.numerators), self.denominators)
+    
+    # Reductions
+    def sum(self):
+        """Exact sum as a Fraction, by pairwise vectorized addition"""
+        if len(self) == 0:
+            return Fraction(0)
+        current = self
+        leftovers = []
+        while len(current) > 1:
+            if len(current) % 2:
+                leftovers.append(current[len(current) - 1])
+                current = current[:-1]
+            half = len(current) // 2
+            current = current[:half]._add(current.numerators[half:], current.denominators[half:])
+        return Fraction.sum([current[0]] + leftovers)
+    
+    def to_floats(self):
+        """Return a float64 column approximating every element"""
+        return np.array([float(f) for f in self.to_fractions()]) if self.is_promoted() \
+            else self.numerators / self.denominators
+    
+    # Container Protocol
+    def __len__(self):
+        """Number of fractions"""
+        return len(self.numerators)
+    
+    def __getitem__(self, index):
+        """Integer index returns a Fraction; slices and masks return a FractionArray"""
+        if isinstance(index, (int, np.integer)):
+            return Fraction._from_reduced(int(self.numerators[index]), int(self.denominators[index]))
+        return FractionArray._from_reduced(self.numerators[index], self.denominators[index])
+    
+    def __iter__(self):
+        """Iterate as Fraction objects"""
+        return iter(self.to_fractions())
+    
+    # String Representations
+    def __str__(self):
+        """Human-readable representation"""
+        return f"FractionArray[{', '.join(str(f) for f in self.to_fractions())}]"
+    
+    def __repr__(self):
+        """Developer representation"""
+        return f"FractionArray({self.numerators.tolist()!r}, {self.denominators.tolist()!r})"
 
 
 # ============================================================================
 # CUSTOM LIST CLASS WITH CONTAINER OPERATORS
 # ============================================================================
 
-class SmartList:
-    """A list-like class with enhanced operator overloading"""
+# Element types a SmartList can store in a typed array.array column
+_TYPECODES = {int: "q", float: "d"}
+
+
+# Rope nodes behind SmartList + and *: immutable, shared between lists
+_ROPE_LEAF_SIZE = 256  # adjacent leaves up to this size are merged by copying
+
+
+class _RopeLeaf:
+    """A run of items (a list or array.array that is never mutated again)"""
+    
+    __slots__ = ("items", "length", "height")
+    
+    def __init__(self, items):
+        self.items = items
+        self.length = len(items)
+        self.height = 0
+
+
+class _RopeConcat:
+    """left followed by right"""
     
-    def __init__(self, items=None):
-        """Initialize with optional items"""
+    __slots__ = ("left", "right", "length", "height")
+    
+    def __init__(self, left, right):
+        self.left = left
+        self.right = right
+        self.length = left.length + right.length
+        self.height = max(left.height, right.height) + 1
+
+
+class _RopeRepeat:
+    """child repeated times times"""
+    
+    __slots__ = ("child", "times", "length", "height")
+    
+    def __init__(self, child, times):
+        self.child = child
+        self.times = times
+        self.length = child.length * times
+        self.height = child.height + 1
+
+
+def _rope_balance(left, right):
+    """Concatenate two subtrees whose heights differ by at most two (AVL rotation)"""
+    if left.height > right.height + 1 and type(left) is _RopeConcat:
+        if left.left.height >= left.right.height:
+            return _RopeConcat(left.left, _RopeConcat(left.right, right))
+        if type(left.right) is _RopeConcat:
+            middle = left.right
+            return _RopeConcat(_RopeConcat(left.left, middle.left), _RopeConcat(middle.right, right))
+    if right.height > left.height + 1 and type(right) is _RopeConcat:
+        if right.right.height >= right.left.height:
+            return _RopeConcat(_RopeConcat(left, right.left), right.right)
+        if type(right.left) is _RopeConcat:
+            middle = right.left
+            return _RopeConcat(_RopeConcat(left, middle.left), _RopeConcat(middle.right, right.right))
+    return _RopeConcat(left, right)
+
+
+def _rope_join(left, right):
+    """Concatenate two ropes, keeping the height O(log n) (AVL join)"""
+    if not left.length:
+        return right
+    if not right.length:
+        return left
+    if (type(left) is _RopeLeaf and type(right) is _RopeLeaf
+            and left.length + right.length <= _ROPE_LEAF_SIZE):
+        a, b = left.items, right.items
+        if type(a) is not type(b) or (type(a) is array and a.typecode != b.typecode):
+            a, b = list(a), list(b)
+        return _RopeLeaf(a + b)
+    if left.height > right.height + 1 and type(left) is _RopeConcat:
+        return _rope_balance(left.left, _rope_join(left.right, right))
+    if right.height > left.height + 1 and type(right) is _RopeConcat:
+        return _rope_balance(_rope_join(left, right.left), right.right)
+    return _RopeConcat(left, right)
+
+
+def _rope_get(node, index):
+    """Item at a valid non-negative index, O(height)"""
+    while True:
+        kind = type(node)
+        if kind is _RopeLeaf:
+            return node.items[index]
+        if kind is _RopeConcat:
+            if index < node.left.length:
+                node = node.left
+            else:
+                index -= node.left.length
+                node = node.right
+        else:
+            index %= node.child.length
+            node = node.child
+
+
+def _rope_pieces(node, start, stop):
+    """Yield leaf slices covering positions [start, stop), in order"""
+    stack = [(node, start, stop)]
+    while stack:
+        node, start, stop = stack.pop()
+        if start >= stop:
+            continue
+        kind = type(node)
+        if kind is _RopeLeaf:
+            yield node.items if start == 0 and stop == node.length else node.items[start:stop]
+        elif kind is _RopeConcat:
+            split = node.left.length
+            stack.append((node.right, max(start - split, 0), stop - split))
+            stack.append((node.left, start, min(stop, split)))
+        else:
+            size = node.child.length
+            first, last = start // size, (stop - 1) // size
+            if first == last:
+                stack.append((node.child, start - first * size, stop - first * size))
+                continue
+            # Pushed in reverse: tail piece, the whole copies between, head piece
+            stack.append((node.child, 0, stop - last * size))
+            copies = last - first - 1
+            if copies:
+                stack.append((_RopeRepeat(node.child, copies), 0, copies * size))
+            stack.append((node.child, start - first * size, size))
+
+
+class SmartList:
+    """A list-like class with enhanced operator overloading
+
+    With typed=True (detect from the items) or typed=int / typed=float
+    (declare), a homogeneous list is stored in an array.array column, so
+    sum, filter_type, + and * run in C. Slices are plain lists in every
+    storage mode, as they always were. Appending an item whose
+    type is not exactly the element type (a bool, a str, an int that does
+    not fit in 64 bits) transparently switches back to list storage.
+
+    With indexed=True, an object-storage list also keeps sorted position
+    buckets per exact item type, so filter_type costs O(k) for k matches
+    instead of an isinstance scan. Buckets are sets with a sorted copy that
+    is rebuilt only when a query needs it. Appends, setting an item and
+    popping from the end stay O(1); deleting from the middle shifts the
+    later positions, O(n).
+
+    + and * n do not copy: the result is a rope, a balanced tree of shared
+    read-only runs, built in O(log n). Indexing a rope is O(log n), and
+    iteration, slicing, equality, sum and filter_type read it in place.
+    It is flattened into a plain list on the first mutation or flatten().
+    A list whose storage was shared into a rope copies it before it next
+    mutates (copy-on-write).
+    """
+    
+    def __init__(self, items=None, typed=False, indexed=False):
+        """Initialize with optional items, typed storage mode and type index"""
         self._items = list(items) if items else []
+        self._element_type = None
+        self._indexed = indexed
+        self._index = self._sorted = None
+        self._rope = None
+        self._shared = False
+        if typed is True:
+            # Detection: quietly keep object storage for anything but int/float
+            typed = type(self._items[0]) if self._items else None
+            if typed not in _TYPECODES:
+                typed = None
+        if typed:
+            if typed not in _TYPECODES:
+                raise ValueError(f"Typed storage supports int and float, not {typed.__name__}")
+            column = self._to_array(typed, self._items)
+            if column is not None:
+                self._items, self._element_type = column, typed
+        self._rebuild_index()
+    
+    @staticmethod
+    def _to_array(element_type, items):
+        """Pack items into an array.array, or return None if any item does not fit"""
+        if isinstance(items, array) and items.typecode == _TYPECODES[element_type]:
+            return array(items.typecode, items)
+        if any(type(item) is not element_type for item in items):
+            return None
+        try:
+            return array(_TYPECODES[element_type], items)
+        except OverflowError:
+            return None
+    
+    @classmethod
+    def _from_array(cls, column, element_type):
+        """Wrap an existing array column without copying or checking it"""
+        result = cls()
+        result._items, result._element_type = column, element_type
+        return result
+    
+    @classmethod
+    def _from_rope(cls, node, element_type):
+        """Wrap a rope node (shared, never mutated)"""
+        result = cls()
+        result._items, result._rope, result._element_type = None, node, element_type
+        return result
+    
+    def _node(self):
+        """This list as a rope node, sharing the storage instead of copying it"""
+        if self._rope is not None:
+            return self._rope
+        self._shared = True
+        return _RopeLeaf(self._items)
+    
+    def _prepare_mutation(self):
+        """Flatten a rope, or copy storage that a rope still shares"""
+        if self._rope is not None:
+            self.flatten()
+        elif self._shared:
+            self._items = self._items[:]
+            self._shared = False
+    
+    def flatten(self):
+        """Materialize rope storage into a plain list (or array when typed)"""
+        if self._rope is None:
+            return
+        items = array(_TYPECODES[self._element_type]) if self._element_type is not None else []
+        for piece in _rope_pieces(self._rope, 0, self._rope.length):
+            items.extend(piece)
+        self._items, self._rope = items, None
+        self._rebuild_index()
+    
+    @property
+    def is_flat(self):
+        """False while the list is a rope view over + and * operands"""
+        return self._rope is None
+    
+    def _to_objects(self):
+        """Fall back to plain list storage"""
+        if self._element_type is not None:
+            self._items = self._items.tolist()
+            self._element_type = None
+            self._rebuild_index()
+    
+    # Type Index (typed storage needs none: every item has one exact type)
+    def _rebuild_index(self):
+        """Build the {exact type: positions} buckets from scratch"""
+        if not self._indexed or self._element_type is not None:
+            self._index = self._sorted = None
+            return
+        self._sorted = {}
+        for position, item in enumerate(self._items):
+            self._sorted.setdefault(type(item), []).append(position)
+        self._index = {cls: set(positions) for cls, positions in self._sorted.items()}
+    
+    def _index_add(self, position, item):
+        """Record item at position (other positions are unchanged)"""
+        cls = type(item)
+        self._index.setdefault(cls, set()).add(position)
+        cached = self._sorted.get(cls)
+        if cached is not None:
+            if not cached or cached[-1] < position:
+                cached.append(position)  # appends keep the sorted cache valid
+            else:
+                del self._sorted[cls]
+    
+    def _index_discard(self, position, item):
+        """Forget item at position (other positions are unchanged)"""
+        cls = type(item)
+        bucket = self._index[cls]
+        bucket.remove(position)
+        cached = self._sorted.get(cls)
+        if not bucket:
+            del self._index[cls]
+            self._sorted.pop(cls, None)
+        elif cached is not None:
+            if cached[-1] == position:
+                cached.pop()
+            else:
+                del self._sorted[cls]
+    
+    def _index_delete(self, position, item):
+        """Forget item at position and shift every later position down by one"""
+        self._index_discard(position, item)
+        if position == len(self._items):
+            return
+        self._index = {cls: {p - 1 if p > position else p for p in bucket}
+                       for cls, bucket in self._index.items()}
+        self._sorted.clear()
+    
+    def _positions(self, cls):
+        """Sorted positions of items whose exact type is cls (cached)"""
+        cached = self._sorted.get(cls)
+        if cached is None:
+            cached = self._sorted[cls] = sorted(self._index[cls])
+        return cached
+    
+    def _position(self, index):
+        """Non-negative position for an int index (the list has already checked it)"""
+        return index + len(self._items) if index < 0 else index
+    
+    @property
+    def is_indexed(self):
+        """True if filter_type uses the per-type position buckets"""
+        return self._indexed
+    
+    def _as_list(self):
+        """The items as a list (a copy when typed or a rope)"""
+        if self._rope is not None:
+            return list(self)
+        return self._items.tolist() if self._element_type is not None else self._items
+    
+    @property
+    def element_type(self):
+        """int or float for typed storage, None for object storage"""
+        return self._element_type
     
     # Container Protocol
     def __len__(self):
         """Length: len(smart_list)"""
+        if self._rope is not None:
+            return self._rope.length
         return len(self._items)
     
     def __getitem__(self, index):
-        """Get item: smart_list[index]"""
+        """Get item: smart_list[index]; slices are plain lists in every storage mode"""
+        if self._rope is not None:
+            return self._rope_getitem(index)
+        if self._element_type is not None and isinstance(index, slice):
+            return self._items[index].tolist()
         return self._items[index]
     
+    def _rope_getitem(self, index):
+        """Indexing and slicing a rope without flattening it"""
+        length = self._rope.length
+        if isinstance(index, slice):
+            positions = range(length)[index]
+            items = []
+            if positions:
+                low, high = min(positions[0], positions[-1]), max(positions[0], positions[-1])
+                for piece in _rope_pieces(self._rope, low, high + 1):
+                    items.extend(piece)
+                items = items[::positions.step]
+            return items
+        if index < 0:
+            index += length
+        if not 0 <= index < length:
+            raise IndexError("SmartList index out of range")
+        return _rope_get(self._rope, index)
+    
     def __setitem__(self, index, value):
         """Set item: smart_list[index] = value"""
-        self._items[index] = value
+        self._prepare_mutation()
+        if self._element_type is not None:
+            if isinstance(index, slice):
+                value = list(value)
+                column = self._to_array(self._element_type, value)
+                if column is not None:
+                    self._items[index] = column
+                    return
+            elif type(value) is self._element_type:
+                try:
+                    self._items[index] = value
+                    return
+                except OverflowError:
+                    pass
+            self._to_objects()
+        if self._index is None:
+            self._items[index] = value
+        elif isinstance(index, slice):
+            self._items[index] = value
+            self._rebuild_index()
+        else:
+            old = self._items[index]
+            self._items[index] = value
+            if type(old) is not type(value):
+                position = self._position(index)
+                self._index_discard(position, old)
+                self._index_add(position, value)
     
     def __delitem__(self, index):
         """Delete item: del smart_list[index]"""
-        del self._items[index]
+        self._prepare_mutation()
+        if self._index is None:
+            del self._items[index]
+        elif isinstance(index, slice):
+            del self._items[index]
+            self._rebuild_index()
+        else:
+            position = self._position(index)
+            item = self._items[index]
+            del self._items[index]
+            self._index_delete(position, item)
     
     def __contains__(self, item):
         """Membership test: item in smart_list"""
+        if self._rope is not None:
+            return item in iter(self)
         return item in self._items
     
     def __iter__(self):
         """Iterator: for item in smart_list"""
+        if self._rope is not None:
+            return itertools.chain.from_iterable(_rope_pieces(self._rope, 0, self._rope.length))
         return iter(self._items)
     
     # Arithmetic Operators
+    # (operand types are resolved by the _SMART_LIST_* dispatch tables below)
     def __add__(self, other):
-        """Concatenation: list1 + list2"""
-        if isinstance(other, SmartList):
-            return SmartList(self._items + other._items)
-        elif isinstance(other, list):
-            return SmartList(self._items + other)
-        else:
-            return NotImplemented
+        """Concatenation: list1 + list2 (a rope, no copy)"""
+        return _SMART_LIST_ADD[type(other)](self, other)
+    
+    def _concat_smart_list(self, other):
+        """SmartList + SmartList"""
+        same_type = other._element_type is self._element_type
+        return SmartList._from_rope(_rope_join(self._node(), other._node()),
+                                    self._element_type if same_type else None)
+    
+    def _concat_list(self, other):
+        """SmartList + list"""
+        # A plain list may still be mutated by its owner, so copy it once
+        return SmartList._from_rope(_rope_join(self._node(), _RopeLeaf(other[:])), None)
     
     def __radd__(self, other):
         """Right addition: list + smart_list"""
-        if isinstance(other, list):
-            return SmartList(other + self._items)
-        else:
-            return NotImplemented
+        return _SMART_LIST_RADD[type(other)](self, other)
+    
+    def _rconcat_list(self, other):
+        """list + SmartList"""
+        return SmartList._from_rope(_rope_join(_RopeLeaf(other[:]), self._node()), None)
     
     def __mul__(self, other):
-        """Repetition: smart_list * n"""
-        if isinstance(other, int):
-            return SmartList(self._items * other)
-        else:
-            return NotImplemented
+        """Repetition: smart_list * n (a rope, no copy)"""
+        return _SMART_LIST_MUL[type(other)](self, other)
+    
+    def _repeat(self, other):
+        """SmartList * int"""
+        if other <= 0 or not len(self):
+            if self._element_type is not None:
+                return SmartList._from_array(array(_TYPECODES[self._element_type]),
+                                             self._element_type)
+            return SmartList()
+        node = self._node()
+        return SmartList._from_rope(node if other == 1 else _RopeRepeat(node, other),
+                                    self._element_type)
     
     def __rmul__(self, other):
         """Right multiplication: n * smart_list"""
-        return self.__mul__(other)
+        return _SMART_LIST_MUL[type(other)](self, other)
     
     # Comparison Operators
     def __eq__(self, other):
         """Equality comparison"""
-        if isinstance(other, SmartList):
+        return _SMART_LIST_EQ[type(other)](self, other)
+    
+    def _eq_smart_list(self, other):
+        """SmartList == SmartList"""
+        if self._rope is not None or other._rope is not None:
+            return self._eq_items(other)
+        if self._element_type is not None and other._element_type is not None:
             return self._items == other._items
-        elif isinstance(other, list):
-            return self._items == other
-        return False
+        return self._as_list() == other._as_list()
+    
+    def _eq_list(self, other):
+        """SmartList == list"""
+        if self._rope is not None:
+            return self._eq_items(other)
+        return self._as_list() == other
+    
+    def _eq_items(self, other):
+        """Same rule as list ==: identical or equal items, pairwise"""
+        return len(self) == len(other) and all(
+            a is b or a == b for a, b in zip(self, other))
     
     def __lt__(self, other):
         """Less than comparison (by length)"""
-        if isinstance(other, (SmartList, list)):
-            other_items = other._items if isinstance(other, SmartList) else other
-            return len(self._items) < len(other_items)
-        return NotImplemented
+        return _SMART_LIST_LT[type(other)](self, other)
+    
+    def _lt_length(self, other):
+        """SmartList < SmartList or list (by length)"""
+        return len(self) < len(other)
     
     # Additional Methods
     def append(self, item):
         """Add item to end"""
+        self._prepare_mutation()
+        if self._element_type is not None:
+            if type(item) is self._element_type:
+                try:
+                    self._items.append(item)
+                    return
+                except OverflowError:
+                    pass
+            self._to_objects()
         self._items.append(item)
+        if self._index is not None:
+            self._index_add(len(self._items) - 1, item)
     
     def extend(self, items):
         """Extend with multiple items"""
+        self._prepare_mutation()
+        if self._element_type is not None:
+            if isinstance(items, SmartList):
+                items = items._items if items._rope is None else list(items)
+            if not isinstance(items, array):
+                items = list(items)
+            column = self._to_array(self._element_type, items)
+            if column is not None:
+                self._items.extend(column)
+                return
+            self._to_objects()
+        start = len(self._items)
         self._items.extend(items)
+        if self._index is not None:
+            for position in range(start, len(self._items)):
+                self._index_add(position, self._items[position])
     
     def pop(self, index=-1):
         """Remove and return item"""
-        return self._items.pop(index)
+        self._prepare_mutation()
+        if self._index is None:
+            return self._items.pop(index)
+        item = self._items[index]
+        position = self._position(index)
+        self._items.pop(index)
+        self._index_delete(position, item)
+        return item
     
     def sum(self):
         """Sum all numeric items"""
-        return sum(item for item in self._items if isinstance(item, (int, float)))
+        if self._element_type is not None:
+            return sum(self)
+        return sum(item for item in self if isinstance(item, (int, float)))
+    
+    def lazy(self):
+        """Return a SmartListQuery that chains steps without intermediate lists"""
+        return SmartListQuery(self)
     
     def filter_type(self, type_class):
         """Return new SmartList with only items of specified type"""
-        return SmartList([item for item in self._items if isinstance(item, type_class)])
+        if self._element_type is not None:
+            # Every item has exactly the element type: all of them match or none do
+            if issubclass(self._element_type, type_class):
+                if self._rope is not None:
+                    return SmartList._from_rope(self._rope, self._element_type)
+                return SmartList._from_array(array(self._items.typecode, self._items),
+                                             self._element_type)
+            return SmartList()
+        if self._index is not None:
+            # Subclass queries: every indexed exact type whose MRO matches
+            buckets = [self._positions(cls) for cls in self._index if issubclass(cls, type_class)]
+            positions = buckets[0] if len(buckets) == 1 else heapq.merge(*buckets)
+            return SmartList([self._items[p] for p in positions])
+        return SmartList([item for item in self if isinstance(item, type_class)])
     
     # String Representations
     def __str__(self):
         """Human-readable representation"""
-        return f"SmartList{self._items}"
+        return f"SmartList{self._as_list()}"
+    
+    def __repr__(self):
+        """Developer representation"""
+        if self._element_type is not None:
+            return f"SmartList({self._as_list()!r}, typed={self._element_type.__name__})"
+        return f"SmartList({self._as_list()!r})"
+
+
+# Operand dispatch for SmartList binary operators
+_SMART_LIST_ADD = _DispatchTable((SmartList, SmartList._concat_smart_list),
+                                 (list, SmartList._concat_list))
+_SMART_LIST_RADD = _DispatchTable((list, SmartList._rconcat_list))
+_SMART_LIST_MUL = _DispatchTable((int, SmartList._repeat))
+_SMART_LIST_EQ = _DispatchTable((SmartList, SmartList._eq_smart_list),
+                                (list, SmartList._eq_list), default=_unequal)
+_SMART_LIST_LT = _DispatchTable(((SmartList, list), SmartList._lt_length))
+
+
+class SmartListQuery:
+    """A lazy query over a SmartList
+
+    filter_type, filter, map and take return a new query and do no work.
+    The steps run as one chain of generators only when a reduction (sum,
+    count, min, max) or collect() is called, so no intermediate list is
+    built and reductions use O(1) extra memory. The source is read when the
+    query runs, not when it is built.
+    """
+    
+    def __init__(self, source, steps=()):
+        """Initialize with a source iterable and a tuple of pending steps"""
+        self._source = source
+        self._steps = steps
+    
+    def _then(self, step):
+        """A new query with one more step"""
+        return SmartListQuery(self._source, self._steps + (step,))
+    
+    # Pipeline Steps
+    def filter_type(self, type_class):
+        """Keep only items of the specified type"""
+        return self._then(lambda items: (item for item in items if isinstance(item, type_class)))
+    
+    def filter(self, predicate):
+        """Keep only items for which predicate(item) is true"""
+        return self._then(lambda items: filter(predicate, items))
+    
+    def map(self, function):
+        """Replace each item with function(item)"""
+        return self._then(lambda items: map(function, items))
+    
+    def take(self, n):
+        """Stop after the first n items"""
+        if n < 0:
+            raise ValueError("take() needs a non-negative count")
+        return self._then(lambda items: itertools.islice(items, n))
+    
+    def __iter__(self):
+        """Run the fused pipeline: for item in query"""
+        items = iter(self._source)
+        for step in self._steps:
+            items = step(items)
+        return items
+    
+    # Reductions
+    def sum(self):
+        """Sum all numeric items (like SmartList.sum)"""
+        # A plain loop instead of one more generator layer over the pipeline
+        total = 0
+        for item in self:
+            if isinstance(item, (int, float)):
+                total += item
+        return total
+    
+    def count(self):
+        """Number of items that reach the end of the pipeline"""
+        count = 0
+        for _ in self:
+            count += 1
+        return count
+    
+    def min(self, key=None):
+        """Smallest item; raises ValueError if the query is empty"""
+        return min(self, key=key)
+    
+    def max(self, key=None):
+        """Largest item; raises ValueError if the query is empty"""
+        return max(self, key=key)
+    
+    def collect(self):
+        """Materialize the results into a new SmartList"""
+        return SmartList(list(self))
     
     def __repr__(self):
         """Developer representation"""
-        return f"SmartList({self._items!r})"
+        return f"SmartListQuery(<{len(self._steps)} steps>)"
 
 
 # ============================================================================
@@ -483,6 +2263,61 @@ def demonstrate_vector_operations():
     print(f"v1 normalized = {v1.normalize()}")
 
 
+def demonstrate_vector_array():
+    """Show vectorized batch operations"""
+    print("\n=== VECTOR ARRAY (BATCH) OPERATIONS ===")
+    
+    if np is None:
+        print("NumPy is not installed - skipping VectorArray demonstration")
+        return
+    
+    vectors = [Vector(3, 4), Vector(1, 2), Vector(0, 0)]
+    batch = VectorArray.from_vectors(vectors)
+    print(f"Batch from {vectors}: {batch!r}")
+    print(f"batch + Vector(1, 1) = {(batch + Vector(1, 1)).to_vectors()}")
+    print(f"batch * 2 = {(batch * 2).to_vectors()}")
+    print(f"batch • Vector(1, 0) = {batch * Vector(1, 0)}")
+    print(f"magnitudes = {batch.magnitude()}")
+    print(f"normalized = {batch.normalize().to_vectors()}")
+    print(f"batch > Vector(1, 2) mask = {batch > Vector(1, 2)}")
+    assert batch.to_vectors() == vectors, "VectorArray round trip must be lossless"
+    assert (batch * 2).to_vectors() == [v * 2 for v in vectors], "batch * 2 must match Vector * 2"
+    print("Round trip is lossless and batch * 2 matches scalar Vectors")
+
+
+def demonstrate_in_place_operators():
+    """Show MutableVector in-place updates and object pools"""
+    print("\n=== IN-PLACE OPERATORS AND OBJECT POOLS ===")
+    
+    pos = MutableVector(0, 0)
+    alias = pos
+    vel = Vector(2, 1)
+    pos += vel
+    pos *= 3
+    print(f"pos += {vel}; pos *= 3 -> {pos!r}")
+    print(f"Updated in place (alias sees it): {alias is pos} {alias}")
+    pos.iadd_scaled(vel, 0.5)
+    print(f"pos.iadd_scaled({vel}, 0.5) -> {pos}, |pos| = {abs(pos):.3f}")
+    print(f"pos + vel is a new immutable {type(pos + vel).__name__}")
+    print(f"pos.freeze() = {pos.freeze()!r}")
+    
+    pool = VectorPool(max_size=4)
+    for _ in range(3):
+        temp = pool.acquire(vel.x, vel.y)
+        temp *= 0.1
+        pos += temp
+        pool.release(temp)
+    print(f"Three pooled steps later: pos = {pos}, {pool!r}")
+    
+    fractions = FractionPool()
+    total = Fraction(0)
+    for denominator in (2, 3, 6):
+        term = fractions.acquire(1, denominator)  # local temporary only
+        total = total + term
+        fractions.release(term)
+    print(f"1/2 + 1/3 + 1/6 with one pooled Fraction: {total}, {fractions!r}")
+
+
 def demonstrate_fraction_operations():
     """Show fraction operator overloading"""
     print("\n=== FRACTION OPERATOR OVERLOADING ===")
@@ -516,6 +2351,54 @@ def demonstrate_fraction_operations():
     print(f"\nType Conversions:")
     print(f"float(f1) = {float(f1)}")
     print(f"int(f1) = {int(f1)}")
+    
+    # Summation kernels
+    print(f"\nSummation Kernels:")
+    terms = [Fraction(1, k) for k in range(1, 11)]
+    print(f"Fraction.sum(1/1 ... 1/10) = {Fraction.sum(terms)}")
+    assert Fraction.sum(terms) == sum(terms), "Fraction.sum must match sum()"
+    print("Matches sum(): True")
+    assert Fraction.dot([f1, f2], [f2, 4]) == f1 * f2 + f2 * 4, "Fraction.dot must match the expanded sum"
+    print(f"Fraction.dot([f1, f2], [f2, 4]) = {Fraction.dot([f1, f2], [f2, 4])}")
+    
+    # Interning cache for small fractions
+    print(f"\nInterning Cache:")
+    Fraction.enable_interning(max_size=256)
+    halves = [Fraction(1, 2), Fraction(2, 4), Fraction(1, 4) + Fraction(1, 4)]
+    assert all(h is halves[0] for h in halves), "equal small fractions must share one instance"
+    print("Same instance for 1/2, 2/4 and 1/4 + 1/4: True")
+    print(f"Stats: {Fraction.intern_stats()}")
+    Fraction.disable_interning()
+
+
+def demonstrate_fraction_array():
+    """Show vectorized fraction arithmetic with overflow promotion"""
+    print("\n=== FRACTION ARRAY (BATCH) OPERATIONS ===")
+    
+    if np is None:
+        print("NumPy is not installed - skipping FractionArray demonstration")
+        return
+    
+    halves = FractionArray([1, 1, 1], [2, 3, 4])
+    print(f"a = {halves}")
+    print(f"a + 1/6 = {halves + Fraction(1, 6)}")
+    print(f"a * a = {halves * halves}")
+    print(f"a < 1/3 mask = {halves < Fraction(1, 3)}")
+    print(f"a.sum() = {halves.sum()}")
+    
+    # Products that would overflow int64 switch to Python big ints
+    big = FractionArray([2 ** 40 + 1, 3], [7, 2 ** 40 + 3])
+    squared = big * big
+    assert squared.is_promoted(), "int64 overflow must promote to object dtype"
+    assert squared.to_fractions() == [f * f for f in big.to_fractions()], \
+        "promoted products must match scalar Fractions"
+    print("big * big promoted to object dtype and matches scalar Fractions")
+    
+    # uint64 values past the int64 range are promoted, not wrapped
+    unsigned = FractionArray(np.array([2 ** 63 + 5, 3], dtype=np.uint64), [1, 1])
+    assert unsigned.to_fractions() == [Fraction(2 ** 63 + 5), Fraction(3)], \
+        "uint64 values >= 2**63 must not wrap"
+    print(f"uint64 column kept exact: {unsigned}")
 
 
 def demonstrate_smart_list():
@@ -548,6 +2431,40 @@ def demonstrate_smart_list():
     print(f"Numbers only: {mixed_list.filter_type((int, float))}")
     print(f"Strings only: {mixed_list.filter_type(str)}")
     print(f"Sum of numbers: {mixed_list.filter_type((int, float)).sum()}")
+    
+    # Lazy query: one fused pass, nothing materialized until the end
+    query = mixed_list.lazy().filter_type((int, float)).map(lambda n: n * 10)
+    print(f"Lazy numbers * 10: sum = {query.sum()}, count = {query.count()}, "
+          f"max = {query.max()}, first two = {query.take(2).collect()}")
+    
+    # Per-type index: filter_type reads position buckets instead of scanning
+    indexed = SmartList([1, 'hello', 2.5, True, 'world', 3], indexed=True)
+    indexed[0] = 'replaced'
+    indexed.pop(1)
+    print(f"Indexed list: {indexed}")
+    print(f"Indexed ints (bool is a subclass): {indexed.filter_type(int)}")
+    print(f"Indexed strings: {indexed.filter_type(str)}")
+    
+    # Rope storage: + and * share their operands instead of copying
+    rope = SmartList([1, 2, 3]) * 1000 + SmartList(['end'])
+    print(f"Rope of {len(rope)} items: flat = {rope.is_flat}, rope[2999] = {rope[2999]}, "
+          f"rope[-1] = {rope[-1]}")
+    rope.append('more')
+    print(f"After append: flat = {rope.is_flat}, last two = {rope[-2:]}")
+    
+    # Typed (array.array) storage
+    print(f"\nTyped Storage:")
+    readings = SmartList([0.5, 1.25, 2.0], typed=True)
+    print(f"{readings!r}: element_type = {readings.element_type.__name__}")
+    print(f"readings.sum() = {readings.sum()}")
+    typed_slice = readings[:2]
+    print(f"readings[:2] = {typed_slice!r}")
+    print(f"readings.filter_type(int) = {readings.filter_type(int)}")
+    readings.append("offline")
+    print(f"After appending a str: {readings!r} (element_type = {readings.element_type})")
+    assert type(readings[:2]) is type(typed_slice) is list, \
+        "slices must be lists in both typed and object storage"
+    print(f"readings[:2] is still a list: {readings[:2]!r}")
 
 
 def operator_precedence_demo():
@@ -611,7 +2528,10 @@ def main():
     print("=" * 60)
     
     demonstrate_vector_operations()
+    demonstrate_vector_array()
+    demonstrate_in_place_operators()
     demonstrate_fraction_operations()
+    demonstrate_fraction_array()
     demonstrate_smart_list()
     operator_precedence_demo()
     comprehensive_operator_test()
@@ -627,6 +2547,8 @@ def main():
     print(f"   5. Right-hand operators (__radd__, __rmul__, etc.)")
     print(f"   6. Type conversion operators (__int__, __float__)")
     print(f"   7. String representation (__str__, __repr__)")
+    print(f"   8. Vectorized batch operators (VectorArray, FractionArray)")
+    print(f"   9. In-place operators (__iadd__, __imul__) and object pools")
 
 
 if __name__ == "__main__":
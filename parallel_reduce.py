@@ -0,0 +1,238 @@
+"""
+Parallel Reductions - Week 2
+CSC 242 - Advanced Class Concepts
+
+This file sums very large collections of Vectors and Fractions on all cores:
+- Packing objects into compact array.array columns for transfer
+- Splitting the columns into chunks for a ProcessPoolExecutor
+- Combining partial results exactly (Fractions) or with compensated
+  summation (Vectors)
+
+Sending a list of objects to a worker process pickles every object.
+Packing the components into array('d') / array('q') columns first sends
+each chunk as one contiguous block of bytes, and the workers never build
+Vector or Fraction objects at all.
+
+Author: CSC 242 Teaching Team
+"""
+
+import itertools
+import math
+import os
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+from operator_overloading import Fraction, FractionArray, Vector, VectorArray
+
+
+# ============================================================================
+# PACKING
+# ============================================================================
+
+def _float_column(values):
+    """Pack floats (or a float64 NumPy column) into an array('d')"""
+    if isinstance(values, array):
+        return values
+    column = array("d")
+    if hasattr(values, "dtype"):
+        column.frombytes(values.astype("float64").tobytes())
+    else:
+        column.extend(values)
+    return column
+
+
+def _integer_column(values):
+    """Pack integers into an array('q'), or a plain list if any exceeds 64 bits"""
+    if hasattr(values, "dtype") and values.dtype != object:
+        column = array("q")
+        column.frombytes(values.astype("int64").tobytes())
+        return column
+    values = list(values)
+    try:
+        return array("q", values)
+    except OverflowError:
+        return values
+
+
+def _materialize(values):
+    """Return values as a list or tuple, so it can be read more than once"""
+    return values if isinstance(values, (list, tuple)) else list(values)
+
+
+def pack_vectors(vectors):
+    """Return (xs, ys) array('d') columns for an iterable of Vectors or a VectorArray"""
+    if isinstance(vectors, VectorArray):
+        return _float_column(vectors.x), _float_column(vectors.y)
+    vectors = _materialize(vectors)
+    return array("d", [v.x for v in vectors]), array("d", [v.y for v in vectors])
+
+
+def pack_fractions(fractions):
+    """Return (numerators, denominators) columns for an iterable of Fractions and ints or a FractionArray"""
+    if isinstance(fractions, FractionArray):
+        return _integer_column(fractions.numerators), _integer_column(fractions.denominators)
+    fractions = _materialize(fractions)
+    return (_integer_column(f.numerator for f in fractions),
+            _integer_column(f.denominator for f in fractions))
+
+
+# ============================================================================
+# CHUNK KERNELS (run in the worker processes)
+# ============================================================================
+
+def _fsum(values):
+    """math.fsum, or plain sum() when the total overflows or meets an infinity
+
+    fsum raises OverflowError and ValueError where sum() returns inf or
+    nan; falling back keeps those inputs giving the answer sum() gives.
+    """
+    values = values if isinstance(values, (list, array)) else list(values)
+    try:
+        return math.fsum(values)
+    except (OverflowError, ValueError):
+        return sum(values)
+
+
+def _compensated_sum(column):
+    """Return (hi, lo): hi is the correctly rounded sum, lo the rounding error of hi
+
+    hi + lo carries about twice the precision of a float, so partial sums
+    of chunks whose large terms cancel across chunk boundaries still
+    combine to the correctly rounded total. A non-finite hi has no
+    rounding error, so lo is 0.0.
+    """
+    hi = _fsum(column)
+    if not math.isfinite(hi):
+        return hi, 0.0
+    return hi, math.fsum(itertools.chain(column, (-hi,)))
+
+
+def _sum_vector_chunk(xs, ys):
+    """Compensated (hi, lo) sums of one chunk of x and y components"""
+    return _compensated_sum(xs), _compensated_sum(ys)
+
+
+def _sum_fraction_chunk(numerators, denominators):
+    """Exact sum of one chunk, returned as (numerator, denominator) integers"""
+    total = Fraction.sum_ratios(numerators, denominators)
+    return total.numerator, total.denominator
+
+
+def _map_chunks(kernel, columns, workers, chunks_per_worker, executor):
+    """Split equal-length columns into chunks and map kernel over them in parallel"""
+    length = len(columns[0])
+    workers = workers or os.cpu_count() or 1
+    chunks = max(1, min(length, workers * chunks_per_worker))
+    bounds = [(length * i // chunks, length * (i + 1) // chunks) for i in range(chunks)]
+    arguments = [[column[start:stop] for start, stop in bounds] for column in columns]
+    if executor is not None:
+        return list(executor.map(kernel, *arguments))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(kernel, *arguments))
+
+
+# ============================================================================
+# PARALLEL REDUCTIONS
+# ============================================================================
+
+def parallel_vector_sum(vectors, workers=None, chunks_per_worker=4, executor=None):
+    """Sum an iterable of Vectors (or a VectorArray) across processes with compensated summation
+
+    Each chunk is summed with math.fsum into a (hi, lo) pair and all pairs
+    are combined with fsum again, so unlike sum() the result does not
+    depend on the order of the data. workers defaults to os.cpu_count();
+    pass an open executor to reuse its worker processes.
+    """
+    partials = _map_chunks(_sum_vector_chunk, pack_vectors(vectors),
+                           workers, chunks_per_worker, executor)
+    return Vector(_fsum(itertools.chain.from_iterable(x for x, _ in partials)),
+                  _fsum(itertools.chain.from_iterable(y for _, y in partials)))
+
+
+def parallel_fraction_sum(fractions, workers=None, chunks_per_worker=4, executor=None):
+    """Exact sum of an iterable of Fractions and ints (or a FractionArray) across processes
+
+    Each worker reduces its chunk with Fraction.sum_ratios and returns one
+    (numerator, denominator) pair; the partial sums are added exactly.
+    """
+    partials = _map_chunks(_sum_fraction_chunk, pack_fractions(fractions),
+                           workers, chunks_per_worker, executor)
+    return Fraction.sum_ratios([n for n, _ in partials], [d for _, d in partials])
+
+
+# ============================================================================
+# DEMONSTRATION FUNCTIONS
+# ============================================================================
+
+def demonstrate_parallel_vector_sum():
+    """Compare sum() with the parallel compensated Vector sum"""
+    print("=== PARALLEL VECTOR SUM ===")
+    rng = random.Random(242)
+    # Large x values that cancel in pairs plus many small ones: naive
+    # left-to-right summation loses most of the small terms
+    vectors = []
+    for _ in range(70_000):
+        big = rng.uniform(1e15, 1e16)
+        vectors.append(Vector(big, 1.0))
+        vectors.append(Vector(-big, 1.0))
+        vectors.append(Vector(rng.random(), 1.0))
+    rng.shuffle(vectors)
+    count = len(vectors)
+
+    exact_x = math.fsum(v.x for v in vectors)
+    naive = sum(vectors, Vector(0, 0))
+    start = time.perf_counter()
+    parallel = parallel_vector_sum(vectors)
+    elapsed = time.perf_counter() - start
+    print(f"{count} vectors on {os.cpu_count()} core(s)")
+    print(f"sum():                 x = {naive.x!r}")
+    print(f"parallel_vector_sum(): x = {parallel.x!r} ({elapsed:.2f}s)")
+    print(f"correctly rounded:     x = {exact_x!r}")
+    assert parallel.x == exact_x, "compensated sum must be correctly rounded"
+
+    huge = [Vector(1e308, 0), Vector(1e308, 1)]
+    overflowed = parallel_vector_sum(huge, workers=1)
+    assert (overflowed.x, overflowed.y) == (math.inf, 1.0), \
+        "overflow must give inf the way sum() does"
+    print(f"Overflowing input gives {overflowed}, as sum() does")
+
+
+def demonstrate_parallel_fraction_sum():
+    """Check that the parallel Fraction sum is exact"""
+    print("\n=== PARALLEL FRACTION SUM ===")
+    rng = random.Random(242)
+    fractions = [Fraction(rng.randint(-50, 50), rng.randint(1, 60)) for _ in range(200_000)]
+    start = time.perf_counter()
+    total = parallel_fraction_sum(fractions)
+    elapsed = time.perf_counter() - start
+    print(f"{len(fractions)} fractions summed in {elapsed:.2f}s: {total}")
+    assert total == Fraction.sum(fractions), "parallel sum must equal Fraction.sum"
+    print("Equals Fraction.sum: True")
+
+    big = [Fraction(2 ** 70 + i, 3 ** 45) for i in range(1_000)] + [5, -7]
+    assert parallel_fraction_sum(big, workers=2) == Fraction.sum(big), \
+        "big-integer columns must give the same total"
+    print("Big integers fall back to list columns: True")
+
+
+def main():
+    """Run all parallel reduction demonstrations"""
+    print("🧵 PARALLEL REDUCTIONS - CSC 242 Week 2")
+    print("=" * 60)
+
+    demonstrate_parallel_vector_sum()
+    demonstrate_parallel_fraction_sum()
+
+    print(f"\n" + "=" * 60)
+    print("✅ All parallel reduction demonstrations complete!")
+
+    print(f"\n💡 Key Concepts Demonstrated:")
+    print(f"   1. Packing objects into compact arrays for transfer")
+    print(f"   2. Chunked map/reduce with ProcessPoolExecutor")
+    print(f"   3. Exact and compensated combination of partial results")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,477 @@
+"""
+Spatial Indexes - Week 2
+CSC 242 - Advanced Class Concepts
+
+This file demonstrates container classes for 2D point data:
+- Uniform-grid spatial hash for tolerance-aware lookup and dedupe
+- Static KD-tree for nearest-neighbour, radius and box queries
+
+Points may be operator_overloading.Vector objects, week2.Point objects,
+or plain (x, y) tuples.
+
+Author: CSC 242 Teaching Team
+"""
+
+import heapq
+import math
+import random
+from array import array
+
+from operator_overloading import Vector
+
+
+def _coords(point):
+    """Adapter: return (x, y) for a Vector, a Point or an (x, y) tuple"""
+    if isinstance(point, tuple):
+        return float(point[0]), float(point[1])
+    return point.x, point.y
+
+
+# ============================================================================
+# UNIFORM-GRID SPATIAL HASH
+# ============================================================================
+
+class SpatialHash:
+    """A uniform grid of square cells mapping cell coordinates to points
+
+    Vector.__eq__ treats components within a tolerance as equal, but
+    Vector.__hash__ rounds, so two equal vectors can fall in different set
+    buckets. Here a point is stored in the grid cell containing it, and a
+    lookup checks the neighbouring cells too. Equal points are always found,
+    even across a cell boundary.
+    """
+
+    def __init__(self, cell_size=1.0, tolerance=1e-10):
+        """Initialize an empty grid"""
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+        if tolerance < 0:
+            raise ValueError("Tolerance cannot be negative")
+        if 2 * tolerance > cell_size:
+            raise ValueError("Cell size must be at least twice the tolerance")
+
+        self._cell_size = float(cell_size)
+        self._tolerance = float(tolerance)
+        self._cells = {}  # (column, row) -> list of (x, y, point)
+        self._size = 0
+
+    def _cell(self, x, y):
+        """Return the (column, row) of the cell containing (x, y)"""
+        size = self._cell_size
+        return math.floor(x / size), math.floor(y / size)
+
+    def insert(self, point):
+        """Add a point to the grid"""
+        x, y = _coords(point)
+        self._cells.setdefault(self._cell(x, y), []).append((x, y, point))
+        self._size += 1
+
+    def extend(self, points):
+        """Add many points to the grid"""
+        for point in points:
+            self.insert(point)
+
+    def _neighbour_offsets(self, scaled, cell):
+        """Cell offsets along one axis that may hold a point within the tolerance"""
+        # Allow for the rounding error of the division that produced scaled
+        margin = self._tolerance / self._cell_size + abs(scaled) * 4e-16 + 1e-12
+        fraction = scaled - cell
+        if fraction < margin:
+            return (-1, 0) if fraction <= 1 - margin else (-1, 0, 1)
+        return (0, 1) if fraction > 1 - margin else (0,)
+
+    def _find_equal(self, x, y):
+        """Return (first stored point equal to (x, y) or None, home cell)"""
+        tolerance = self._tolerance
+        cells = self._cells
+        scaled_x = x / self._cell_size
+        scaled_y = y / self._cell_size
+        column = math.floor(scaled_x)
+        row = math.floor(scaled_y)
+        # tolerance <= cell_size / 2, so an equal point is at most one cell away
+        row_offsets = self._neighbour_offsets(scaled_y, row)
+        for dc in self._neighbour_offsets(scaled_x, column):
+            for dr in row_offsets:
+                for px, py, point in cells.get((column + dc, row + dr), ()):
+                    # The == test lets tolerance=0 match exact duplicates
+                    if ((abs(px - x) < tolerance and abs(py - y) < tolerance)
+                            or (px == x and py == y)):
+                        return point, (column, row)
+        return None, (column, row)
+
+    def find_equal(self, point):
+        """Return a stored point equal to point within the tolerance, or None"""
+        x, y = _coords(point)
+        return self._find_equal(x, y)[0]
+
+    def within(self, point, radius):
+        """Return every stored point at distance <= radius from point"""
+        if radius < 0:
+            raise ValueError("Radius cannot be negative")
+        x, y = _coords(point)
+        size = self._cell_size
+        # Widen by one cell on each side to absorb rounding at cell boundaries
+        low_column = math.floor((x - radius) / size) - 1
+        high_column = math.floor((x + radius) / size) + 1
+        low_row = math.floor((y - radius) / size) - 1
+        high_row = math.floor((y + radius) / size) + 1
+
+        span = (high_column - low_column + 1) * (high_row - low_row + 1)
+        if span > len(self._cells):
+            # Scanning the occupied cells is cheaper than the covered area
+            candidates = (entry for (column, row), bucket in self._cells.items()
+                          if low_column <= column <= high_column
+                          and low_row <= row <= high_row
+                          for entry in bucket)
+        else:
+            candidates = (entry for column in range(low_column, high_column + 1)
+                          for row in range(low_row, high_row + 1)
+                          for entry in self._cells.get((column, row), ()))
+
+        limit = radius * radius
+        result = []
+        for px, py, stored in candidates:
+            dx = px - x
+            dy = py - y
+            if dx * dx + dy * dy <= limit:
+                result.append(stored)
+        return result
+
+    @classmethod
+    def dedupe(cls, points, tolerance=1e-10, cell_size=None):
+        """Return points with tolerance-equal duplicates removed, in expected O(n)
+
+        The first occurrence is kept. Equality within a tolerance is not
+        transitive, so a point is dropped when it equals any point already kept.
+        """
+        if cell_size is None:
+            # Four tolerances per cell: most lookups touch one to four cells
+            cell_size = 4 * tolerance if tolerance > 0 else 1.0
+        index = cls(cell_size, tolerance)
+        cells = index._cells
+        unique = []
+        for point in points:
+            x, y = _coords(point)
+            found, cell = index._find_equal(x, y)
+            if found is None:
+                cells.setdefault(cell, []).append((x, y, point))
+                index._size += 1
+                unique.append(point)
+        return unique
+
+    def cell_size(self):
+        """Return the side length of each grid cell"""
+        return self._cell_size
+
+    def tolerance(self):
+        """Return the equality tolerance"""
+        return self._tolerance
+
+    # Container Protocol
+    def __len__(self):
+        """Number of stored points"""
+        return self._size
+
+    def __contains__(self, point):
+        """Membership test within the tolerance"""
+        return self.find_equal(point) is not None
+
+    def __iter__(self):
+        """Iterate over stored points (grouped by cell)"""
+        for bucket in self._cells.values():
+            for _, _, point in bucket:
+                yield point
+
+    def __str__(self):
+        """Human-readable representation"""
+        return f"SpatialHash({self._size} points in {len(self._cells)} cells)"
+
+    def __repr__(self):
+        """Developer representation"""
+        return f"SpatialHash(cell_size={self._cell_size}, tolerance={self._tolerance})"
+
+
+# ============================================================================
+# STATIC KD-TREE
+# ============================================================================
+
+def _select(ids, k, key, rng):
+    """Reorder ids so ids[k] has rank k by key, smaller keys left, larger right
+
+    Quickselect with three-way partitioning: expected O(len(ids)).
+    """
+    before, after = [], []
+    while len(ids) > 32:
+        pivot = key[ids[rng.randrange(len(ids))]]
+        less = [i for i in ids if key[i] < pivot]
+        equal = [i for i in ids if key[i] == pivot]
+        if k < len(less):
+            after.append([i for i in ids if key[i] > pivot])
+            after.append(equal)
+            ids = less
+        elif k < len(less) + len(equal):
+            before.append(less)
+            after.append([i for i in ids if key[i] > pivot])
+            ids = equal
+            break
+        else:
+            before.append(less)
+            before.append(equal)
+            k -= len(less) + len(equal)
+            ids = [i for i in ids if key[i] > pivot]
+    result = [i for piece in before for i in piece]
+    result.extend(sorted(ids, key=key.__getitem__))  # small remainder: just sort
+    for piece in reversed(after):
+        result.extend(piece)
+    return result
+
+
+class KDTree:
+    """A static 2D KD-tree stored as flat arrays (no node objects)
+
+    The tree is implicit: the node for the index range [lo, hi) is the
+    median at (lo + hi) // 2, splitting on x at even depths and y at odd
+    depths. Its children are the ranges [lo, mid) and [mid + 1, hi).
+    Building uses median selection, so it costs O(n log n).
+    """
+
+    def __init__(self, points, seed=0):
+        """Bulk-build the tree from Vectors, Points or (x, y) tuples"""
+        points = list(points)
+        xs = [0.0] * len(points)
+        ys = [0.0] * len(points)
+        for i, point in enumerate(points):
+            xs[i], ys[i] = _coords(point)
+
+        rng = random.Random(seed)
+        order = list(range(len(points)))
+        stack = [(0, len(order), 0)]
+        while stack:
+            lo, hi, depth = stack.pop()
+            if hi - lo <= 1:
+                continue
+            mid = (lo + hi) // 2
+            key = xs if depth % 2 == 0 else ys
+            order[lo:hi] = _select(order[lo:hi], mid - lo, key, rng)
+            stack.append((lo, mid, depth + 1))
+            stack.append((mid + 1, hi, depth + 1))
+
+        self._xs = array("d", (xs[i] for i in order))
+        self._ys = array("d", (ys[i] for i in order))
+        self._points = [points[i] for i in order]
+
+    def knn(self, query, k=1):
+        """Return the k points nearest to query, closest first"""
+        if k <= 0:
+            return []
+        qx, qy = _coords(query)
+        xs, ys = self._xs, self._ys
+        heap = []  # max-heap of (-distance squared, index)
+        stack = [(0, len(xs), 0, 0.0)]
+        while stack:
+            lo, hi, depth, plane = stack.pop()
+            if lo >= hi or (len(heap) == k and plane > -heap[0][0]):
+                continue
+            mid = (lo + hi) // 2
+            dx = xs[mid] - qx
+            dy = ys[mid] - qy
+            distance = dx * dx + dy * dy
+            if len(heap) < k:
+                heapq.heappush(heap, (-distance, mid))
+            elif distance < -heap[0][0]:
+                heapq.heapreplace(heap, (-distance, mid))
+
+            delta = dx if depth % 2 == 0 else dy
+            near, far = ((lo, mid), (mid + 1, hi)) if delta > 0 else ((mid + 1, hi), (lo, mid))
+            # Push the far side first so the near side is searched first
+            stack.append((far[0], far[1], depth + 1, delta * delta))
+            stack.append((near[0], near[1], depth + 1, 0.0))
+        return [self._points[index] for _, index in sorted(heap, reverse=True)]
+
+    def nearest(self, query):
+        """Return the single nearest point, or None for an empty tree"""
+        result = self.knn(query, 1)
+        return result[0] if result else None
+
+    def radius(self, query, r):
+        """Return every point at distance <= r from query"""
+        if r < 0:
+            raise ValueError("Radius cannot be negative")
+        qx, qy = _coords(query)
+        xs, ys = self._xs, self._ys
+        limit = r * r
+        result = []
+        stack = [(0, len(xs), 0)]
+        while stack:
+            lo, hi, depth = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            dx = xs[mid] - qx
+            dy = ys[mid] - qy
+            if dx * dx + dy * dy <= limit:
+                result.append(self._points[mid])
+            delta = dx if depth % 2 == 0 else dy
+            if delta >= -r:
+                stack.append((lo, mid, depth + 1))
+            if delta <= r:
+                stack.append((mid + 1, hi, depth + 1))
+        return result
+
+    def box(self, lo_corner, hi_corner):
+        """Return every point inside the axis-aligned box (edges included)"""
+        min_x, min_y = _coords(lo_corner)
+        max_x, max_y = _coords(hi_corner)
+        xs, ys = self._xs, self._ys
+        result = []
+        stack = [(0, len(xs), 0)]
+        while stack:
+            lo, hi, depth = stack.pop()
+            if lo >= hi:
+                continue
+            mid = (lo + hi) // 2
+            x, y = xs[mid], ys[mid]
+            if min_x <= x <= max_x and min_y <= y <= max_y:
+                result.append(self._points[mid])
+            if depth % 2 == 0:
+                low_side, high_side = min_x <= x, x <= max_x
+            else:
+                low_side, high_side = min_y <= y, y <= max_y
+            if low_side:
+                stack.append((lo, mid, depth + 1))
+            if high_side:
+                stack.append((mid + 1, hi, depth + 1))
+        return result
+
+    # Container Protocol
+    def __len__(self):
+        """Number of indexed points"""
+        return len(self._points)
+
+    def __iter__(self):
+        """Iterate over indexed points (in tree order)"""
+        return iter(self._points)
+
+    def __str__(self):
+        """Human-readable representation"""
+        return f"KDTree({len(self._points)} points)"
+
+    def __repr__(self):
+        """Developer representation"""
+        return f"KDTree({self._points!r})"
+
+
+# ============================================================================
+# DEMONSTRATION FUNCTIONS
+# ============================================================================
+
+def demonstrate_spatial_hash():
+    """Show tolerance-aware lookup and dedupe, including cell boundaries"""
+    print("=== SPATIAL HASH DEMONSTRATION ===")
+
+    # Two vectors that are == but hash differently
+    a = Vector(0.12345678905, 0)
+    b = Vector(0.12345678905 - 2e-11, 0)
+    print(f"a == b: {a == b}, hash(a) == hash(b): {hash(a) == hash(b)}")
+    print(f"len(set([a, b])) = {len({a, b})}")
+    print(f"len(SpatialHash.dedupe([a, b])) = {len(SpatialHash.dedupe([a, b]))}")
+
+    # Near-boundary cases: equal points on either side of a cell edge
+    grid = SpatialHash(cell_size=1.0)
+    edge = Vector(2.0 - 4e-11, 5.0 + 4e-11)
+    grid.insert(edge)
+    for probe in (Vector(2.0 + 4e-11, 5.0 - 4e-11), Vector(2.0, 5.0), Vector(2.0 + 7e-11, 5.0)):
+        found = grid.find_equal(probe)
+        assert (found is edge) == (edge == probe), f"find_equal({probe!r}) returned {found!r}"
+        print(f"  find_equal({probe!r}) -> {found!r} (expected {edge == probe})")
+
+    # tolerance=0 still matches exact duplicates, including on a cell edge
+    exact = SpatialHash.dedupe([Vector(1, 1), Vector(1, 1), Vector(2, 2)], tolerance=0)
+    assert exact == [Vector(1, 1), Vector(2, 2)], f"tolerance=0 dedupe returned {exact!r}"
+    grid = SpatialHash(cell_size=1.0, tolerance=0)
+    grid.insert(Vector(2.0, 5.0))
+    assert grid.find_equal(Vector(2.0, 5.0)) is not None, "exact match missed at tolerance=0"
+    assert grid.find_equal(Vector(2.0 + 4e-11, 5.0)) is None, "near miss matched at tolerance=0"
+    print(f"  tolerance=0: exact duplicates removed, {len(exact)} points left")
+
+    # within() checked against a brute-force scan
+    rng = random.Random(242)
+    points = [Vector(rng.uniform(-10, 10), rng.uniform(-10, 10)) for _ in range(2000)]
+    grid = SpatialHash(cell_size=0.5)
+    grid.extend(points)
+    center, radius = Vector(1, 1), 2.5
+    fast = set(map(id, grid.within(center, radius)))
+    brute = {id(p) for p in points if (p - center).magnitude() <= radius}
+    assert fast == brute, "within() disagrees with the brute-force scan"
+    print(f"within({center}, {radius}): {len(fast)} points, matches brute force")
+
+    # Dedupe of jittered duplicates against a quadratic reference
+    noisy = points[:300] + [Vector(p.x + 1e-12, p.y - 1e-12) for p in points[:300]]
+    unique = SpatialHash.dedupe(noisy)
+    reference = []
+    for p in noisy:
+        if not any(p == q for q in reference):
+            reference.append(p)
+    assert unique == reference, "dedupe() disagrees with the quadratic reference"
+    print(f"dedupe: {len(noisy)} -> {len(unique)} points, matches brute force")
+
+
+def demonstrate_kd_tree():
+    """Show KD-tree queries checked against brute-force scans"""
+    print("\n=== KD-TREE DEMONSTRATION ===")
+
+    rng = random.Random(242)
+    points = [Vector(rng.uniform(-100, 100), rng.uniform(-100, 100)) for _ in range(5000)]
+    tree = KDTree(points)
+    query = Vector(3, -7)
+    print(f"Built {tree}")
+
+    def distance(p):
+        return (p - query).magnitude()
+
+    nearest = tree.knn(query, 5)
+    brute = sorted(points, key=distance)[:5]
+    assert nearest == brute, "knn() disagrees with the brute-force scan"
+    print(f"knn({query}, 5): {[str(p) for p in nearest]}")
+    print("  matches brute force")
+
+    inside = tree.radius(query, 10)
+    assert sorted(map(id, inside)) == sorted(id(p) for p in points if distance(p) <= 10), \
+        "radius() disagrees with the brute-force scan"
+    print(f"radius({query}, 10): {len(inside)} points, matches brute force")
+
+    in_box = tree.box((0, 0), (20, 10))
+    assert len(in_box) == sum(0 <= p.x <= 20 and 0 <= p.y <= 10 for p in points), \
+        "box() disagrees with the brute-force scan"
+    print(f"box((0, 0), (20, 10)): {len(in_box)} points, matches brute force")
+
+    # Any object with x and y attributes works through the adapter
+    class Point:
+        def __init__(self, x, y):
+            self.x, self.y = x, y
+
+    grid = KDTree(Point(x, y) for x in range(10) for y in range(10))
+    closest = grid.nearest((4.4, 6.6))
+    print(f"Nearest grid Point to (4.4, 6.6): ({closest.x}, {closest.y})")
+
+
+def main():
+    """Run all spatial index demonstrations"""
+    print("🗺️ SPATIAL INDEXES - CSC 242 Week 2")
+    print("=" * 60)
+
+    demonstrate_spatial_hash()
+    demonstrate_kd_tree()
+
+    print(f"\n" + "=" * 60)
+    print("✅ All spatial index demonstrations complete!")
+
+    print(f"\n💡 Key Concepts Demonstrated:")
+    print(f"   1. Uniform-grid hashing of 2D points")
+    print(f"   2. Tolerance-aware equality across cell boundaries")
+    print(f"   3. KD-tree nearest-neighbour and range queries")
+    print(f"   4. Container protocol (__len__, __contains__, __iter__)")
+
+
+if __name__ == "__main__":
+    main()